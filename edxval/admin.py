@@ -15,6 +15,7 @@ from .models import (
     VideoImage,
     VideoTranscript,
 )
+from .utils import get_file_content_hash_and_size
 
 
 @admin.register(Profile)
@@ -97,6 +98,13 @@ class VideoTranscriptAdmin(admin.ModelAdmin):
     raw_id_fields = ('video',)
     list_display = ('get_video', 'language_code', 'provider', 'file_format')
     search_fields = ('id', 'video__edx_video_id', 'language_code')
+    readonly_fields = ('content_hash', 'file_size')
+
+    def save_model(self, request, obj, form, change):
+        """ Recompute the stored content hash when the transcript file is changed """
+        if 'transcript' in form.changed_data:
+            obj.content_hash, obj.file_size = get_file_content_hash_and_size(obj.transcript)
+        super().save_model(request, obj, form, change)
 
     @admin.display(
         description='Video',
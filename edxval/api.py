@@ -4,13 +4,18 @@ The internal API for VAL.
 
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from itertools import groupby
+from operator import attrgetter
 from uuid import uuid4
 
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.files.base import ContentFile
 from django.core.paginator import Paginator
-from django.db.models import Prefetch
+from django.db import transaction
+from django.db.models import Case, TextField, Value, When
+from django.utils import timezone
 from fs import open_fs
 from fs.errors import ResourceNotFound
 from fs.path import combine
@@ -40,13 +45,25 @@ from edxval.models import (
     VideoImage,
     VideoTranscript,
 )
-from edxval.serializers import TranscriptPreferenceSerializer, TranscriptSerializer, VideoSerializer
+from edxval.serializers import (
+    BulkVideoSerializer,
+    TranscriptPreferenceSerializer,
+    TranscriptSerializer,
+    VideoSerializer,
+    prefetch_video_relations,
+    serialize_videos,
+)
 from edxval.transcript_utils import Transcript
 from edxval.utils import (
     THIRD_PARTY_TRANSCRIPTION_PLANS,
     TranscriptFormat,
-    create_file_in_fs,
+    generate_file_content_hash,
+    get_cursor_page,
     get_transcript_format,
+    get_transcript_storage_concurrency,
+    get_video_cache,
+    get_video_cache_key,
+    invalidate_video_cache,
     is_duplicate_file,
 )
 
@@ -114,6 +131,111 @@ def create_video(video_data):
     raise ValCannotCreateError(serializer.errors)
 
 
+def create_videos(videos_data):
+    """
+    Called on to create many Video objects in the database at once
+
+    Each video data is validated like in `create_video`, with the profiles looked up
+    once for all the videos. The valid videos are then created with their encoded
+    videos, course videos and course video images using bulk inserts inside a single
+    transaction, while the invalid ones are reported back without being created.
+
+    Args:
+        videos_data (list): video data dicts, as expected by `create_video`
+
+    Returns:
+        (list): A result dict for each video data, in the same order
+        [
+            {
+                'edx_video_id': ID of the video,
+                'errors': None if the video was created, the validation errors otherwise
+            }
+        ]
+    """
+    profiles = Profile.get_profiles()
+    edx_video_ids = [
+        video_data.get('edx_video_id') for video_data in videos_data if isinstance(video_data, dict)
+    ]
+    taken_edx_video_ids = set(
+        Video.objects.filter(edx_video_id__in=edx_video_ids).values_list('edx_video_id', flat=True)
+    )
+
+    results = []
+    validated_videos = []
+    for video_data in videos_data:
+        serializer = BulkVideoSerializer(data=video_data, context={'profiles': profiles})
+        if not serializer.is_valid():
+            errors = serializer.errors
+        elif serializer.validated_data['edx_video_id'] in taken_edx_video_ids:
+            errors = {'edx_video_id': ['video with this edx video id already exists.']}
+        else:
+            errors = None
+            taken_edx_video_ids.add(serializer.validated_data['edx_video_id'])
+            validated_videos.append(serializer.validated_data)
+
+        results.append({
+            'edx_video_id': video_data.get('edx_video_id') if isinstance(video_data, dict) else None,
+            'errors': errors,
+        })
+
+    if validated_videos:
+        with transaction.atomic():
+            _bulk_create_videos(validated_videos)
+
+    return results
+
+
+def _bulk_create_videos(validated_videos):
+    """
+    Inserts validated videos along with their nested resources using one query per model.
+    """
+    videos = [
+        Video(**{
+            field: value for field, value in video_data.items() if field not in ('encoded_videos', 'courses')
+        })
+        for video_data in validated_videos
+    ]
+    Video.objects.bulk_create(videos)
+
+    # Primary keys are not set by bulk_create on every database backend, so read them back.
+    video_ids = dict(
+        Video.objects.filter(
+            edx_video_id__in=[video.edx_video_id for video in videos]
+        ).values_list('edx_video_id', 'id')
+    )
+
+    EncodedVideo.objects.bulk_create(
+        EncodedVideo(video_id=video_ids[video_data['edx_video_id']], **encoded_video_data)
+        for video_data in validated_videos
+        for encoded_video_data in video_data['encoded_videos']
+    )
+
+    course_video_images = {}
+    course_videos = []
+    for video_data in validated_videos:
+        video_id = video_ids[video_data['edx_video_id']]
+        for course_video, image_name in video_data['courses']:
+            course_video.video_id = video_id
+            course_videos.append(course_video)
+            if image_name:
+                course_video_images[(video_id, course_video.course_id)] = image_name
+
+    CourseVideo.objects.bulk_create(course_videos)
+
+    if course_video_images:
+        course_video_ids = CourseVideo.objects.filter(
+            video_id__in=video_ids.values()
+        ).values_list('id', 'video_id', 'course_id')
+        VideoImage.objects.bulk_create(
+            VideoImage(course_video_id=course_video_id, image=course_video_images[(video_id, course_id)])
+            for course_video_id, video_id, course_id in course_video_ids
+            if (video_id, course_id) in course_video_images
+        )
+
+    for video in videos:
+        logger.info('VAL: Video created with id [%s] and status [%s]', video.edx_video_id, video.status)
+
+
 def create_external_video(display_name):
     """
     Create an external video.
@@ -196,6 +318,69 @@ def update_video_status(edx_video_id, status):
     video.save()
 
 
+def update_videos_status(status_updates):
+    """
+    Update status for many existing videos.
+
+    The updates are applied with one UPDATE query per distinct status, which sets the
+    error description of each video, and the status change of each video is logged.
+
+    Args:
+        status_updates (list): dicts of
+            {
+                'edx_video_id': ID of the video,
+                'status': video status,
+                'error_description': optional error description of the video status
+            }
+
+    Returns:
+        (list): IDs of the videos which were not found, in the given order.
+    """
+    # A later update of the same video wins, as if the updates were applied one by one.
+    updates = {
+        status_update['edx_video_id']: (status_update['status'], status_update.get('error_description'))
+        for status_update in status_updates
+    }
+    previous_statuses = dict(
+        Video.objects.filter(edx_video_id__in=updates).values_list('edx_video_id', 'status')
+    )
+
+    edx_video_ids_by_status = {}
+    for edx_video_id, (status, __) in updates.items():
+        if edx_video_id in previous_statuses:
+            edx_video_ids_by_status.setdefault(status, []).append(edx_video_id)
+
+    with transaction.atomic():
+        for status, edx_video_ids in edx_video_ids_by_status.items():
+            # Error descriptions mostly differ between videos, so they are set per video in the same query.
+            error_description = Case(
+                *[
+                    When(edx_video_id=edx_video_id, then=Value(updates[edx_video_id][1]))
+                    for edx_video_id in edx_video_ids
+                    if updates[edx_video_id][1] is not None
+                ],
+                default=Value(None),
+                output_field=TextField(),
+            )
+            Video.objects.filter(edx_video_id__in=edx_video_ids).update(
+                status=status,
+                error_description=error_description,
+            )
+
+    for status, edx_video_ids in edx_video_ids_by_status.items():
+        for edx_video_id in edx_video_ids:
+            # Queryset updates do not send post_save, so do what its receivers do.
+            invalidate_video_cache(edx_video_id)
+            logger.info(
+                'VAL: Status changed from [%s] to [%s] for video [%s]',
+                previous_statuses[edx_video_id],
+                status,
+                edx_video_id,
+            )
+
+    return [edx_video_id for edx_video_id in updates if edx_video_id not in previous_statuses]
+
+
 def is_video_available(edx_video_id):
     """
     Returns whether a video exists given a video ID.
@@ -405,8 +590,9 @@ def delete_video_transcript(video_id, language_code):
     """
     video_transcript = VideoTranscript.get_or_none(video_id, language_code)
     if video_transcript:
-        # delete the transcript content from storage.
-        video_transcript.transcript.delete()
+        # delete the transcript content from storage, unless another transcript shares it.
+        if not video_transcript.is_transcript_file_shared():
+            video_transcript.transcript.delete()
         # delete the transcript metadata from db.
         video_transcript.delete()
         logger.info('Transcript is removed for video "%s" and language code "%s"', video_id, language_code)
@@ -534,16 +720,12 @@ def create_profile(profile_name):
 
 def _get_video(edx_video_id):
     """
-    Get a Video instance, prefetching encoded video and course information.
+    Get a Video instance, prefetching encoded video, course and course video image information.
 
     Raises ValVideoNotFoundError if the video cannot be retrieved.
     """
     try:
-        encoded_videos = EncodedVideo.objects.select_related("profile")
-        return Video.objects \
-                    .prefetch_related(Prefetch("encoded_videos", queryset=encoded_videos)) \
-                    .prefetch_related("courses") \
-                    .get(edx_video_id=edx_video_id)
+        return prefetch_video_relations(Video.objects.all()).get(edx_video_id=edx_video_id)
     except Video.DoesNotExist as no_video_error:
         error_message = f"Video not found for edx_video_id: {edx_video_id}"
         raise ValVideoNotFoundError(error_message) from no_video_error
@@ -598,8 +780,20 @@ def get_video_info(edx_video_id):
                  }
             ]
         }
+
+    The video info is served from a read-through cache, see `VIDEO_CACHE_SETTINGS`.
     """
-    return VideoSerializer(_get_video(edx_video_id)).data
+    video_cache, timeout = get_video_cache()
+    if not timeout:
+        return VideoSerializer(_get_video(edx_video_id)).data
+
+    cache_key = get_video_cache_key(edx_video_id)
+    video_info = video_cache.get(cache_key)
+    if video_info is None:
+        video_info = VideoSerializer(_get_video(edx_video_id)).data
+        video_cache.set(cache_key, video_info, timeout)
+
+    return video_info
 
 
 def get_urls_for_profiles(edx_video_id, profiles):
@@ -643,15 +837,64 @@ def get_url_for_profile(edx_video_id, profile):
     return get_urls_for_profiles(edx_video_id, [profile])[profile]
 
 
+def get_urls_for_many_videos(edx_video_ids, profiles):
+    """
+    Returns a dict mapping each video to a dict of profiles to URLs, using a single query.
+
+    If the profiles or a video is not found, its urls will be blank.
+
+    Args:
+        edx_video_ids (list): ids of the videos
+        profiles (list): list of profiles we want to search for
+
+    Returns:
+        (dict): A dict containing the profile to url pairs per edx_video_id
+        {
+            edx_video_id: {
+                profile_name: url
+            }
+        }
+    """
+    urls_for_videos = {
+        edx_video_id: {profile: None for profile in profiles}
+        for edx_video_id in edx_video_ids
+    }
+    encoded_videos = EncodedVideo.objects.filter(
+        video__edx_video_id__in=urls_for_videos,
+        profile__profile_name__in=profiles,
+    ).order_by('id').values_list('video__edx_video_id', 'profile__profile_name', 'url')
+
+    for edx_video_id, profile, url in encoded_videos:
+        urls_for_videos[edx_video_id][profile] = url
+
+    return urls_for_videos
+
+
 def _get_videos_for_filter(video_filter, sort_field=None, sort_dir=SortDirection.asc, pagination_conf=None):
     """
     Returns a generator expression that contains the videos found, sorted by
     the given field and direction, with ties broken by edx_video_id to ensure a
     total order.
     """
-    videos = Video.objects.filter(**video_filter)
+    videos = prefetch_video_relations(Video.objects.filter(**video_filter))
     paginator_context = {}
 
+    if pagination_conf and 'cursor' in pagination_conf:
+        videos_per_page = pagination_conf.get('videos_per_page')
+        # Refining by edx_video_id ensures a total order, which keyset pagination needs
+        ordering = ['edx_video_id']
+        if sort_field and sort_field != VideoSortField.edx_video_id:
+            ordering.insert(0, sort_field.value)
+        if sort_dir == SortDirection.desc:
+            ordering = [f'-{field}' for field in ordering]
+
+        videos, next_cursor = get_cursor_page(videos, ordering, pagination_conf['cursor'], videos_per_page)
+        paginator_context = {
+            'next_cursor': next_cursor,
+            'items_on_one_page': videos_per_page
+        }
+        return serialize_videos(videos), paginator_context
+
     if sort_field:
         # Refining by edx_video_id ensures a total order
         videos = videos.order_by(sort_field.value, "edx_video_id")
@@ -668,7 +911,7 @@ def _get_videos_for_filter(video_filter, sort_field=None, sort_dir=SortDirection
             'items_on_one_page': videos_per_page
         }
 
-    return (VideoSerializer(video).data for video in videos), paginator_context
+    return serialize_videos(videos), paginator_context
 
 
 def get_course_video_ids_with_youtube_profile(course_ids=None, offset=None, limit=None):
@@ -682,8 +925,48 @@ def get_course_video_ids_with_youtube_profile(course_ids=None, offset=None, limi
     Returns:
          (list): Tuples of course_id, edx_video_id and youtube video url
     """
-    course_videos = (CourseVideo.objects.select_related('video')
-                     .prefetch_related('video__encoded_videos', 'video__encoded_videos__profile')
+    course_videos = _get_course_videos_with_youtube_profile(course_ids)
+    if limit is not None and offset is not None:
+        course_videos = course_videos[offset: offset + limit]
+
+    return [
+        (course_id, edx_video_id, url)
+        for __, course_id, edx_video_id, url in _add_youtube_urls(course_videos)
+    ]
+
+
+def iter_course_video_ids_with_youtube_profile(course_ids=None, batch_size=1000):
+    """
+    Yields the course ids and video ids with the youtube profile for the whole table.
+
+    Unlike `get_course_video_ids_with_youtube_profile`, batches are fetched with keyset
+    pagination on `CourseVideo.id`, so every batch costs the same no matter how deep
+    into the table the scan is.
+
+    Args:
+         course_ids (list): valid course ids
+         batch_size (int): number of records fetched per batch
+    Yields:
+         (tuple): course_id, edx_video_id and youtube video url
+    """
+    course_videos = _get_course_videos_with_youtube_profile(course_ids)
+    last_id = 0
+    while True:
+        batch = list(course_videos.filter(id__gt=last_id)[:batch_size])
+        for __, course_id, edx_video_id, url in _add_youtube_urls(batch):
+            yield course_id, edx_video_id, url
+
+        if len(batch) < batch_size:
+            return
+        last_id = batch[-1][0]
+
+
+def _get_course_videos_with_youtube_profile(course_ids=None):
+    """
+    Returns an id ordered queryset of (id, course_id, video_id, edx_video_id) rows for
+    the course videos having a youtube profile.
+    """
+    course_videos = (CourseVideo.objects
                      .filter(video__encoded_videos__profile__profile_name='youtube')
                      .order_by('id')
                      .distinct())
@@ -691,23 +974,33 @@ def get_course_video_ids_with_youtube_profile(course_ids=None, offset=None, limi
     if course_ids:
         course_videos = course_videos.filter(course_id__in=course_ids)
 
-    course_videos = course_videos.values_list('course_id', 'video__edx_video_id')
-    if limit is not None and offset is not None:
-        course_videos = course_videos[offset: offset + limit]
+    return course_videos.values_list('id', 'course_id', 'video_id', 'video__edx_video_id')
 
-    course_videos_with_yt_profile = []
-    for course_id, edx_video_id in course_videos:
-        yt_profile = EncodedVideo.objects.filter(
-            video__edx_video_id=edx_video_id,
-            profile__profile_name='youtube'
-        ).first()
 
-        if yt_profile:
-            course_videos_with_yt_profile.append((
-                course_id, edx_video_id, yt_profile.url
-            ))
+def _add_youtube_urls(course_videos):
+    """
+    Resolves the youtube urls for a batch of course video rows with a single query.
+
+    Args:
+        course_videos (iterable): (id, course_id, video_id, edx_video_id) rows
+    Returns:
+        (list): (id, course_id, edx_video_id, youtube url) rows
+    """
+    course_videos = list(course_videos)
+    youtube_urls = {}
+    encoded_videos = EncodedVideo.objects.filter(
+        video_id__in={video_id for __, __, video_id, __ in course_videos},
+        profile__profile_name='youtube'
+    ).order_by('id').values_list('video_id', 'url')
+    for video_id, url in encoded_videos:
+        # Keep the first youtube encode of a video, same as `.first()` would.
+        youtube_urls.setdefault(video_id, url)
 
-    return course_videos_with_yt_profile
+    return [
+        (course_video_id, course_id, edx_video_id, youtube_urls[video_id])
+        for course_video_id, course_id, video_id, edx_video_id in course_videos
+        if video_id in youtube_urls
+    ]
 
 
 def get_videos_for_course(course_id, sort_field=None, sort_dir=SortDirection.asc, pagination_conf=None):
@@ -718,12 +1011,18 @@ def get_videos_for_course(course_id, sort_field=None, sort_dir=SortDirection.asc
         course_id (String)
         sort_field (VideoSortField)
         sort_dir (SortDirection)
-        pagination_conf (Pagination)
+        pagination_conf (Pagination): either `page_number` and `videos_per_page`, or
+            `cursor` and `videos_per_page` for keyset pagination without counting the videos,
+            where `cursor` is None for the first page and then the `next_cursor` of the
+            previous page.
 
     Returns:
         A generator expression that contains the videos found, sorted by the
         given field and direction, with ties broken by edx_video_id to ensure a
-        total order.
+        total order, and the pagination context.
+
+    Raises:
+        ValueError if the pagination cursor is not valid.
     """
     return _get_videos_for_filter(
         {'courses__course_id': str(course_id), 'courses__is_hidden': False},
@@ -754,28 +1053,80 @@ def get_transcript_details_for_course(course_id):
             }
         }
     """
-    course_transcripts_data = {}
+    course_transcripts_data = {
+        edx_video_id: {}
+        for edx_video_id in CourseVideo.objects.filter(course_id=course_id).values_list(
+            'video__edx_video_id', flat=True
+        )
+    }
 
-    course_videos = CourseVideo.objects.filter(course_id=course_id).select_related('video')
-    for course_video in course_videos:
+    video_transcripts = list(
+        VideoTranscript.objects.filter(video__courses__course_id=course_id).select_related('video')
+    )
+    if not video_transcripts:
+        return course_transcripts_data
+
+    # Storage round-trips dominate here, so read the transcript files concurrently.
+    with ThreadPoolExecutor(max_workers=get_transcript_storage_concurrency()) as executor:
+        transcript_details = executor.map(_get_transcript_details, video_transcripts)
+        for video_transcript, transcript_data in zip(video_transcripts, transcript_details):
+            course_transcripts_data[video_transcript.video.edx_video_id][video_transcript.language_code] = (
+                transcript_data
+            )
 
-        edx_video_id = course_video.video.edx_video_id
-        transcript_data = {}
+    return course_transcripts_data
 
-        video_transcripts = VideoTranscript.objects.filter(video=course_video.video)
-        for video_transcript in video_transcripts:
-            transcript_data[video_transcript.language_code] = {
-                'provider': video_transcript.provider,
-                'content': video_transcript.transcript.file.read(),
-                'file_format': video_transcript.file_format,
-                'url': video_transcript.transcript.url,
-                'name': video_transcript.transcript.name,
-                'size': video_transcript.transcript.size,
-            }
 
-        course_transcripts_data[edx_video_id] = transcript_data
+def iter_transcript_details_for_course(course_id):
+    """
+    Yields the transcript details for a course one video at a time.
 
-    return course_transcripts_data
+    This is the streaming counterpart of `get_transcript_details_for_course`, only
+    the transcripts of a single video are held in memory at any point.
+
+    Args:
+        course_id (String)
+
+    Yields:
+        (tuple): edx_video_id and its transcript details keyed by language code, in the
+        same format as the values returned by `get_transcript_details_for_course`.
+    """
+    course_videos = list(
+        CourseVideo.objects.filter(course_id=course_id).order_by('video_id').values_list(
+            'video_id', 'video__edx_video_id'
+        )
+    )
+    video_transcripts = groupby(
+        VideoTranscript.objects.filter(video__courses__course_id=course_id).order_by('video_id').iterator(),
+        key=attrgetter('video_id')
+    )
+    next_video_id, next_transcripts = next(video_transcripts, (None, None))
+
+    with ThreadPoolExecutor(max_workers=get_transcript_storage_concurrency()) as executor:
+        for video_id, edx_video_id in course_videos:
+            transcript_data = {}
+            if video_id == next_video_id:
+                transcripts = list(next_transcripts)
+                transcript_details = executor.map(_get_transcript_details, transcripts)
+                for video_transcript, details in zip(transcripts, transcript_details):
+                    transcript_data[video_transcript.language_code] = details
+                next_video_id, next_transcripts = next(video_transcripts, (None, None))
+
+            yield edx_video_id, transcript_data
+
+
+def _get_transcript_details(video_transcript):
+    """
+    Reads the transcript file and its storage details for a VideoTranscript.
+    """
+    return {
+        'provider': video_transcript.provider,
+        'content': video_transcript.transcript.file.read(),
+        'file_format': video_transcript.file_format,
+        'url': video_transcript.transcript.url,
+        'name': video_transcript.transcript.name,
+        'size': video_transcript.transcript.size,
+    }
 
 
 def get_video_ids_for_course(course_id):
@@ -927,20 +1278,56 @@ def copy_course_videos(source_course_id, destination_course_id):
     if source_course_id == destination_course_id:
         return
 
-    course_videos = CourseVideo.objects.select_related('video', 'video_image').filter(
-        course_id=str(source_course_id)
-    )
+    source_course_id, destination_course_id = str(source_course_id), str(destination_course_id)
+    source_course_videos = list(CourseVideo.objects.filter(course_id=source_course_id).values_list(
+        'video_id', 'video__edx_video_id', 'video_image__image'
+    ))
+    if not source_course_videos:
+        return
 
-    for course_video in course_videos:
-        destination_course_video, __ = CourseVideo.objects.get_or_create(
-            video=course_video.video,
-            course_id=destination_course_id
+    with transaction.atomic():
+        existing_video_ids = set(CourseVideo.objects.filter(
+            course_id=destination_course_id, video__courses__course_id=source_course_id
+        ).values_list('video_id', flat=True))
+        CourseVideo.objects.bulk_create(
+            (
+                CourseVideo(video_id=video_id, course_id=destination_course_id)
+                for video_id, __, __ in source_course_videos
+                if video_id not in existing_video_ids
+            ),
+            ignore_conflicts=True,
         )
-        if hasattr(course_video, 'video_image'):
-            VideoImage.create_or_update(
-                course_video=destination_course_video,
-                file_name=course_video.video_image.image.name
-            )
+
+        image_names = {video_id: image_name for video_id, __, image_name in source_course_videos if image_name}
+        if image_names:
+            _copy_course_video_images(destination_course_id, image_names)
+
+    # Bulk inserts do not send the signals invalidating the cached video info.
+    for __, edx_video_id, __ in source_course_videos:
+        invalidate_video_cache(edx_video_id)
+
+
+def _copy_course_video_images(destination_course_id, image_names):
+    """
+    Sets the image names of the course videos of a course, keyed by video id, like `VideoImage.create_or_update`.
+    """
+    destination_course_videos = CourseVideo.objects.filter(
+        course_id=destination_course_id, video_id__in=image_names
+    ).values_list('id', 'video_id', 'video_image__id', 'video_image__image')
+
+    new_video_images = []
+    changed_video_images = []
+    for course_video_id, video_id, video_image_id, current_image_name in destination_course_videos:
+        image_name = image_names[video_id]
+        if video_image_id is None:
+            new_video_images.append(VideoImage(course_video_id=course_video_id, image=image_name))
+        elif current_image_name != image_name:
+            changed_video_images.append(VideoImage(id=video_image_id, image=image_name, modified=timezone.now()))
+
+    if changed_video_images:
+        VideoImage.objects.bulk_update(changed_video_images, ('image', 'modified'))
+    if new_video_images:
+        VideoImage.objects.bulk_create(new_video_images, ignore_conflicts=True)
 
 
 def export_to_xml(video_id, resource_fs, static_dir, course_id=None):
@@ -962,14 +1349,107 @@ def export_to_xml(video_id, resource_fs, static_dir, course_id=None):
     Raises:
         ValVideoNotFoundError: if the video does not exist
     """
-    video_image_name = ''
-    video = _get_video(video_id)
+    exported_videos = export_course_videos_to_xml(course_id, [video_id], resource_fs, static_dir)
+    if video_id not in exported_videos:
+        raise ValVideoNotFoundError(f"Video not found for edx_video_id: {video_id}")
 
-    try:
-        course_video = CourseVideo.objects.select_related('video_image').get(course_id=course_id, video=video)
-        video_image_name = course_video.video_image.image.name
-    except ObjectDoesNotExist:
-        pass
+    return exported_videos[video_id]
+
+
+def export_course_videos_to_xml(course_id, video_ids, resource_fs, static_dir):
+    """
+    Exports data for many videos of a course into xml objects.
+
+    All the videos data is fetched with a few queries, then the transcripts are read
+    from storage, converted and written to the file system by a bounded thread pool.
+
+    Arguments:
+        course_id (str): The ID of the course with which the videos are associated.
+        video_ids (list): Video ids of the videos to export.
+        resource_fs (SubFS): Export file system.
+        static_dir (str): The Directory to store transcript files.
+
+    Returns:
+        A dict of the exported videos, with unknown video ids left out
+        {
+            video_id: {
+                'xml': An lxml video_asset element containing export data,
+                'transcripts': A dict of language codes to transcript file names,
+            }
+        }
+    """
+    videos = {
+        video.edx_video_id: video
+        for video in prefetch_video_relations(Video.objects.filter(edx_video_id__in=video_ids))
+    }
+    video_transcripts = list(
+        VideoTranscript.objects.filter(
+            video__edx_video_id__in=list(videos)
+        ).select_related('video').order_by('language_code')
+    )
+
+    exported_transcripts = []
+    if video_transcripts:
+        transcripts_fs = resource_fs.delegate_fs()
+        static_file_dir = _get_transcripts_static_dir(resource_fs, static_dir)
+        if not transcripts_fs.exists(static_file_dir):
+            transcripts_fs.makedir(static_file_dir)
+
+        with ThreadPoolExecutor(max_workers=get_transcript_storage_concurrency()) as executor:
+            exported_transcripts = list(executor.map(
+                lambda video_transcript: _export_transcript_file(
+                    video_transcript, transcripts_fs, static_file_dir
+                ),
+                video_transcripts
+            ))
+
+    transcripts_by_video = {}
+    for video_transcript, transcript_filename in zip(video_transcripts, exported_transcripts):
+        transcripts_by_video.setdefault(video_transcript.video.edx_video_id, []).append(
+            (video_transcript, transcript_filename)
+        )
+
+    exported_videos = {}
+    for video_id in video_ids:
+        video = videos.get(video_id)
+        if video is None:
+            continue
+
+        video_el = _create_video_xml(video, course_id)
+        transcripts = transcripts_by_video.get(video_id, [])
+        # create transcripts node only when we have transcripts for a video
+        if transcripts:
+            transcripts_el = SubElement(video_el, 'transcripts')
+
+        transcript_files_map = {}
+        for video_transcript, transcript_filename in transcripts:
+            if transcript_filename is None:
+                continue
+
+            transcript_files_map[video_transcript.language_code] = transcript_filename
+            SubElement(
+                transcripts_el,  # pylint: disable=possibly-used-before-assignment
+                'transcript',
+                {
+                    'language_code': video_transcript.language_code,
+                    'file_format': Transcript.SRT,
+                    'provider': video_transcript.provider,
+                }
+            )
+
+        exported_videos[video_id] = dict(xml=video_el, transcripts=transcript_files_map)
+
+    return exported_videos
+
+
+def _create_video_xml(video, course_id):
+    """
+    Creates the video_asset element of a video with its course image and encoded videos.
+    """
+    video_image_name = ''
+    for course_video in video.courses.all():
+        if course_video.course_id == course_id and hasattr(course_video, 'video_image'):
+            video_image_name = course_video.video_image.image.name
 
     video_el = Element(
         'video_asset',
@@ -989,7 +1469,78 @@ def export_to_xml(video_id, resource_fs, static_dir, course_id=None):
             }
         )
 
-    return create_transcripts_xml(video_id, video_el, resource_fs, static_dir)
+    return video_el
+
+
+def _export_transcript_file(video_transcript, resource_fs, static_dir):
+    """
+    Writes an SRT transcript file to the file system, like `create_transcript_file` does.
+
+    Returns:
+        The transcript file name, or None if the transcript could not be converted.
+    """
+    video_id = video_transcript.video.edx_video_id
+    language_code = video_transcript.language_code
+    transcript_filename = f'{video_id}-{language_code}.srt'
+    try:
+        _write_srt_transcript_file(
+            video_transcript, video_transcript.file_format, resource_fs, combine(static_dir, transcript_filename)
+        )
+    except TranscriptsGenerationException:
+        # we don't want to halt export in this case, just log and move to the next transcript.
+        logger.exception('[VAL] Error while generating "%s" transcript for video["%s"].', language_code, video_id)
+        return None
+
+    return transcript_filename
+
+
+def _write_srt_transcript_file(video_transcript, file_format, resource_fs, file_path):
+    """
+    Converts a transcript to SRT into a file of the file system, streaming it from the transcript storage.
+
+    Raises:
+        TranscriptsGenerationException: if the transcript can not be converted, in which case no file is left.
+    """
+    try:
+        transcript_file = video_transcript.transcript.open('rb')
+    except Exception:
+        logger.exception(
+            '[edx-val] Error while retrieving transcript for video=%s -- language_code=%s',
+            video_transcript.video.edx_video_id,
+            video_transcript.language_code
+        )
+        raise
+
+    with transcript_file:
+        try:
+            with resource_fs.open(file_path, 'w', encoding='utf-8') as srt_file:
+                Transcript.convert_stream(
+                    transcript_file, srt_file, input_format=file_format, output_format=Transcript.SRT
+                )
+        except TranscriptsGenerationException:
+            resource_fs.remove(file_path)
+            raise
+
+
+def _get_transcripts_static_dir(resource_fs, static_dir):
+    """
+    Returns the transcripts directory, relative to the delegate file system of `resource_fs`.
+    """
+    # Note: file system should not start from /draft directory.
+    static_file_dir = combine('course', static_dir)
+    # If we're in a sub directory (ie. a SubFS instead of a WrapFS),
+    # we need to try to base the static file directory on the second path segment,
+    # which will be the course run part for old mongodb key format courses.
+    # See https://openedx.atlassian.net/browse/TNL-7338
+    if hasattr(resource_fs, '_sub_dir'):
+        try:
+            static_file_dir = combine(resource_fs._sub_dir.split('/')[1], static_dir)  # pylint: disable=protected-access
+        except KeyError:
+            logger.exception(
+                "VAL Transcript Export: Error creating static directory path in file system %s", resource_fs
+            )
+
+    return static_file_dir
 
 
 def create_transcript_file(video_id, language_code, file_format, resource_fs, static_dir):
@@ -1007,16 +1558,13 @@ def create_transcript_file(video_id, language_code, file_format, resource_fs, st
         video_id=video_id,
         language_code=language_code
     )
-    transcript_data = get_video_transcript_data(video_id, language_code)
-    if transcript_data:
-        transcript_content = Transcript.convert(
-            transcript_data['content'],
-            input_format=file_format,
-            output_format=Transcript.SRT
-        )
+    video_transcript = VideoTranscript.get_or_none(video_id, language_code)
+    if video_transcript:
         if not resource_fs.exists(static_dir):
             resource_fs.makedir(static_dir)
-        create_file_in_fs(transcript_content, transcript_filename, resource_fs, static_dir)
+        _write_srt_transcript_file(
+            video_transcript, file_format, resource_fs, combine(static_dir, transcript_filename)
+        )
 
     return transcript_filename
 
@@ -1043,21 +1591,7 @@ def create_transcripts_xml(video_id, video_el, resource_fs, static_dir):
     if video_transcripts.exists():
         transcripts_el = SubElement(video_el, 'transcripts')
 
-    # Note: file system should not start from /draft directory.
-    static_file_dir = combine('course', static_dir)
-    # If we're in a sub directory (ie. a SubFS instead of a WrapFS),
-    # we need to try to base the static file directory on the second path segment,
-    # which will be the course run part for old mongodb key format courses.
-    # See https://openedx.atlassian.net/browse/TNL-7338
-    if hasattr(resource_fs, '_sub_dir'):
-        try:
-            static_file_dir = combine(resource_fs._sub_dir.split('/')[1], static_dir)  # pylint: disable=protected-access
-        except KeyError:
-            logger.exception(
-                "VAL Transcript Export: Error creating static directory path for video %s in file system %s",
-                video_id, resource_fs
-            )
-
+    static_file_dir = _get_transcripts_static_dir(resource_fs, static_dir)
     transcript_files_map = {}
     for video_transcript in video_transcripts:
         language_code = video_transcript.language_code
@@ -1162,44 +1696,7 @@ def import_from_xml(xml, edx_video_id, resource_fs, static_dir, external_transcr
 
     if edx_video_id:
         # Video with edx_video_id did not exist, so create one from xml data.
-        data = {
-            'edx_video_id': edx_video_id,
-            'client_video_id': xml.get('client_video_id'),
-            'duration': xml.get('duration'),
-            'status': 'imported',
-            'encoded_videos': [],
-            'courses': [{course_id: xml.get('image')}] if course_id else [],
-        }
-        for encoded_video_el in xml.iterfind('encoded_video'):
-            profile_name = encoded_video_el.get('profile')
-            try:
-                Profile.objects.get(profile_name=profile_name)
-            except Profile.DoesNotExist:
-                logger.info(
-                    "Imported edx_video_id '%s' contains unknown profile '%s'.",
-                    edx_video_id,
-                    profile_name
-                )
-                continue
-            data['encoded_videos'].append({
-                'profile': profile_name,
-                'url': encoded_video_el.get('url'),
-                'file_size': encoded_video_el.get('file_size'),
-                'bitrate': encoded_video_el.get('bitrate'),
-            })
-
-        if not data['encoded_videos']:
-            # Video's status does not get included in video xml at the time of export. So, at this point,
-            # we cannot tell from xml that whether a video had an external status. But if encoded videos
-            # are not set, the chances are, the video was an external one, in which case, we will not link
-            # it to the course(s). Even if the video wasn't an external one and it is having 0 encodes in
-            # xml, it does not have a side effect if not linked to a course, since the video was already
-            # non-playable.
-            data['status'] = EXTERNAL_VIDEO_STATUS
-            data['courses'] = []
-
-        # Create external video if no edx_video_id.
-        edx_video_id = create_video(data)
+        edx_video_id = create_video(_get_imported_video_data(xml, edx_video_id, course_id, Profile.get_profiles()))
     else:
         edx_video_id = create_external_video('External Video')
 
@@ -1207,6 +1704,284 @@ def import_from_xml(xml, edx_video_id, resource_fs, static_dir, external_transcr
     return edx_video_id
 
 
+def import_course_videos_from_xml(course_id, videos, resource_fs, static_dir):
+    """
+    Imports data from many video_asset elements of a course, like `import_from_xml` does for each of them.
+
+    The profiles and the existing videos are looked up once for all the elements, the missing videos
+    are created along with their encoded videos, course videos and images using bulk inserts in a single
+    transaction, then the transcript files are read and checked concurrently before being saved.
+
+    Arguments:
+        course_id (str): The ID of the course to associate the videos with
+        videos (list): A dict for each video to import
+            {
+                'xml': An lxml video_asset element containing import data,
+                'edx_video_id': val video id, an external video is created when empty,
+                'external_transcripts': A dict containing the list of names of the external transcripts,
+            }
+        resource_fs (OSFS): Import file system.
+        static_dir (str): The Directory to retrieve transcript files.
+
+    Raises:
+        ValCannotCreateError: if there is an error importing any of the videos, in which case none is created
+
+    Returns:
+        (list): val video id of each imported video, in the same order.
+    """
+    if any(video['xml'].tag != 'video_asset' for video in videos):
+        raise ValCannotCreateError('Invalid XML')
+
+    profiles = Profile.get_profiles()
+    existing_videos = Video.objects.in_bulk(
+        [video['edx_video_id'] for video in videos if video['edx_video_id']], field_name='edx_video_id'
+    )
+
+    edx_video_ids = []
+    new_videos_data = {}
+    course_video_images = {}
+    linked_edx_video_ids = set()
+    for video in videos:
+        xml, edx_video_id = video['xml'], video['edx_video_id']
+        existing_video = existing_videos.get(edx_video_id)
+        if existing_video:
+            logger.info(
+                "edx_video_id '%s' present in course '%s' not imported because it exists in VAL.",
+                edx_video_id,
+                course_id,
+            )
+            # We don't want to link an existing video to course if its an external video.
+            if course_id and existing_video.status != EXTERNAL_VIDEO_STATUS:
+                course_video_images[existing_video.id] = xml.get('image', '').strip()
+                linked_edx_video_ids.add(edx_video_id)
+        elif edx_video_id:
+            if edx_video_id not in new_videos_data:
+                new_videos_data[edx_video_id] = _get_imported_video_data(xml, edx_video_id, course_id, profiles)
+        else:
+            edx_video_id = generate_video_id()
+            new_videos_data[edx_video_id] = {
+                'edx_video_id': edx_video_id,
+                'status': EXTERNAL_VIDEO_STATUS,
+                'client_video_id': 'External Video',
+                'duration': 0,
+                'encoded_videos': [],
+                'courses': [],
+            }
+
+        edx_video_ids.append(edx_video_id)
+
+    validated_videos = []
+    for video_data in new_videos_data.values():
+        serializer = BulkVideoSerializer(data=video_data, context={'profiles': profiles})
+        if not serializer.is_valid():
+            raise ValCannotCreateError(serializer.errors)
+        validated_videos.append(serializer.validated_data)
+
+    with transaction.atomic():
+        if validated_videos:
+            _bulk_create_videos(validated_videos)
+        if course_video_images:
+            _link_course_videos(course_id, course_video_images)
+
+    for edx_video_id in linked_edx_video_ids:
+        invalidate_video_cache(edx_video_id)
+
+    _import_course_transcripts(
+        [
+            (edx_video_id, video['xml'], video.get('external_transcripts') or {})
+            for edx_video_id, video in zip(edx_video_ids, videos)
+        ],
+        resource_fs,
+        static_dir
+    )
+    return edx_video_ids
+
+
+def _get_imported_video_data(xml, edx_video_id, course_id, profiles):
+    """
+    Returns the data of a video to create from a video_asset element.
+
+    Encoded videos of unknown profiles are ignored.
+    """
+    data = {
+        'edx_video_id': edx_video_id,
+        'client_video_id': xml.get('client_video_id'),
+        'duration': xml.get('duration'),
+        'status': 'imported',
+        'encoded_videos': [],
+        'courses': [{course_id: xml.get('image')}] if course_id else [],
+    }
+    for encoded_video_el in xml.iterfind('encoded_video'):
+        profile_name = encoded_video_el.get('profile')
+        if profile_name not in profiles:
+            logger.info(
+                "Imported edx_video_id '%s' contains unknown profile '%s'.",
+                edx_video_id,
+                profile_name
+            )
+            continue
+        data['encoded_videos'].append({
+            'profile': profile_name,
+            'url': encoded_video_el.get('url'),
+            'file_size': encoded_video_el.get('file_size'),
+            'bitrate': encoded_video_el.get('bitrate'),
+        })
+
+    if not data['encoded_videos']:
+        # Video's status does not get included in video xml at the time of export. So, at this point,
+        # we cannot tell from xml that whether a video had an external status. But if encoded videos
+        # are not set, the chances are, the video was an external one, in which case, we will not link
+        # it to the course(s). Even if the video wasn't an external one and it is having 0 encodes in
+        # xml, it does not have a side effect if not linked to a course, since the video was already
+        # non-playable.
+        data['status'] = EXTERNAL_VIDEO_STATUS
+        data['courses'] = []
+
+    return data
+
+
+def _link_course_videos(course_id, image_names):
+    """
+    Associates existing videos, keyed by video id, with a course and sets the given non empty image names.
+    """
+    linked_video_ids = set(
+        CourseVideo.objects.filter(course_id=course_id, video_id__in=image_names).values_list('video_id', flat=True)
+    )
+    course_videos = [
+        CourseVideo(course_id=course_id, video_id=video_id)
+        for video_id in image_names
+        if video_id not in linked_video_ids
+    ]
+    for course_video in course_videos:
+        try:
+            course_video.full_clean(validate_unique=False)
+        except ValidationError as err:
+            raise ValCannotCreateError(err.message_dict) from err
+
+    CourseVideo.objects.bulk_create(course_videos)
+    _copy_course_video_images(
+        course_id, {video_id: image_name for video_id, image_name in image_names.items() if image_name}
+    )
+
+
+def _import_course_transcripts(videos, resource_fs, static_dir):
+    """
+    Imports the transcripts of many videos, like `create_transcript_objects` does for each of them.
+
+    The transcript files of a video language are read and checked by a thread pool, while
+    the transcripts are saved from the calling thread.
+
+    Arguments:
+        videos (list): A tuple of (edx_video_id, video_asset element, external transcripts) for each video.
+        resource_fs (OSFS): Import file system.
+        static_dir (str): The Directory to retrieve transcript files.
+    """
+    # Files of a video language are imported in order, so that the first or the last one wins
+    # depending on whether existing transcripts are overridden, as with `create_transcript_objects`.
+    transcript_files = {}
+    for edx_video_id, xml, external_transcripts in videos:
+        # First import VAL transcripts.
+        for transcript in xml.findall('.//transcripts/transcript'):
+            try:
+                file_format = transcript.attrib['file_format']
+                language_code = transcript.attrib['language_code']
+                transcript_file_name = f'{edx_video_id}-{language_code}.{file_format}'
+                transcript_files.setdefault((edx_video_id, language_code), []).append(
+                    (transcript_file_name, transcript.attrib['provider'])
+                )
+            except KeyError:
+                logger.warning(
+                    "VAL: Required attributes are missing from xml, xml=[%s]", etree.tostring(transcript).strip()
+                )
+
+        for language_code, transcript_file_names in external_transcripts.items():
+            for transcript_file_name in transcript_file_names:
+                transcript_files.setdefault((edx_video_id, language_code), []).append(
+                    (transcript_file_name, TranscriptProviderType.CUSTOM)
+                )
+
+    if not transcript_files:
+        return
+
+    existing_transcripts = {
+        (video_transcript.video.edx_video_id, video_transcript.language_code): video_transcript
+        for video_transcript in VideoTranscript.objects.filter(
+            video__edx_video_id__in={edx_video_id for edx_video_id, __ in transcript_files}
+        ).select_related('video')
+    }
+    override_existing = OVERRIDE_EXISTING_IMPORTED_TRANSCRIPTS.is_enabled()
+
+    # File system should not start from /draft directory.
+    with open_fs(resource_fs.root_path.split('/drafts')[0]) as file_system:
+        with ThreadPoolExecutor(max_workers=get_transcript_storage_concurrency()) as executor:
+            imported_transcripts = executor.map(
+                lambda video_language: _read_language_transcript_files(
+                    *video_language,
+                    transcript_files[video_language],
+                    existing_transcripts.get(video_language),
+                    override_existing,
+                    file_system,
+                    static_dir
+                ),
+                list(transcript_files)
+            )
+            for (edx_video_id, language_code), imported_transcript in zip(transcript_files, imported_transcripts):
+                if imported_transcript is None:
+                    continue
+
+                provider, file_format, file_content = imported_transcript
+                create_or_update_video_transcript(
+                    video_id=edx_video_id,
+                    language_code=language_code,
+                    metadata={
+                        'provider': provider,
+                        'file_format': file_format,
+                        'language_code': language_code,
+                    },
+                    file_data=ContentFile(file_content),
+                )
+
+
+def _read_language_transcript_files(
+    edx_video_id, language_code, transcript_files, existing_transcript, override_existing, resource_fs, static_dir
+):
+    """
+    Returns the transcript to import among the transcript files of a video language, if any.
+
+    Returns:
+        A tuple of (provider, file format, utf8 encoded file content) or None.
+    """
+    if existing_transcript and not override_existing:
+        return None
+
+    imported_transcript = imported_content = None
+    for file_name, provider in transcript_files:
+        file_content = _read_transcript_file(edx_video_id, language_code, file_name, resource_fs, static_dir)
+        if file_content is None:
+            continue
+
+        utf8_encoded_file_content = file_content.encode('utf-8')
+        if imported_content is not None:
+            is_duplicate = imported_content == utf8_encoded_file_content
+        else:
+            is_duplicate = existing_transcript and _is_duplicate_transcript(
+                existing_transcript, ContentFile(utf8_encoded_file_content)
+            )
+        if is_duplicate:
+            continue
+
+        file_format = _get_imported_transcript_format(edx_video_id, language_code, file_name, file_content)
+        if file_format is None:
+            continue
+
+        imported_transcript = (provider, file_format, utf8_encoded_file_content)
+        imported_content = utf8_encoded_file_content
+        if not override_existing:
+            break
+
+    return imported_transcript
+
+
 def import_transcript_from_fs(edx_video_id, language_code, file_name, provider, resource_fs, static_dir):
     """
     Imports transcript file from file system and creates transcript record in DS.
@@ -1219,7 +1994,6 @@ def import_transcript_from_fs(edx_video_id, language_code, file_name, provider,
         resource_fs (OSFS): Import file system.
         static_dir (str): The Directory to retrieve transcript file.
     """
-    file_format = None
     existing_transcript = VideoTranscript.get_or_none(edx_video_id, language_code)
 
     # check if the transcript exists and if it does, make sure that overriding
@@ -1229,9 +2003,44 @@ def import_transcript_from_fs(edx_video_id, language_code, file_name, provider,
         return
 
     # Read file from import file system and attach it to transcript record in DS.
+    file_content = _read_transcript_file(edx_video_id, language_code, file_name, resource_fs, static_dir)
+    if file_content is None:
+        return
+
+    # change file content to utf8
+    utf8_encoded_file_content = file_content.encode('utf-8')
+    new_transcript_content_file = ContentFile(utf8_encoded_file_content)
+
+    # check if transcript content already exists, and if it does, make sure
+    # the transcript isn't a duplicate transcript to the already existing one
+    if existing_transcript and _is_duplicate_transcript(existing_transcript, new_transcript_content_file):
+        return
+
+    # Get file format from transcript content.
+    file_format = _get_imported_transcript_format(edx_video_id, language_code, file_name, file_content)
+    if file_format is None:
+        return
+
+    # Create transcript record.
+    create_or_update_video_transcript(
+        video_id=edx_video_id,
+        language_code=language_code,
+        metadata={
+            'provider': provider,
+            'file_format': file_format,
+            'language_code': language_code,
+        },
+        file_data=new_transcript_content_file,
+    )
+
+
+def _read_transcript_file(edx_video_id, language_code, file_name, resource_fs, static_dir):
+    """
+    Returns the content of a transcript file of the import file system, or None if it can not be read.
+    """
     try:
         with resource_fs.open(combine(static_dir, file_name), 'r', encoding='utf-8-sig') as f:
-            file_content = f.read()
+            return f.read()
     except ResourceNotFound:
         # Don't raise exception in case transcript file is not found in course OLX.
         logger.warning(
@@ -1240,7 +2049,6 @@ def import_transcript_from_fs(edx_video_id, language_code, file_name, provider,
             file_name,
             edx_video_id
         )
-        return
     except UnicodeDecodeError:
         # Don't raise exception in case transcript contains non-utf8 content.
         logger.warning(
@@ -1249,21 +2057,27 @@ def import_transcript_from_fs(edx_video_id, language_code, file_name, provider,
             file_name,
             edx_video_id
         )
-        return
 
-    # change file content to utf8
-    utf8_encoded_file_content = file_content.encode('utf-8')
-    new_transcript_content_file = ContentFile(utf8_encoded_file_content)
+    return None
 
-    # check if transcript content already exists, and if it does, make sure
-    # the transcript isn't a duplicate transcript to the already existing one
-    if (existing_transcript and
-            is_duplicate_file(new_transcript_content_file, existing_transcript.transcript.file)):
-        return
 
-    # Get file format from transcript content.
+def _is_duplicate_transcript(existing_transcript, transcript_content_file):
+    """
+    Returns whether the content of a transcript file is the one of an existing transcript.
+    """
+    if existing_transcript.content_hash:
+        # Compare against the stored hash rather than downloading the existing transcript.
+        return generate_file_content_hash(transcript_content_file) == existing_transcript.content_hash
+
+    return is_duplicate_file(transcript_content_file, existing_transcript.transcript.file)
+
+
+def _get_imported_transcript_format(edx_video_id, language_code, file_name, file_content):
+    """
+    Returns the format of an imported transcript content, or None if it is not a valid transcript.
+    """
     try:
-        file_format = get_transcript_format(file_content)
+        return get_transcript_format(file_content)
     except Error:
         # Don't raise exception, just don't create transcript record.
         logger.warning(
@@ -1272,19 +2086,7 @@ def import_transcript_from_fs(edx_video_id, language_code, file_name, provider,
             language_code,
             file_name
         )
-        return
-
-    # Create transcript record.
-    create_or_update_video_transcript(
-        video_id=edx_video_id,
-        language_code=language_code,
-        metadata={
-            'provider': provider,
-            'file_format': file_format,
-            'language_code': language_code,
-        },
-        file_data=new_transcript_content_file,
-    )
+        return None
 
 
 def create_transcript_objects(xml, edx_video_id, resource_fs, static_dir, external_transcripts):
@@ -0,0 +1,67 @@
+"""
+Populates the content hash and file size of existing video transcripts.
+
+Example usage:
+    $ ./manage.py backfill_transcript_content_hash --batch-size=500
+"""
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from edxval.models import VideoTranscript
+from edxval.utils import get_file_content_hash_and_size
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to backfill `content_hash` and `file_size` for video transcripts saved without them.
+    """
+    help = 'Populates the content hash and file size of video transcripts that do not have them yet.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of transcripts fetched from the database at a time.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        video_transcripts = VideoTranscript.objects.filter(
+            Q(content_hash__isnull=True) | Q(file_size__isnull=True)
+        ).exclude(
+            Q(transcript='') | Q(transcript__isnull=True)
+        ).order_by('id').only('id', 'transcript')
+
+        updated = failed = 0
+        last_id = 0
+        while True:
+            batch = list(video_transcripts.filter(id__gt=last_id)[:batch_size])
+            for video_transcript in batch:
+                try:
+                    with video_transcript.transcript.open('rb') as transcript_file:
+                        content_hash, file_size = get_file_content_hash_and_size(transcript_file)
+                except Exception:
+                    logger.exception(
+                        '[VAL] Could not read transcript file "%s" of transcript "%s".',
+                        video_transcript.transcript.name,
+                        video_transcript.id
+                    )
+                    failed += 1
+                    continue
+
+                # Update the columns directly so that `modified` keeps its value.
+                VideoTranscript.objects.filter(id=video_transcript.id).update(
+                    content_hash=content_hash, file_size=file_size
+                )
+                updated += 1
+
+            if len(batch) < batch_size:
+                break
+            last_id = batch[-1].id
+
+        logger.info('[VAL] Backfilled content hash of %s transcripts, %s failed.', updated, failed)
@@ -0,0 +1,170 @@
+"""
+Reports the videos which are missing encodes for some profiles.
+
+The video table is scanned in chunks of ids, which can be spread over several worker processes.
+
+Example usage:
+    $ ./manage.py report_missing_profiles --profiles mobile_low desktop_mp4 youtube --workers=4 --format=ndjson
+"""
+import csv
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Max, Min
+
+from edxval.models import CourseVideo, EncodedVideo, Video
+
+CSV_FORMAT = 'csv'
+NDJSON_FORMAT = 'ndjson'
+
+
+def scan_chunk(start_id, end_id, profile_names):
+    """
+    Returns the number of videos with an id in [start_id, end_id) and the ones of them missing any of the profiles.
+
+    Each missing video is reported as a tuple of (edx_video_id, sorted course ids, missing profile names).
+    """
+    videos = Video.objects.filter(id__gte=start_id, id__lt=end_id).order_by('id').values_list('id', 'edx_video_id')
+    encoded_profiles = {}
+    for video_id, profile_name in EncodedVideo.objects.filter(
+        video_id__gte=start_id, video_id__lt=end_id, profile__profile_name__in=profile_names
+    ).values_list('video_id', 'profile__profile_name'):
+        encoded_profiles.setdefault(video_id, set()).add(profile_name)
+
+    course_ids = {}
+    for video_id, course_id in CourseVideo.objects.filter(
+        video_id__gte=start_id, video_id__lt=end_id
+    ).values_list('video_id', 'course_id'):
+        course_ids.setdefault(video_id, []).append(course_id)
+
+    scanned = 0
+    missing_videos = []
+    for video_id, edx_video_id in videos:
+        scanned += 1
+        video_profiles = encoded_profiles.get(video_id, set())
+        missing_profiles = [profile_name for profile_name in profile_names if profile_name not in video_profiles]
+        if missing_profiles:
+            missing_videos.append((edx_video_id, sorted(course_ids.get(video_id, [])), missing_profiles))
+
+    return scanned, missing_videos
+
+
+class Command(BaseCommand):
+    """
+    Command to report the videos missing encodes for a list of profiles, as CSV or NDJSON.
+    """
+    help = 'Reports the videos which are missing encodes for any of the given profiles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profiles',
+            nargs='+',
+            required=True,
+            help='Names of the profiles every video should have an encode for.'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes scanning the chunks of videos.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help='Size of the ranges of video ids scanned at a time.'
+        )
+        parser.add_argument(
+            '--format',
+            choices=(CSV_FORMAT, NDJSON_FORMAT),
+            default=CSV_FORMAT,
+            help='Output format of the report.'
+        )
+        parser.add_argument(
+            '--output',
+            help='Path of the file to write the report to, instead of the standard output.'
+        )
+
+    def handle(self, *args, **options):
+        profile_names = list(dict.fromkeys(options['profiles']))
+        workers, chunk_size = options['workers'], options['chunk_size']
+        if workers < 1 or chunk_size < 1:
+            raise CommandError('--workers and --chunk-size must be positive.')
+
+        id_range = Video.objects.aggregate(min_id=Min('id'), max_id=Max('id'))
+        chunks = []
+        if id_range['min_id'] is not None:
+            chunks = list(range(id_range['min_id'], id_range['max_id'] + 1, chunk_size))
+
+        start_time = time.monotonic()
+        if options['output']:
+            output = open(options['output'], 'w', newline='', encoding='utf-8')
+        else:
+            output = nullcontext(self.stdout)
+
+        with output as report_file:
+            scanned, missing = self.write_report(
+                report_file, options['format'], chunks, chunk_size, profile_names, workers
+            )
+
+        elapsed = time.monotonic() - start_time
+        self.stderr.write(
+            'Scanned {scanned} videos in {chunks} chunks in {elapsed:.2f}s ({rate:.0f} videos/s), '
+            '{missing} videos are missing profiles.'.format(
+                scanned=scanned,
+                chunks=len(chunks),
+                elapsed=elapsed,
+                rate=scanned / elapsed if elapsed else 0,
+                missing=missing,
+            )
+        )
+
+    def write_report(self, output, output_format, chunks, chunk_size, profile_names, workers):
+        """
+        Scans the chunks of videos and writes the ones missing profiles as they come, in the order of their ids.
+
+        Returns a tuple of (number of scanned videos, number of videos missing profiles).
+        """
+        if output_format == CSV_FORMAT:
+            writer = csv.writer(output, lineterminator='\n')
+            writer.writerow(('edx_video_id', 'course_ids', 'missing_profiles'))
+
+            def write_row(edx_video_id, course_ids, missing_profiles):
+                writer.writerow((edx_video_id, ' '.join(course_ids), ' '.join(missing_profiles)))
+        else:
+            def write_row(edx_video_id, course_ids, missing_profiles):
+                output.write(json.dumps({
+                    'edx_video_id': edx_video_id,
+                    'course_ids': course_ids,
+                    'missing_profiles': missing_profiles,
+                }) + '\n')
+
+        end_ids = [start_id + chunk_size for start_id in chunks]
+        profile_names_per_chunk = [profile_names] * len(chunks)
+        if workers == 1:
+            return self.write_rows(map(scan_chunk, chunks, end_ids, profile_names_per_chunk), write_row)
+
+        # Workers are forked so that they inherit the configured Django apps, but
+        # they must not share the database connection of this process.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+            return self.write_rows(executor.map(scan_chunk, chunks, end_ids, profile_names_per_chunk), write_row)
+
+    @staticmethod
+    def write_rows(chunk_results, write_row):
+        """
+        Writes the missing videos of each scanned chunk, returning the number of scanned and missing videos.
+        """
+        scanned = missing = 0
+        for chunk_scanned, missing_videos in chunk_results:
+            scanned += chunk_scanned
+            missing += len(missing_videos)
+            for missing_video in missing_videos:
+                write_row(*missing_video)
+
+        return scanned, missing
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('edxval', '0003_delete_transcriptcredentials'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='videotranscript',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA256 hash of the transcript content.', max_length=64, null=True),
+        ),
+    ]
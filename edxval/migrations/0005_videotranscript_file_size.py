@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('edxval', '0004_videotranscript_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='videotranscript',
+            name='file_size',
+            field=models.PositiveIntegerField(blank=True, help_text='Size of the transcript content in bytes.', null=True),
+        ),
+    ]
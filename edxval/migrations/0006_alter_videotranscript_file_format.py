@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 03:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('edxval', '0005_videotranscript_file_size'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='videotranscript',
+            name='file_format',
+            field=models.CharField(
+                choices=[('srt', 'SubRip'), ('sjson', 'SRT JSON'), ('vtt', 'WebVTT')], db_index=True, max_length=20
+            ),
+        ),
+    ]
@@ -25,8 +25,11 @@ from model_utils.models import TimeStampedModel
 
 from edxval.utils import (
     TranscriptFormat,
+    get_file_content_hash_and_size,
     get_video_image_storage,
     get_video_transcript_storage,
+    invalidate_video_cache,
+    is_content_addressed_transcript_storage,
     validate_generated_images,
     video_image_path,
     video_transcript_path,
@@ -38,6 +41,9 @@ URL_REGEX = '^[a-zA-Z0-9\\-_]*$'
 LIST_MAX_ITEMS = 3
 EXTERNAL_VIDEO_STATUS = 'external'
 
+# Process local registry of the profiles keyed by name, see `Profile.get_profiles`.
+_PROFILE_REGISTRY = {}
+
 
 class ModelFactoryWithValidation:
     """
@@ -89,6 +95,51 @@ class Profile(models.Model):
     def __str__(self):
         return self.profile_name
 
+    @classmethod
+    def get_profiles(cls):
+        """
+        Returns the profiles keyed by name.
+
+        Profiles hardly ever change, so they are loaded once into a process local registry,
+        which is cleared whenever a profile is saved or deleted.
+        """
+        registry = _PROFILE_REGISTRY
+        if not registry:
+            registry = cls._load_registry()
+        return dict(registry)
+
+    @classmethod
+    def get_by_name(cls, profile_name):
+        """
+        Returns the profile with the given name from the registry.
+
+        The registry is reloaded once for an unknown name, as the profile may
+        have been created by another process.
+
+        Raises:
+            Profile.DoesNotExist: if there is no profile with the given name
+        """
+        profile = _PROFILE_REGISTRY.get(profile_name)
+        if profile is None:
+            profile = cls._load_registry().get(profile_name)
+
+        if profile is None:
+            raise cls.DoesNotExist(f'Profile matching profile_name [{profile_name}] does not exist.')
+        return profile
+
+    @classmethod
+    def _load_registry(cls):
+        """
+        Loads all the profiles into a new registry and returns it.
+
+        The registry is replaced in a single assignment, and never changed in place, so that
+        concurrent readers always see either the previous or the new profiles.
+        """
+        global _PROFILE_REGISTRY  # pylint: disable=global-statement
+        registry = {profile.profile_name: profile for profile in cls.objects.all()}
+        _PROFILE_REGISTRY = registry
+        return registry
+
 
 class Video(models.Model):
     """
@@ -150,6 +201,20 @@ class Video(models.Model):
         ).prefetch_related('encoded_videos', 'courses')
         return qset
 
+    @classmethod
+    def missing_profile(cls, profile_name):
+        """
+        Look up videos without an encode for the given profile
+
+        This is a NOT EXISTS subquery per video, which the database can resolve
+        with the encoded video index on video instead of joining all encodes.
+        """
+        return cls.objects.filter(
+            ~models.Exists(
+                EncodedVideo.objects.filter(video=models.OuterRef('pk'), profile__profile_name=profile_name)
+            )
+        )
+
 
 class CourseVideo(models.Model, ModelFactoryWithValidation):
     """
@@ -326,6 +391,8 @@ class VideoImage(TimeStampedModel):
             Returns a tuple of (video_image, created).
         """
         video_image, created = cls.objects.get_or_create(course_video=course_video)
+        # Reuse the already loaded course video, e.g. for invalidating the cached video info on save.
+        video_image.course_video = course_video
         if image_data:
             # Delete the existing image only if this image is not used by anyone else. This is necessary because
             # after a course re-run, a video in original course and the new course points to same image, So when
@@ -429,6 +496,14 @@ class VideoTranscript(TimeStampedModel):
         default=TranscriptProviderType.CUSTOM,
     )
     file_format = models.CharField(max_length=20, db_index=True, choices=TranscriptFormat.CHOICES)
+    content_hash = models.CharField(
+        max_length=64,
+        db_index=True,
+        blank=True,
+        null=True,
+        help_text='SHA256 hash of the transcript content.'
+    )
+    file_size = models.PositiveIntegerField(blank=True, null=True, help_text='Size of the transcript content in bytes.')
 
     class Meta:
         unique_together = ('video', 'language_code')
@@ -454,20 +529,57 @@ class VideoTranscript(TimeStampedModel):
         Arguments:
             file_data(InMemoryUploadedFile): Transcript content.
             file_format(unicode): Transcript file format.
+
+        NOTE: With content addressed storage enabled, a transcript without an explicit `file_name`
+        is stored under its content hash, and an identical transcript already in storage is reused
+        instead of being uploaded again.
         """
+        if file_data:
+            self.content_hash, self.file_size = get_file_content_hash_and_size(file_data)
+
+        existing_file_name = None
+        if not file_name and file_data and is_content_addressed_transcript_storage():
+            file_name = f'{self.content_hash}.{file_format}'
+            existing_file_name = VideoTranscript.objects.filter(
+                content_hash=self.content_hash, file_format=file_format
+            ).exclude(transcript='').values_list('transcript', flat=True).first()
+
         # generate transcript file name if not already given
         if not file_name:
             file_name = '{uuid}.{ext}'.format(uuid=uuid4().hex, ext=file_format)
 
         # save the transcript file
-        if file_data:
-            self.transcript.save(file_name, file_data)
+        if existing_file_name:
+            self.transcript.name = existing_file_name
+        elif file_data:
+            self.transcript.save(file_name, file_data, save=False)
         else:
             self.transcript.name = file_name
+            # The content of a file given only by name is read back from storage.
+            self.content_hash, self.file_size = self.get_stored_content_hash_and_size()
 
         # save the object
         self.save()
 
+    def get_stored_content_hash_and_size(self):
+        """
+        Returns the content hash and size of the stored transcript file, or (None, None) if it can not be read.
+        """
+        try:
+            with self.transcript.storage.open(self.transcript.name, 'rb') as transcript_file:
+                return get_file_content_hash_and_size(transcript_file)
+        except (OSError, ValueError):
+            logger.warning('VAL: Could not read transcript file [%s] to hash its content.', self.transcript.name)
+            return None, None
+
+    def is_transcript_file_shared(self):
+        """
+        Returns whether the transcript file is also used by another transcript.
+        """
+        return VideoTranscript.objects.filter(
+            transcript=self.transcript.name
+        ).exclude(pk=self.pk).exists()
+
     @classmethod
     def get_or_none(cls, video_id, language_code):
         """
@@ -693,6 +805,15 @@ class ThirdPartyTranscriptCredentialsState(TimeStampedModel):
         )
 
 
+@receiver([models.signals.post_save, models.signals.post_delete], sender=Profile)
+def clear_profile_registry(sender=None, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clear the registry of profiles when a profile changes
+    """
+    global _PROFILE_REGISTRY  # pylint: disable=global-statement
+    _PROFILE_REGISTRY = {}
+
+
 @receiver(models.signals.post_save, sender=Video)
 def video_status_update_callback(sender, **kwargs):  # pylint: disable=unused-argument
     """
@@ -704,3 +825,46 @@ def video_status_update_callback(sender, **kwargs):  # pylint: disable=unused-ar
         logger.info('VAL: Video created with id [%s] and status [%s]', video.edx_video_id, video.status)
     else:
         logger.info('VAL: Status changed to [%s] for video [%s]', video.status, video.edx_video_id)
+
+
+@receiver([models.signals.post_save, models.signals.post_delete], sender=Video)
+def video_cache_invalidation_callback(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached video info when a video changes
+    """
+    invalidate_video_cache(kwargs['instance'].edx_video_id)
+
+
+@receiver([models.signals.post_save, models.signals.post_delete], sender=EncodedVideo)
+@receiver([models.signals.post_save, models.signals.post_delete], sender=CourseVideo)
+def video_related_cache_invalidation_callback(sender, **kwargs):
+    """
+    Invalidate the cached video info when an encode or a course of a video changes
+    """
+    instance = kwargs['instance']
+    # Avoid a query when the video is already loaded, which is the common case.
+    if sender.video.is_cached(instance):  # pylint: disable=no-member
+        invalidate_video_cache(instance.video.edx_video_id)
+    else:
+        _invalidate_video_cache_for(id=instance.video_id)
+
+
+@receiver([models.signals.post_save, models.signals.post_delete], sender=VideoImage)
+def video_image_cache_invalidation_callback(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached video info when a course video image changes
+    """
+    instance = kwargs['instance']
+    # pylint: disable=no-member
+    if VideoImage.course_video.is_cached(instance) and CourseVideo.video.is_cached(instance.course_video):
+        invalidate_video_cache(instance.course_video.video.edx_video_id)
+    else:
+        _invalidate_video_cache_for(courses__id=instance.course_video_id)
+
+
+def _invalidate_video_cache_for(**video_filter):
+    """
+    Invalidate the cached video info of the videos matching `video_filter`
+    """
+    for edx_video_id in Video.objects.filter(**video_filter).values_list('edx_video_id', flat=True):
+        invalidate_video_cache(edx_video_id)
@@ -6,10 +6,37 @@ EncodedVideoSerializer which uses the profile_name as it's profile field.
 """
 
 
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.utils.encoding import smart_str
 from rest_framework import serializers
 from rest_framework.fields import DateTimeField, IntegerField
+from rest_framework.validators import UniqueValidator
 
 from edxval.models import CourseVideo, EncodedVideo, Profile, TranscriptPreference, Video, VideoImage, VideoTranscript
+from edxval.utils import get_video_image_storage, invalidate_video_cache
+
+
+class ProfileField(serializers.SlugRelatedField):
+    """
+    Field for Profile
+
+    Looks up profile names in the `profiles` dict of the serializer context when it is given,
+    or else in the registry of profiles, so that encoded videos are validated without a query per encoding.
+    """
+    def to_internal_value(self, data):
+        """
+        Returns the Profile instance for a profile name.
+        """
+        profiles = self.context.get('profiles')
+        profile = None
+        try:
+            profile = Profile.get_by_name(data) if profiles is None else profiles[data]
+        except (KeyError, Profile.DoesNotExist):
+            self.fail('does_not_exist', slug_name=self.slug_field, value=smart_str(data))
+        except TypeError:
+            self.fail('invalid')
+        return profile
 
 
 class EncodedVideoSerializer(serializers.ModelSerializer):
@@ -18,7 +45,7 @@ class EncodedVideoSerializer(serializers.ModelSerializer):
 
     Uses the profile_name as it's profile value instead of a Profile object.
     """
-    profile = serializers.SlugRelatedField(
+    profile = ProfileField(
         slug_field="profile_name",
         queryset=Profile.objects.all()
     )
@@ -213,11 +240,7 @@ class VideoSerializer(serializers.ModelSerializer):
         instance.save()
 
         # Set encoded videos
-        instance.encoded_videos.all().delete()
-        EncodedVideo.objects.bulk_create(
-            EncodedVideo(video=instance, **video_data)
-            for video_data in validated_data.get("encoded_videos", [])
-        )
+        self.update_encoded_videos(instance, validated_data.get("encoded_videos", []))
 
         # Set courses
         # NOTE: for backwards compatibility with the DRF v2 behavior,
@@ -229,8 +252,150 @@ class VideoSerializer(serializers.ModelSerializer):
             if image_name:
                 VideoImage.create_or_update(course_video, image_name)
 
+        # Bulk writes of encoded videos do not send the signals invalidating the cached video info.
+        invalidate_video_cache(instance.edx_video_id)
+
         return instance
 
+    @staticmethod
+    def update_encoded_videos(instance, encoded_videos_data):
+        """
+        Make the encoded videos of a video match the given ones, keyed by profile.
+
+        Only the changed encoded videos are written: new profiles are created, changed
+        ones are updated in place, keeping their ids and creation times, and the ones
+        of missing profiles are deleted.
+        """
+        existing_encoded_videos = {}
+        removed_encoded_video_ids = []
+        for encoded_video in instance.encoded_videos.all():
+            if encoded_video.profile_id in existing_encoded_videos:
+                removed_encoded_video_ids.append(encoded_video.id)
+            else:
+                existing_encoded_videos[encoded_video.profile_id] = encoded_video
+
+        created_encoded_videos = []
+        changed_encoded_videos = []
+        update_fields = ('url', 'file_size', 'bitrate')
+        for video_data in encoded_videos_data:
+            encoded_video = existing_encoded_videos.pop(video_data['profile'].id, None)
+            if encoded_video is None:
+                created_encoded_videos.append(EncodedVideo(video=instance, **video_data))
+            elif any(getattr(encoded_video, field) != video_data[field] for field in update_fields):
+                for field in update_fields:
+                    setattr(encoded_video, field, video_data[field])
+                encoded_video.modified = timezone.now()
+                changed_encoded_videos.append(encoded_video)
+
+        removed_encoded_video_ids.extend(encoded_video.id for encoded_video in existing_encoded_videos.values())
+        if removed_encoded_video_ids:
+            EncodedVideo.objects.filter(id__in=removed_encoded_video_ids).delete()
+        if changed_encoded_videos:
+            EncodedVideo.objects.bulk_update(changed_encoded_videos, (*update_fields, 'modified'))
+        if created_encoded_videos:
+            EncodedVideo.objects.bulk_create(created_encoded_videos)
+
+
+class BulkVideoSerializer(VideoSerializer):
+    """
+    Serializer for validating many Video objects at once, which are then created in bulk.
+
+    A snapshot of the profiles should be given in the `profiles` context, so that unknown profiles
+    do not reload the registry of profiles, and the uniqueness of edx_video_id is left to the caller
+    so that it can be checked with a single query.
+    """
+    def get_fields(self):
+        """
+        Drops the per video uniqueness query of edx_video_id.
+        """
+        fields = super().get_fields()
+        edx_video_id = fields['edx_video_id']
+        edx_video_id.validators = [
+            validator for validator in edx_video_id.validators if not isinstance(validator, UniqueValidator)
+        ]
+        return fields
+
+    def validate(self, data):
+        """
+        Check that the video data is valid and can be inserted in bulk.
+        """
+        data = super().validate(data)
+        course_ids = [course_video.course_id for course_video, __ in data['courses']]
+        if len(course_ids) != len(set(course_ids)):
+            raise serializers.ValidationError("Invalid data: duplicate courses")
+
+        return data
+
+
+def prefetch_video_relations(videos):
+    """
+    Prefetches everything serialized for each video, so that serializing a list of
+    videos takes a constant number of queries.
+
+    Arguments:
+        videos (QuerySet): Video queryset
+
+    Returns:
+        The queryset with the encoded videos, their profiles, courses and course video images prefetched.
+    """
+    return videos.prefetch_related(
+        Prefetch('encoded_videos', queryset=EncodedVideo.objects.select_related('profile')),
+        'courses__video_image',
+    )
+
+
+def serialize_videos(videos):
+    """
+    Read-only fast path for `VideoSerializer(video).data` over many videos.
+
+    Builds the same plain dicts as VideoSerializer, in the same key order, without
+    going through the DRF field machinery per field. The video image storage is
+    only built once for all the videos. Keep this in sync with VideoSerializer.
+
+    Arguments:
+        videos (iterable): Video instances
+
+    Returns:
+        A generator of serialized video dicts.
+    """
+    image_storage = get_video_image_storage()
+    for video in videos:
+        yield {
+            'encoded_videos': [
+                {
+                    'created': encoded_video.created,
+                    'modified': encoded_video.modified,
+                    'url': encoded_video.url,
+                    'file_size': encoded_video.file_size,
+                    'bitrate': encoded_video.bitrate,
+                    'profile': encoded_video.profile.profile_name,
+                }
+                for encoded_video in video.encoded_videos.all()
+            ],
+            'courses': [
+                {course_video.course_id: _get_course_video_image_url(course_video, image_storage)}
+                for course_video in video.courses.all()
+            ],
+            'url': video.get_absolute_url(),
+            'created': video.created,
+            'edx_video_id': video.edx_video_id,
+            'client_video_id': video.client_video_id,
+            'duration': video.duration,
+            'status': video.status,
+            'error_description': video.error_description,
+        }
+
+
+def _get_course_video_image_url(course_video, image_storage):
+    """
+    Returns the same url as `CourseVideo.image_url` using an already built storage.
+    """
+    video_image = getattr(course_video, 'video_image', None)
+    if video_image is None:
+        return None
+
+    return image_storage.url(video_image.image.name)
+
 
 class TranscriptPreferenceSerializer(serializers.ModelSerializer):
     """
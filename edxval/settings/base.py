@@ -176,9 +176,19 @@ VIDEO_TRANSCRIPTS_SETTINGS = dict(
     # If you are changing prefix value then update the .gitignore accordingly
     # so that transcripts created during tests due to upload should be ignored
     VIDEO_TRANSCRIPTS_MAX_BYTES=3145728,  # 3 MB
+    # Store transcripts under their SHA256 content hash, sharing a single file between identical transcripts
+    CONTENT_ADDRESSED_STORAGE=False,
+    # Maximum number of transcript files read from/written to storage in parallel
+    STORAGE_CONCURRENCY=8,
     DIRECTORY_PREFIX='video-transcripts/',
 )
 
+VIDEO_CACHE_SETTINGS = dict(
+    # Cache backend alias used for the read-through cache of video info
+    CACHE_NAME='default',
+    # Time in seconds a video info is cached, 0 disables the cache
+    TIMEOUT=300,
+)
 
 # Required by Django 2.2 to run management commands.
 TEMPLATES = [
@@ -13,3 +13,6 @@ DATABASES = {
         'PORT': '',                      # Set to empty string for default. Not used with sqlite3.
     }
 }
+
+# Video info caching is enabled explicitly by the tests exercising it.
+VIDEO_CACHE_SETTINGS = dict(VIDEO_CACHE_SETTINGS, TIMEOUT=0)
@@ -3,12 +3,18 @@ init
 """
 
 
+import os
+from unittest import skipUnless
+
 from django.contrib import auth
 from django.contrib.auth.models import Permission
 from rest_framework.test import APITestCase
 
 User = auth.get_user_model()
 
+# Benchmarks compare wall-clock times, which is unreliable on shared CI, so they only run on demand.
+benchmark = skipUnless(os.environ.get('EDXVAL_BENCHMARKS'), 'set EDXVAL_BENCHMARKS=1 to run the benchmarks')
+
 
 class APIAuthTestCase(APITestCase):
     """
@@ -0,0 +1,14 @@
+"""
+Pytest fixtures for the edxval tests.
+"""
+import pytest
+from edxval.models import clear_profile_registry
+
+
+@pytest.fixture(autouse=True)
+def profile_registry():
+    """
+    Clear the registry of profiles after each test, as rolling back the test transaction does not.
+    """
+    yield
+    clear_profile_registry()
@@ -3,13 +3,18 @@ Admin Module Test Cases
 """
 
 
+from unittest.mock import Mock
+
 from django.contrib.admin.sites import AdminSite
 from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.files.base import ContentFile
 from django.http import HttpRequest
 from django.test import TestCase
 
-from edxval.admin import ProfileAdmin
-from edxval.models import Profile
+from edxval.admin import ProfileAdmin, VideoTranscriptAdmin
+from edxval.models import Profile, Video, VideoTranscript
+from edxval.tests import constants
+from edxval.utils import generate_file_content_hash
 
 
 class AdminTestCase(TestCase):
@@ -31,3 +36,26 @@ class AdminTestCase(TestCase):
             list(self.conf_admin.get_form(self.request).base_fields),
             ['profile_name']
         )
+
+    def test_video_transcript_content_hash(self):
+        """
+        Test: the content hash is recomputed when the transcript file is changed
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_FISH)
+        video_transcript = VideoTranscript(
+            video=video,
+            language_code='en',
+            file_format='srt',
+            transcript=ContentFile(constants.TRANSCRIPT_DATA['flash'], name='transcript.srt'),
+        )
+
+        transcript_admin = VideoTranscriptAdmin(VideoTranscript, AdminSite())
+        transcript_admin.save_model(self.request, video_transcript, Mock(changed_data=['transcript']), change=False)
+        self.addCleanup(video_transcript.transcript.storage.delete, video_transcript.transcript.name)
+
+        video_transcript.refresh_from_db()
+        self.assertEqual(
+            video_transcript.content_hash,
+            generate_file_content_hash(ContentFile(constants.TRANSCRIPT_DATA['flash']))
+        )
+        self.assertEqual(video_transcript.file_size, len(constants.TRANSCRIPT_DATA['flash'].encode('utf-8')))
@@ -13,12 +13,14 @@ from unittest.mock import Mock, patch
 
 from ddt import data, ddt, unpack
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
 from django.core.files import File
 from django.core.files.base import ContentFile
 from django.core.files.images import ImageFile
-from django.db import DatabaseError
+from django.db import DatabaseError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from fs.memoryfs import MemoryFS
 from fs.osfs import OSFS
@@ -40,6 +42,7 @@ from edxval.api import (
     VideoSortField,
 )
 from edxval.config.waffle import OVERRIDE_EXISTING_IMPORTED_TRANSCRIPTS
+from edxval.exceptions import TranscriptsGenerationException
 from edxval.models import (
     LIST_MAX_ITEMS,
     CourseVideo,
@@ -187,6 +190,114 @@ class CreateVideoTest(TestCase):
         assert expected_video == {k: v for k, v in video.items() if k in expected_video}
 
 
+class CreateVideosTest(TestCase):
+    """
+    Tests the create_videos function in api.py.
+    """
+
+    def setUp(self):
+        """
+        Creation of Profile objects that will be used to test video creation
+        """
+        super().setUp()
+        api.create_profile(constants.PROFILE_DESKTOP)
+        api.create_profile(constants.PROFILE_MOBILE)
+
+    def get_video_data(self, index):
+        """
+        Returns the data of a video with encodes and courses
+        """
+        return dict(
+            constants.COMPLETE_SET_FISH,
+            edx_video_id=f'video-{index}',
+            courses=[{'course-1': f'image-{index}.jpg'}, 'course-2'],
+        )
+
+    def get_video_info(self, edx_video_id):
+        """
+        Returns the video info without its timestamps and ids
+        """
+        video = api.get_video_info(edx_video_id)
+        for key in ('edx_video_id', 'url', 'created'):
+            video.pop(key)
+        for encoded_video in video['encoded_videos']:
+            encoded_video.pop('created')
+            encoded_video.pop('modified')
+        return video
+
+    def test_create_videos(self):
+        """
+        Tests that created videos match the ones created by create_video
+        """
+        api.create_video(self.get_video_data(0))
+
+        results = api.create_videos([self.get_video_data(1), self.get_video_data(2)])
+
+        self.assertEqual(results, [
+            {'edx_video_id': 'video-1', 'errors': None},
+            {'edx_video_id': 'video-2', 'errors': None},
+        ])
+        expected_video = self.get_video_info('video-0')
+        for index in (1, 2):
+            expected_video['courses'] = [{'course-1': f'/image-{index}.jpg'}, {'course-2': None}]
+            self.assertEqual(self.get_video_info(f'video-{index}'), expected_video)
+
+    def test_create_videos_errors(self):
+        """
+        Tests that invalid videos are reported without preventing the valid ones from being created
+        """
+        api.create_video(self.get_video_data(0))
+        videos_data = [
+            self.get_video_data(0),
+            self.get_video_data(1),
+            self.get_video_data(1),
+            dict(
+                self.get_video_data(2),
+                encoded_videos=[dict(constants.ENCODED_VIDEO_DICT_MOBILE, profile='unknown')]
+            ),
+            dict(self.get_video_data(3), courses=['course-1', 'course-1']),
+            constants.VIDEO_DICT_INVALID_ID,
+            'not a video',
+        ]
+
+        results = api.create_videos(videos_data)
+
+        self.assertEqual([result['edx_video_id'] for result in results], [
+            'video-0', 'video-1', 'video-1', 'video-2', 'video-3', 'sloppy/sloth!!', None,
+        ])
+        self.assertEqual([result['errors'] is None for result in results], [
+            False, True, False, False, False, False, False,
+        ])
+        self.assertIn('edx_video_id', results[2]['errors'])
+        self.assertEqual(
+            results[3]['errors']['encoded_videos'][0]['profile'],
+            ['Object with profile_name=unknown does not exist.']
+        )
+        self.assertEqual(results[4]['errors']['non_field_errors'], ['Invalid data: duplicate courses'])
+        self.assertEqual(
+            sorted(Video.objects.values_list('edx_video_id', flat=True)),
+            ['video-0', 'video-1']
+        )
+
+    def test_create_videos_queries(self):
+        """
+        Tests that the number of queries does not depend on the number of videos
+        """
+        # profiles, taken ids, savepoint, videos, video ids, encoded videos, course videos,
+        # course video ids, video images, release savepoint
+        with self.assertNumQueries(10):
+            api.create_videos([self.get_video_data(index) for index in range(2)])
+
+        # profiles are now in the registry
+        with self.assertNumQueries(9):
+            api.create_videos([self.get_video_data(index) for index in range(2, 7)])
+
+        self.assertEqual(Video.objects.count(), 7)
+        self.assertEqual(EncodedVideo.objects.count(), 14)
+        self.assertEqual(CourseVideo.objects.count(), 14)
+        self.assertEqual(VideoImage.objects.count(), 7)
+
+
 @ddt
 class UpdateVideoTest(TestCase):
     """
@@ -230,6 +341,59 @@ class UpdateVideoTest(TestCase):
         self.assertEqual(type(updated_video), Video)
         self.assertEqual(updated_video.client_video_id, "Full Swordfish")
 
+    def test_update_video_encoded_videos(self):
+        """
+        Tests that only the changed encoded videos of a video are written
+        """
+        api.update_video(dict(
+            encoded_videos=[
+                constants.ENCODED_VIDEO_DICT_FISH_MOBILE,
+                constants.ENCODED_VIDEO_DICT_FISH_DESKTOP,
+            ],
+            **constants.VIDEO_DICT_FISH
+        ))
+        mobile = EncodedVideo.objects.get(profile__profile_name=constants.PROFILE_MOBILE)
+        desktop = EncodedVideo.objects.get(profile__profile_name=constants.PROFILE_DESKTOP)
+
+        api.update_video(dict(
+            encoded_videos=[
+                constants.ENCODED_VIDEO_DICT_FISH_HLS,
+                dict(constants.ENCODED_VIDEO_DICT_FISH_DESKTOP, url='https://www.swordsplints.com/v2'),
+            ],
+            **constants.VIDEO_DICT_FISH
+        ))
+
+        encoded_videos = {
+            encoded_video.profile.profile_name: encoded_video
+            for encoded_video in EncodedVideo.objects.select_related('profile')
+        }
+        self.assertEqual(set(encoded_videos), {constants.PROFILE_DESKTOP, constants.PROFILE_HLS})
+        self.assertFalse(EncodedVideo.objects.filter(id=mobile.id).exists())
+        self.assertEqual(encoded_videos[constants.PROFILE_DESKTOP].id, desktop.id)
+        self.assertEqual(encoded_videos[constants.PROFILE_DESKTOP].created, desktop.created)
+        self.assertGreater(encoded_videos[constants.PROFILE_DESKTOP].modified, desktop.modified)
+        self.assertEqual(encoded_videos[constants.PROFILE_DESKTOP].url, 'https://www.swordsplints.com/v2')
+
+    def test_update_video_unchanged_encoded_videos(self):
+        """
+        Tests that unchanged encoded videos are not written
+        """
+        video_data = dict(
+            encoded_videos=[
+                constants.ENCODED_VIDEO_DICT_FISH_MOBILE
+            ],
+            **constants.VIDEO_DICT_FISH_UPDATE
+        )
+        encoded_video = EncodedVideo.objects.get()
+        with CaptureQueriesContext(connection) as queries:
+            api.update_video(video_data)
+
+        self.assertFalse([
+            query for query in queries.captured_queries
+            if query['sql'].startswith(('INSERT', 'UPDATE', 'DELETE')) and 'edxval_encodedvideo' in query['sql']
+        ])
+        self.assertEqual(EncodedVideo.objects.get().modified, encoded_video.modified)
+
     @data(
         constants.COMPLETE_SET_INVALID_ENCODED_VIDEO_FISH,
     )
@@ -251,6 +415,73 @@ class UpdateVideoTest(TestCase):
             api.update_video(data)
 
 
+class UpdateVideosStatusTest(TestCase):
+    """
+    Tests the update_videos_status function in api.py.
+    """
+
+    def setUp(self):
+        """
+        Creation of Video objects that will be used to test status updates
+        """
+        super().setUp()
+        for index in range(4):
+            Video.objects.create(edx_video_id=f'video-{index}', duration=10, status='upload')
+
+    @patch('edxval.api.logger')
+    def test_update_videos_status(self, mock_logger):
+        """
+        Tests updating the status of many videos with a query per distinct status
+        """
+        status_updates = [
+            {'edx_video_id': 'video-0', 'status': 'file_complete'},
+            {'edx_video_id': 'video-1', 'status': 'file_complete'},
+            {'edx_video_id': 'video-2', 'status': 'pipeline_error', 'error_description': 'Encode failed'},
+            {'edx_video_id': 'video-3', 'status': 'pipeline_error', 'error_description': 'Upload failed'},
+            {'edx_video_id': 'unknown', 'status': 'file_complete'},
+        ]
+
+        # previous statuses, savepoint, two updates, release savepoint
+        with self.assertNumQueries(5):
+            not_found_edx_video_ids = api.update_videos_status(status_updates)
+
+        self.assertEqual(not_found_edx_video_ids, ['unknown'])
+        self.assertEqual(
+            list(Video.objects.order_by('edx_video_id').values_list('edx_video_id', 'status', 'error_description')),
+            [
+                ('video-0', 'file_complete', None),
+                ('video-1', 'file_complete', None),
+                ('video-2', 'pipeline_error', 'Encode failed'),
+                ('video-3', 'pipeline_error', 'Upload failed'),
+            ]
+        )
+        mock_logger.info.assert_any_call(
+            'VAL: Status changed from [%s] to [%s] for video [%s]', 'upload', 'pipeline_error', 'video-2'
+        )
+        self.assertEqual(mock_logger.info.call_count, 4)
+
+    def test_update_videos_status_duplicates(self):
+        """
+        Tests that the last status update of a video wins
+        """
+        api.update_videos_status([
+            {'edx_video_id': 'video-0', 'status': 'file_complete'},
+            {'edx_video_id': 'video-0', 'status': 'transcode_active'},
+        ])
+        self.assertEqual(Video.objects.get(edx_video_id='video-0').status, 'transcode_active')
+
+    @patch.dict(settings.VIDEO_CACHE_SETTINGS, TIMEOUT=300)
+    def test_update_videos_status_invalidates_cache(self):
+        """
+        Tests that the cached video info is not stale after a status update
+        """
+        caches['default'].clear()
+        self.assertEqual(api.get_video_info('video-0')['status'], 'upload')
+        with self.captureOnCommitCallbacks(execute=True):
+            api.update_videos_status([{'edx_video_id': 'video-0', 'status': 'file_complete'}])
+        self.assertEqual(api.get_video_info('video-0')['status'], 'file_complete')
+
+
 class CreateProfileTest(TestCase):
     """
     Tests the create_profile function in the api.py
@@ -450,6 +681,186 @@ class GetUrlsForProfileTest(TestCase):
         url = api.get_url_for_profile(edx_video_id, profile)
         self.assertEqual(url, 'http://www.meowmix.com')
 
+    def test_get_urls_for_many_videos(self):
+        """
+        Tests get_urls_for_many_videos for found and missing videos and profiles
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_STAR)
+        EncodedVideo.objects.create(
+            video=video,
+            profile=Profile.objects.get(profile_name="mobile"),
+            url=constants.ENCODED_VIDEO_DICT_STAR['url'],
+            file_size=constants.ENCODED_VIDEO_DICT_STAR['file_size'],
+            bitrate=constants.ENCODED_VIDEO_DICT_STAR['bitrate'],
+        )
+        edx_video_ids = [constants.VIDEO_DICT_FISH['edx_video_id'], video.edx_video_id, 'not-found']
+
+        with self.assertNumQueries(1):
+            urls = api.get_urls_for_many_videos(edx_video_ids, ['mobile', 'hls', 'not-found'])
+
+        self.assertEqual(urls, {
+            constants.VIDEO_DICT_FISH['edx_video_id']: {
+                'mobile': 'http://www.meowmix.com',
+                'hls': 'https://www.tmnt.com/tmnt101.m3u8',
+                'not-found': None,
+            },
+            video.edx_video_id: {
+                'mobile': constants.ENCODED_VIDEO_DICT_STAR['url'],
+                'hls': None,
+                'not-found': None,
+            },
+            'not-found': {
+                'mobile': None,
+                'hls': None,
+                'not-found': None,
+            },
+        })
+
+    def test_get_urls_for_many_videos_matches_get_urls_for_profiles(self):
+        """
+        Tests that get_urls_for_many_videos agrees with get_urls_for_profiles
+        """
+        profiles = ['mobile', 'desktop', 'hls']
+        edx_video_id = constants.VIDEO_DICT_FISH['edx_video_id']
+        self.assertEqual(
+            api.get_urls_for_many_videos([edx_video_id], profiles)[edx_video_id],
+            api.get_urls_for_profiles(edx_video_id, profiles)
+        )
+
+
+@patch.dict(settings.VIDEO_CACHE_SETTINGS, TIMEOUT=300)
+class VideoInfoCacheTest(TestCase):
+    """
+    Tests the read-through cache of get_video_info
+    """
+
+    def setUp(self):
+        """
+        Creates a video with an encode in a course
+        """
+        super().setUp()
+        caches['default'].clear()
+        self.addCleanup(caches['default'].clear)
+        self.edx_video_id = constants.VIDEO_DICT_FISH['edx_video_id']
+        self.video = Video.objects.create(**constants.VIDEO_DICT_FISH)
+        self.profile = Profile.objects.create(profile_name=constants.PROFILE_MOBILE)
+        EncodedVideo.objects.create(video=self.video, profile=self.profile, **constants.ENCODED_VIDEO_DICT_MOBILE)
+        self.course_video = CourseVideo.objects.create(video=self.video, course_id='test-course')
+
+    def assert_cache_miss(self, expected_miss=True):
+        """
+        Asserts whether fetching the video info hits the database
+        """
+        with CaptureQueriesContext(connection) as queries:
+            video_info = api.get_video_info(self.edx_video_id)
+
+        self.assertEqual(bool(queries.captured_queries), expected_miss)
+        return video_info
+
+    def test_cached_video_info(self):
+        """
+        Tests that the video info and profile urls are served from the cache
+        """
+        video_info = self.assert_cache_miss()
+        self.assertEqual(self.assert_cache_miss(False), video_info)
+        with self.assertNumQueries(0):
+            url = api.get_url_for_profile(self.edx_video_id, constants.PROFILE_MOBILE)
+        self.assertEqual(url, constants.ENCODED_VIDEO_DICT_MOBILE['url'])
+
+    @patch.dict(settings.VIDEO_CACHE_SETTINGS, TIMEOUT=0)
+    def test_disabled_cache(self):
+        """
+        Tests that nothing is cached with a timeout of 0
+        """
+        self.assert_cache_miss()
+        self.assert_cache_miss()
+
+    def test_unknown_video_is_not_cached(self):
+        """
+        Tests that a missing video is not cached
+        """
+        with self.assertRaises(ValVideoNotFoundError):
+            api.get_video_info('unknown')
+        Video.objects.create(**dict(constants.VIDEO_DICT_STAR, edx_video_id='unknown'))
+        self.assertEqual(api.get_video_info('unknown')['edx_video_id'], 'unknown')
+
+    def test_invalidate_on_video_save(self):
+        """
+        Tests that saving a video invalidates its cached info
+        """
+        self.assert_cache_miss()
+        with self.captureOnCommitCallbacks(execute=True):
+            api.update_video_status(self.edx_video_id, 'file_complete')
+        self.assertEqual(self.assert_cache_miss()['status'], 'file_complete')
+
+    def test_invalidate_on_commit(self):
+        """
+        Tests that the cached info is only invalidated once the transaction is committed
+        """
+        self.assert_cache_miss()
+        with self.captureOnCommitCallbacks() as callbacks:
+            api.update_video_status(self.edx_video_id, 'file_complete')
+            # A read before the commit caches nothing new.
+            self.assertEqual(self.assert_cache_miss(False)['status'], constants.VIDEO_DICT_FISH['status'])
+
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(self.assert_cache_miss()['status'], 'file_complete')
+
+    def test_invalidate_on_encoded_video_change(self):
+        """
+        Tests that adding and removing encodes invalidates the cached info
+        """
+        self.assert_cache_miss()
+        desktop = Profile.objects.create(profile_name=constants.PROFILE_DESKTOP)
+        with self.captureOnCommitCallbacks(execute=True):
+            encoded_video = EncodedVideo.objects.create(
+                video=self.video, profile=desktop, **constants.ENCODED_VIDEO_DICT_DESKTOP
+            )
+        self.assertEqual(len(self.assert_cache_miss()['encoded_videos']), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            EncodedVideo.objects.filter(id=encoded_video.id).delete()
+        self.assertEqual(len(self.assert_cache_miss()['encoded_videos']), 1)
+
+    def test_invalidate_on_course_video_change(self):
+        """
+        Tests that changes to the courses and course images of a video invalidate the cached info
+        """
+        self.assert_cache_miss()
+        with self.captureOnCommitCallbacks(execute=True):
+            CourseVideo.objects.create(video_id=self.video.id, course_id='other-course')
+        self.assertEqual(len(self.assert_cache_miss()['courses']), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            VideoImage.create_or_update(self.course_video, 'image.jpg')
+        self.assertIn({'test-course': '/image.jpg'}, self.assert_cache_miss()['courses'])
+
+    def test_invalidate_on_update_video(self):
+        """
+        Tests that update_video invalidates the cached info
+        """
+        self.assert_cache_miss()
+        with self.captureOnCommitCallbacks(execute=True):
+            api.update_video(dict(
+                constants.VIDEO_DICT_FISH,
+                encoded_videos=[
+                    dict(constants.ENCODED_VIDEO_DICT_MOBILE, url='http://www.example.com', profile='mobile')
+                ]
+            ))
+        video_info = self.assert_cache_miss()
+        self.assertEqual(video_info['encoded_videos'][0]['url'], 'http://www.example.com')
+
+    def test_invalidate_on_video_delete(self):
+        """
+        Tests that a deleted video is not served from the cache
+        """
+        self.assert_cache_miss()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.video.delete()
+        with self.assertRaises(ValVideoNotFoundError):
+            api.get_video_info(self.edx_video_id)
+
 
 class GetVideoForCourseProfiles(TestCase):
     """Tests get_video_info_for_course_and_profiles in api.py"""
@@ -719,6 +1130,31 @@ class GetVideosForCourseTest(TestCase, SortedVideoTestMixin):
         videos = list(videos)
         self.assertEqual(len(videos), 0)
 
+    def test_get_videos_for_course_queries(self):
+        """
+        Tests that the number of queries to list the videos of a course does not depend on the video count
+        """
+        for index in range(3):
+            video = Video.objects.create(
+                client_video_id=f'video {index}',
+                duration=111.0,
+                edx_video_id=f'video-{index}',
+            )
+            EncodedVideo.objects.create(
+                video=video,
+                profile=Profile.objects.get(profile_name=constants.PROFILE_MOBILE),
+                **constants.ENCODED_VIDEO_DICT_MOBILE
+            )
+            course_video = CourseVideo.objects.create(video=video, course_id=self.course_id)
+            VideoImage.create_or_update(course_video, f'image-{index}.jpg')
+
+            # videos, encoded videos with profiles, course videos, video images
+            with self.assertNumQueries(4):
+                videos = {video['edx_video_id']: video for video in api.get_videos_for_course(self.course_id)[0]}
+
+            self.assertEqual(len(videos), index + 2)
+            self.assertEqual(videos[video.edx_video_id]['courses'], [{self.course_id: f'/image-{index}.jpg'}])
+
     def test_get_paginated_videos_for_course(self):
         """
         Test retrieving paginated videos for a course id
@@ -749,6 +1185,69 @@ class GetVideosForCourseTest(TestCase, SortedVideoTestMixin):
             return videos
         self.check_sort_params_of_api(api_func)
 
+    def get_videos_by_cursor(self, sort_field=None, sort_direction=SortDirection.asc, videos_per_page=1):
+        """
+        Returns all the videos of the course by walking through its cursor paginated pages
+        """
+        videos = []
+        pagination_conf = {'cursor': None, 'videos_per_page': videos_per_page}
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                page, pagination_context = api.get_videos_for_course(
+                    self.course_id, sort_field, sort_direction, pagination_conf
+                )
+                page = list(page)
+
+            self.assertFalse([query for query in queries.captured_queries if 'COUNT(' in query['sql']])
+            self.assertLessEqual(len(page), videos_per_page)
+            videos.extend(page)
+            if pagination_context['next_cursor'] is None:
+                return videos
+
+            pagination_conf['cursor'] = pagination_context['next_cursor']
+
+    def test_get_cursor_paginated_videos_for_course(self):
+        """
+        Test retrieving cursor paginated videos for a course id
+        """
+        Video.objects.filter(edx_video_id=constants.VIDEO_DICT_FISH['edx_video_id']).delete()
+        for index in range(5):
+            video = Video.objects.create(client_video_id=f'video {index}', duration=1, edx_video_id=f'video-{index}')
+            CourseVideo.objects.create(video=video, course_id=self.course_id)
+
+        edx_video_ids = [f'video-{index}' for index in range(5)]
+        for videos_per_page in (1, 2, 5, 10):
+            videos = self.get_videos_by_cursor(VideoSortField.created, videos_per_page=videos_per_page)
+            self.assertEqual([video['edx_video_id'] for video in videos], edx_video_ids)
+
+        videos = self.get_videos_by_cursor(VideoSortField.created, SortDirection.desc, videos_per_page=2)
+        self.assertEqual([video['edx_video_id'] for video in videos], list(reversed(edx_video_ids)))
+
+    def test_get_cursor_paginated_videos_for_course_sort(self):
+        """
+        Tests retrieving cursor paginated videos for a course id according to sort
+        """
+        def api_func(_expected_ids, sort_field, sort_direction):
+            """ retrieving all the cursor paginated videos for a course id according to sort """
+            return self.get_videos_by_cursor(sort_field, sort_direction)
+        self.check_sort_params_of_api(api_func)
+
+    def test_get_cursor_paginated_videos_for_course_invalid_cursor(self):
+        """
+        Tests retrieving cursor paginated videos with an invalid cursor
+        """
+        for cursor in ('invalid', utils.encode_cursor(['too', 'many', 'values'])):
+            with self.assertRaises(ValueError):
+                api.get_videos_for_course(self.course_id, pagination_conf={'cursor': cursor, 'videos_per_page': 1})
+
+        # A well-formed cursor with values of the wrong type for the ordering fields.
+        with self.assertRaises(ValueError):
+            api.get_videos_for_course(
+                self.course_id,
+                sort_field=VideoSortField.created,
+                pagination_conf={'cursor': utils.encode_cursor(['foo', 'bar']), 'videos_per_page': 1},
+            )
+
     def test_get_video_ids_for_course(self):
 
         course_transcript = api.get_video_ids_for_course(self.course_id)
@@ -823,9 +1322,49 @@ class GetYouTubeProfileVideosTest(TestCase):
         """
         Tests the query count for retrieving course ids and video ids with youtube profile
         """
-        with self.assertNumQueries(3):
+        with self.assertNumQueries(2):
             api.get_course_video_ids_with_youtube_profile()
 
+    def test_get_course_video_ids_with_youtube_profile_query_count_is_constant(self):
+        """
+        Tests that the query count does not grow with the number of course videos
+        """
+        for course_id in range(3, 10):
+            CourseVideo.objects.create(video=self.video, course_id='test-course' + str(course_id))
+
+        with self.assertNumQueries(2):
+            ids = api.get_course_video_ids_with_youtube_profile()
+        self.assertEqual(len(ids), 9)
+
+    def test_get_course_video_ids_with_youtube_profile_batch(self):
+        """
+        Tests offset and limit for course ids and video ids with youtube profile
+        """
+        ids = api.get_course_video_ids_with_youtube_profile(offset=1, limit=1)
+        self.assertEqual(ids, [('test-course2', 'super-soaker', 'https://www.youtube.com/watch?v=OscRe3pSP80')])
+
+    @data(1, 2, 3)
+    def test_iter_course_video_ids_with_youtube_profile(self, batch_size):
+        """
+        Tests that the keyset scan returns the same rows as the full listing
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_STAR)
+        self._setup_video_with_encodes_for_course(
+            course_id='test-course3',
+            video=video,
+            encodes_data=[dict(constants.ENCODED_VIDEO_DICT_YOUTUBE, profile=constants.PROFILE_YOUTUBE)]
+        )
+        ids = list(api.iter_course_video_ids_with_youtube_profile(batch_size=batch_size))
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(ids, api.get_course_video_ids_with_youtube_profile())
+
+    def test_iter_course_video_ids_with_youtube_profile_for_courses(self):
+        """
+        Tests the keyset scan restricted to a set of courses
+        """
+        ids = list(api.iter_course_video_ids_with_youtube_profile(['test-course2']))
+        self.assertEqual(ids, [('test-course2', 'super-soaker', 'https://www.youtube.com/watch?v=OscRe3pSP80')])
+
 
 class GetVideosForIdsTest(TestCase, SortedVideoTestMixin):
     """
@@ -1046,6 +1585,41 @@ class TestCopyCourse(TestCase):
         self.assertEqual(len(original_videos), 2)
         self.assertEqual(set(copied_videos), set(original_videos))
 
+    def test_existing_video_image_in_destination_course_id(self):
+        """
+        Test that the image of a video already in the destination course is replaced by the source image
+        """
+        course_video = CourseVideo.objects.create(video=self.video1, course_id='test-course3')
+        VideoImage.create_or_update(course_video, 'other-image.jpg')
+
+        api.copy_course_videos('test-course', 'test-course3')
+
+        self.assertEqual(VideoImage.objects.get(course_video=course_video).image.name, self.image_name1)
+        self.assertFalse(CourseVideo.objects.get(video=self.video2, course_id='test-course3').image_url())
+
+    def test_copy_queries(self):
+        """
+        Test that the number of queries to copy a course does not depend on its number of videos
+        """
+        for course_id, videos_count in (('small-course', 2), ('large-course', 20)):
+            for index in range(videos_count):
+                video = Video.objects.create(edx_video_id=f'{course_id}-{index}', duration=1, status='test')
+                VideoImage.create_or_update(
+                    CourseVideo.objects.create(video=video, course_id=course_id), f'{course_id}-{index}.jpg'
+                )
+
+            # source videos, savepoint, existing course videos, course videos, destination course videos,
+            # video images, release savepoint
+            with self.assertNumQueries(7):
+                api.copy_course_videos(course_id, f'{course_id}-copy')
+
+            self.assertEqual(
+                list(VideoImage.objects.filter(
+                    course_video__course_id=f'{course_id}-copy'
+                ).order_by('id').values_list('image', flat=True)),
+                [f'{course_id}-{index}.jpg' for index in range(videos_count)]
+            )
+
 
 @ddt
 class ExportTest(TestCase):
@@ -1295,6 +1869,61 @@ class ExportTest(TestCase):
         with self.assertRaises(ValVideoNotFoundError):
             api.export_to_xml('unknown_video', self.file_system, constants.EXPORT_IMPORT_STATIC_DIR)
 
+    def test_export_course_videos(self):
+        """
+        Test that course videos export matches the export of each video and takes a constant number of queries.
+        """
+        video_ids = [
+            constants.VIDEO_DICT_FISH['edx_video_id'], 'unknown_video', constants.VIDEO_DICT_STAR['edx_video_id']
+        ]
+        with self.assertNumQueries(5):
+            exported_videos = api.export_course_videos_to_xml(
+                'test-course', video_ids, self.file_system, constants.EXPORT_IMPORT_STATIC_DIR
+            )
+
+        self.assertEqual(list(exported_videos), [video_ids[0], video_ids[2]])
+        self.assertEqual(
+            sorted(self.file_system.listdir(constants.EXPORT_IMPORT_STATIC_DIR)),
+            ['super-soaker-de.srt', 'super-soaker-en.srt']
+        )
+        for video_id, exported_metadata in exported_videos.items():
+            expected_metadata = api.export_to_xml(
+                video_id, self.file_system, constants.EXPORT_IMPORT_STATIC_DIR, 'test-course'
+            )
+            self.assert_xml_equal(exported_metadata['xml'], expected_metadata['xml'])
+            self.assertEqual(exported_metadata['transcripts'], expected_metadata['transcripts'])
+
+    @patch('edxval.api.logger')
+    def test_export_course_videos_conversion_error(self, mock_logger):
+        """
+        Test that a transcript which can not be converted is skipped, with the other transcripts still exported.
+        """
+        video_id = constants.VIDEO_DICT_FISH['edx_video_id']
+        convert_stream = Transcript.convert_stream
+
+        def convert_sjson_only(src_fileobj, dst_fileobj, input_format, output_format):
+            """
+            Fails to convert the SRT (en) transcript.
+            """
+            if input_format == Transcript.SRT:
+                raise TranscriptsGenerationException('Invalid SRT transcript')
+            return convert_stream(src_fileobj, dst_fileobj, input_format, output_format)
+
+        with patch.object(Transcript, 'convert_stream', side_effect=convert_sjson_only):
+            exported_videos = api.export_course_videos_to_xml(
+                'test-course', [video_id], self.file_system, constants.EXPORT_IMPORT_STATIC_DIR
+            )
+
+        self.assertEqual(exported_videos[video_id]['transcripts'], {'de': 'super-soaker-de.srt'})
+        self.assertEqual(self.file_system.listdir(constants.EXPORT_IMPORT_STATIC_DIR), ['super-soaker-de.srt'])
+        self.assertEqual(
+            [transcript.get('language_code') for transcript in exported_videos[video_id]['xml'].iter('transcript')],
+            ['de']
+        )
+        mock_logger.exception.assert_called_once_with(
+            '[VAL] Error while generating "%s" transcript for video["%s"].', 'en', video_id
+        )
+
 
 @ddt
 class ImportTest(TestCase):
@@ -2028,6 +2657,43 @@ class ImportTest(TestCase):
             [self.transcript_data1, es_external_transcript]
         )
 
+    @data(
+        (constants.TRANSCRIPT_DATA['flash'], False),
+        (constants.TRANSCRIPT_DATA['overwatch'], True),
+    )
+    @unpack
+    @override_waffle_flag(OVERRIDE_EXISTING_IMPORTED_TRANSCRIPTS, active=True)
+    def test_import_transcript_from_fs_compares_content_hash(self, file_content, is_updated):
+        """
+        Test that `import_transcript_from_fs` checks for duplicates with the stored content hash.
+        """
+        video = Video.objects.get(edx_video_id=constants.VIDEO_DICT_FISH['edx_video_id'])
+        existing_transcript, __ = VideoTranscript.create_or_update(
+            video,
+            'en',
+            metadata={'file_format': utils.TranscriptFormat.SRT},
+            file_data=ContentFile(constants.TRANSCRIPT_DATA['flash'])
+        )
+        self.addCleanup(existing_transcript.transcript.delete)
+        file_name = 'existing-transcript.srt'
+        utils.create_file_in_fs(file_content, file_name, self.file_system, constants.EXPORT_IMPORT_STATIC_DIR)
+
+        with patch('edxval.api.is_duplicate_file') as mock_is_duplicate_file:
+            api.import_transcript_from_fs(
+                edx_video_id=video.edx_video_id,
+                language_code='en',
+                file_name=file_name,
+                provider=TranscriptProviderType.CUSTOM,
+                resource_fs=self.file_system,
+                static_dir=constants.EXPORT_IMPORT_STATIC_DIR
+            )
+            mock_is_duplicate_file.assert_not_called()
+
+        video_transcript = VideoTranscript.objects.get(video=video, language_code='en')
+        self.assertEqual(video_transcript.transcript.name != existing_transcript.transcript.name, is_updated)
+        if is_updated:
+            self.addCleanup(video_transcript.transcript.delete)
+
     @patch('edxval.api.logger')
     def test_import_transcript_from_fs_resource_not_found(self, mock_logger):
         """
@@ -2093,8 +2759,13 @@ class ImportTest(TestCase):
 
         self.assertEqual(content_encoding, 'utf-8')
 
+    @data(
+        'This is an invalid transcript file data.',
+        '1\n00:00:00,000 --> 00:00:01,000\nhi\n\n2\ngarbage line\nmore\n',
+        '{"start": [1, 2], "end": ',
+    )
     @patch('edxval.api.logger')
-    def test_import_transcript_from_fs_invalid_format(self, mock_logger):
+    def test_import_transcript_from_fs_invalid_format(self, file_data, mock_logger):
         """
         Test that `import_transcript_from_fs` correctly logs if we get error while retrieving transcript file format.
         """
@@ -2105,7 +2776,7 @@ class ImportTest(TestCase):
         invalid_transcript = dict(
             constants.VIDEO_TRANSCRIPT_CUSTOM_SJSON,
             video_id=edx_video_id,
-            file_data='This is an invalid transcript file data.'
+            file_data=file_data
         )
         utils.create_file_in_fs(
             invalid_transcript['file_data'],
@@ -2128,6 +2799,7 @@ class ImportTest(TestCase):
             language_code,
             invalid_transcript_file_name
         )
+        self.assertIsNone(VideoTranscript.get_or_none(edx_video_id, language_code))
 
     @patch('edxval.api.logger')
     def test_import_transcript_from_fs_bad_content(self, mock_logger):
@@ -2309,6 +2981,166 @@ class ImportTest(TestCase):
 
         self.assert_transcripts(video_id, [self.transcript_data3])
 
+    def test_import_course_videos(self):
+        """
+        Test that course videos import creates, links and transcribes the videos like `import_from_xml` does.
+        """
+        course_id = 'new_course_id'
+        fish_transcript_data = dict(self.transcript_data3, language_code='fr')
+        external_transcript_file_name = 'external-transcript-en.srt'
+        utils.create_file_in_fs(
+            constants.TRANSCRIPT_DATA['flash'],
+            external_transcript_file_name,
+            self.file_system,
+            constants.EXPORT_IMPORT_STATIC_DIR
+        )
+        videos = [
+            {
+                'xml': self.make_import_xml(
+                    video_dict=constants.VIDEO_DICT_STAR,
+                    encoded_video_dicts=[constants.ENCODED_VIDEO_DICT_STAR, constants.ENCODED_VIDEO_DICT_FISH_HLS],
+                    image=self.image_name,
+                    video_transcripts=[self.transcript_data1, self.transcript_data2]
+                ),
+                'edx_video_id': constants.VIDEO_DICT_STAR['edx_video_id'],
+            },
+            {
+                'xml': self.make_import_xml(
+                    video_dict=constants.VIDEO_DICT_FISH,
+                    encoded_video_dicts=[constants.ENCODED_VIDEO_DICT_FISH_DESKTOP],
+                    image=self.image_name,
+                    video_transcripts=[fish_transcript_data]
+                ),
+                'edx_video_id': constants.VIDEO_DICT_FISH['edx_video_id'],
+            },
+            {
+                'xml': etree.fromstring('<video_asset/>'),
+                'edx_video_id': '',
+                'external_transcripts': {'en': [external_transcript_file_name]},
+            },
+        ]
+
+        edx_video_ids = api.import_course_videos_from_xml(
+            course_id, videos, self.file_system, constants.EXPORT_IMPORT_STATIC_DIR
+        )
+
+        self.assertEqual(edx_video_ids[:2], [constants.VIDEO_DICT_STAR['edx_video_id'], 'super-soaker'])
+        star_video = Video.objects.get(edx_video_id=constants.VIDEO_DICT_STAR['edx_video_id'])
+        self.assert_video_matches_dict(star_video, constants.VIDEO_DICT_STAR)
+        self.assertEqual(star_video.status, 'imported')
+        self.assert_encoded_video_matches_dict(
+            star_video.encoded_videos.get(profile__profile_name=constants.PROFILE_MOBILE),
+            constants.ENCODED_VIDEO_DICT_STAR
+        )
+        self.assertEqual(star_video.courses.get(course_id=course_id).video_image.image.name, self.image_name)
+        self.assert_transcripts(star_video.edx_video_id, [self.transcript_data1, self.transcript_data2])
+
+        # The existing video is linked to the course, without changing its encodes.
+        fish_video = Video.objects.get(edx_video_id='super-soaker')
+        self.assertEqual(
+            list(fish_video.encoded_videos.values_list('profile__profile_name', flat=True)),
+            [constants.PROFILE_MOBILE]
+        )
+        self.assertEqual(fish_video.courses.get(course_id=course_id).video_image.image.name, self.image_name)
+        self.assert_transcripts('super-soaker', [fish_transcript_data])
+
+        external_video = Video.objects.get(edx_video_id=edx_video_ids[2])
+        self.assertEqual(external_video.status, constants.EXTERNAL_VIDEO_STATUS)
+        self.assertFalse(external_video.courses.exists())
+        self.assert_transcripts(
+            external_video.edx_video_id,
+            [dict(constants.VIDEO_TRANSCRIPT_CUSTOM_SRT, video_id=external_video.edx_video_id)]
+        )
+
+    def test_import_course_videos_queries(self):
+        """
+        Test that the number of queries of course videos import does not depend on the number of videos.
+        """
+        def import_videos(count):
+            """
+            Imports new videos with encodes and a course image, returning the number of queries.
+            """
+            videos = [
+                {
+                    'xml': self.make_import_xml(
+                        video_dict=dict(constants.VIDEO_DICT_STAR, edx_video_id=f'video-{count}-{index}'),
+                        encoded_video_dicts=[constants.ENCODED_VIDEO_DICT_STAR],
+                        image=self.image_name,
+                    ),
+                    'edx_video_id': f'video-{count}-{index}',
+                }
+                for index in range(count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                api.import_course_videos_from_xml(
+                    'new_course_id', videos, self.file_system, constants.EXPORT_IMPORT_STATIC_DIR
+                )
+            return len(queries)
+
+        # Load the profiles registry beforehand, so that both imports find it populated.
+        Profile.get_profiles()
+        self.assertEqual(import_videos(1), import_videos(5))
+        self.assertEqual(CourseVideo.objects.filter(course_id='new_course_id').count(), 6)
+
+    @data(True, False)
+    def test_import_course_videos_transcripts_for_language(self, enable_override_existing_transcripts):
+        """
+        Test that the first transcript of a language is kept unless existing transcripts are overridden.
+        """
+        external_transcript_file_name = 'external-transcript-en.sjson'
+        utils.create_file_in_fs(
+            constants.VIDEO_TRANSCRIPT_CUSTOM_SJSON['file_data'],
+            external_transcript_file_name,
+            self.file_system,
+            constants.EXPORT_IMPORT_STATIC_DIR
+        )
+        videos = [{
+            'xml': self.make_import_xml(
+                video_dict=constants.VIDEO_DICT_STAR,
+                video_transcripts=[constants.VIDEO_TRANSCRIPT_CIELO24]
+            ),
+            'edx_video_id': constants.VIDEO_DICT_STAR['edx_video_id'],
+            'external_transcripts': {'en': [external_transcript_file_name]},
+        }]
+
+        with override_waffle_flag(OVERRIDE_EXISTING_IMPORTED_TRANSCRIPTS, active=enable_override_existing_transcripts):
+            api.import_course_videos_from_xml(
+                'new_course_id', videos, self.file_system, constants.EXPORT_IMPORT_STATIC_DIR
+            )
+
+        expected_transcript_data = (
+            constants.VIDEO_TRANSCRIPT_CUSTOM_SJSON if enable_override_existing_transcripts
+            else constants.VIDEO_TRANSCRIPT_CIELO24
+        )
+        self.assert_transcripts(
+            constants.VIDEO_DICT_STAR['edx_video_id'],
+            [dict(expected_transcript_data, video_id=constants.VIDEO_DICT_STAR['edx_video_id'])]
+        )
+
+    def test_import_course_videos_invalid(self):
+        """
+        Test that no video is created when any of the imported videos is invalid.
+        """
+        videos = [
+            {
+                'xml': self.make_import_xml(video_dict=constants.VIDEO_DICT_STAR),
+                'edx_video_id': constants.VIDEO_DICT_STAR['edx_video_id'],
+            },
+            {
+                'xml': self.make_import_xml(video_dict={'client_video_id': 'dummy', 'duration': -1}),
+                'edx_video_id': 'test_edx_video_id',
+            },
+        ]
+
+        with self.assertRaises(ValCannotCreateError):
+            api.import_course_videos_from_xml(
+                'new_course_id', videos, self.file_system, constants.EXPORT_IMPORT_STATIC_DIR
+            )
+
+        self.assertFalse(
+            Video.objects.filter(edx_video_id__in=[constants.VIDEO_DICT_STAR['edx_video_id'], 'test_edx_video_id'])
+        )
+
 
 class GetCourseVideoRemoveTest(TestCase):
     """
@@ -3060,6 +3892,21 @@ class TranscriptTest(TestCase):
             query_filter['language_code']
         )
 
+    def test_delete_video_transcript_with_shared_file(self):
+        """
+        Verify that `delete_video_transcript` keeps a transcript file used by another transcript.
+        """
+        shared_transcript, __ = VideoTranscript.create_or_update(
+            self.video2,
+            'fr',
+            metadata={'file_name': self.v1_transcript2.transcript.name, 'file_format': utils.TranscriptFormat.SRT}
+        )
+
+        api.delete_video_transcript(video_id=self.video1.edx_video_id, language_code='fr')
+
+        self.assertTrue(os.path.exists(shared_transcript.transcript.path))
+        self.assertFalse(VideoTranscript.objects.filter(video=self.video1, language_code='fr').exists())
+
     def test_create_transcript_file(self):
         """
         Tests that transcript file is created correctly.
@@ -3178,6 +4025,75 @@ class TranscriptTest(TestCase):
 
         self.assertEqual(len(course_transcript), 0)
 
+    def test_get_transcript_details_for_course_query_count(self):
+        """
+        Verify that `get_transcript_details_for_course` does not query per video.
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_STAR)
+        CourseVideo.objects.create(video=video, course_id=self.course_id1)
+        transcript, __ = VideoTranscript.create_or_update(
+            video=video,
+            language_code='en',
+            metadata={'file_format': utils.TranscriptFormat.SJSON, 'provider': TranscriptProviderType.CUSTOM},
+            file_data=ContentFile(constants.TRANSCRIPT_DATA['wow'])
+        )
+        self.addCleanup(transcript.transcript.delete)
+
+        with self.assertNumQueries(2):
+            course_transcript = api.get_transcript_details_for_course(self.course_id1)
+
+        self.assertEqual(sorted(course_transcript), sorted(['super-soaker', video.edx_video_id]))
+        self.assertEqual(sorted(course_transcript['super-soaker']), ['en', 'fr'])
+        self.assertEqual(
+            course_transcript[video.edx_video_id]['en']['content'],
+            constants.TRANSCRIPT_DATA['wow'].encode('utf-8')
+        )
+        self.assertEqual(
+            course_transcript['super-soaker']['fr']['size'],
+            len(constants.TRANSCRIPT_DATA['overwatch'].encode('utf-8'))
+        )
+
+    def test_get_transcript_details_for_course_without_transcripts(self):
+        """
+        Verify that course videos without transcripts are part of the bundle.
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_STAR)
+        CourseVideo.objects.create(video=video, course_id='test-course-3')
+
+        course_transcript = api.get_transcript_details_for_course('test-course-3')
+
+        self.assertEqual(course_transcript, {video.edx_video_id: {}})
+
+    def test_iter_transcript_details_for_course(self):
+        """
+        Verify that `iter_transcript_details_for_course` yields the same data per video.
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_STAR)
+        CourseVideo.objects.create(video=video, course_id=self.course_id1)
+
+        course_transcript = api.iter_transcript_details_for_course(self.course_id1)
+
+        self.assertEqual(dict(course_transcript), api.get_transcript_details_for_course(self.course_id1))
+
+    def test_iter_transcript_details_for_course_no_course_videos(self):
+        """
+        Verify that `iter_transcript_details_for_course` yields nothing for an unknown course.
+        """
+        course_transcript = api.iter_transcript_details_for_course('this-is-not-a-course-id')
+
+        self.assertEqual(list(course_transcript), [])
+
+    @patch.dict(settings.VIDEO_TRANSCRIPTS_SETTINGS, STORAGE_CONCURRENCY=1)
+    def test_get_transcript_details_for_course_concurrency(self):
+        """
+        Verify that transcript storage reads honour the configured concurrency.
+        """
+        with patch('edxval.api.ThreadPoolExecutor', wraps=api.ThreadPoolExecutor) as mock_executor:
+            course_transcript = api.get_transcript_details_for_course(self.course_id1)
+
+        mock_executor.assert_called_once_with(max_workers=1)
+        self.assertEqual(sorted(course_transcript['super-soaker']), ['en', 'fr'])
+
 
 @ddt
 class TranscriptPreferencesTest(TestCase):
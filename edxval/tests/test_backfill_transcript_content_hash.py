@@ -0,0 +1,70 @@
+"""
+Tests for the backfill_transcript_content_hash management command.
+"""
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase
+
+from edxval.models import Video, VideoTranscript
+from edxval.tests import constants
+from edxval.utils import TranscriptFormat, generate_file_content_hash
+
+
+class BackfillTranscriptContentHashTest(TestCase):
+    """
+    Tests for the backfill_transcript_content_hash management command.
+    """
+
+    def setUp(self):
+        """
+        Creates transcripts saved without a content hash.
+        """
+        super().setUp()
+        video = Video.objects.create(**constants.VIDEO_DICT_FISH)
+        self.transcripts = []
+        for language_code, content in (('en', 'flash'), ('fr', 'overwatch')):
+            video_transcript = VideoTranscript(
+                video=video, language_code=language_code, file_format=TranscriptFormat.SRT
+            )
+            video_transcript.transcript.save(
+                f'{language_code}.srt', ContentFile(constants.TRANSCRIPT_DATA[content]), save=True
+            )
+            self.addCleanup(video_transcript.transcript.delete, save=False)
+            self.transcripts.append((video_transcript, constants.TRANSCRIPT_DATA[content].encode('utf-8')))
+
+        self.missing_file_transcript = VideoTranscript.objects.create(
+            video=video, language_code='de', file_format=TranscriptFormat.SRT, transcript='non/existent/file.srt'
+        )
+
+    def test_backfill(self):
+        """
+        Tests that the content hash and size are populated from the stored files.
+        """
+        modified = {
+            video_transcript.id: video_transcript.modified for video_transcript, __ in self.transcripts
+        }
+
+        call_command('backfill_transcript_content_hash', '--batch-size=1')
+
+        for video_transcript, content in self.transcripts:
+            video_transcript.refresh_from_db()
+            self.assertEqual(video_transcript.content_hash, generate_file_content_hash(ContentFile(content)))
+            self.assertEqual(video_transcript.file_size, len(content))
+            self.assertEqual(video_transcript.modified, modified[video_transcript.id])
+
+        self.missing_file_transcript.refresh_from_db()
+        self.assertIsNone(self.missing_file_transcript.content_hash)
+        self.assertIsNone(self.missing_file_transcript.file_size)
+
+    def test_backfill_skips_populated_transcripts(self):
+        """
+        Tests that transcripts having a content hash and size are not read again.
+        """
+        video_transcript, __ = self.transcripts[0]
+        VideoTranscript.objects.filter(id=video_transcript.id).update(content_hash='hash', file_size=1)
+
+        call_command('backfill_transcript_content_hash')
+
+        video_transcript.refresh_from_db()
+        self.assertEqual(video_transcript.content_hash, 'hash')
+        self.assertEqual(video_transcript.file_size, 1)
@@ -1,10 +1,15 @@
 """ Test for models """
 
 
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.files.base import ContentFile
 from django.test import TestCase
 
-from edxval.models import CourseVideo, Video, VideoImage, VideoTranscript
+from edxval.models import CourseVideo, Profile, Video, VideoImage, VideoTranscript, clear_profile_registry
 from edxval.tests import constants
+from edxval.utils import generate_file_content_hash
 
 
 class VideoTranscriptTest(TestCase):
@@ -35,6 +40,89 @@ class VideoTranscriptTest(TestCase):
         self.assertNotIn('\n', video_trancript.filename)
         assert str(video_trancript) == "en Transcript for new-line-not-allowed"
 
+    def create_transcript(self, video, language_code, content, file_name=None):
+        """
+        Creates a transcript with the given content and cleans up its file afterwards.
+        """
+        video_transcript, __ = VideoTranscript.create_or_update(
+            video,
+            language_code,
+            metadata={'file_format': self.transcript_data['file_format'], 'file_name': file_name},
+            file_data=ContentFile(content) if content else None,
+        )
+        self.addCleanup(video_transcript.transcript.storage.delete, video_transcript.transcript.name)
+        return video_transcript
+
+    def test_content_hash(self):
+        """
+        Test that the content hash is stored with the transcript file.
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_FISH)
+        video_transcript = self.create_transcript(video, 'en', constants.TRANSCRIPT_DATA['flash'])
+
+        self.assertEqual(
+            video_transcript.content_hash,
+            generate_file_content_hash(ContentFile(constants.TRANSCRIPT_DATA['flash']))
+        )
+        self.assertEqual(video_transcript.file_size, len(constants.TRANSCRIPT_DATA['flash'].encode('utf-8')))
+        self.assertNotIn(video_transcript.content_hash, video_transcript.transcript.name)
+
+    def test_content_hash_without_file_data(self):
+        """
+        Test that the content hash is read from storage when only a file name is given.
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_FISH)
+        other_video = Video.objects.create(**constants.VIDEO_DICT_STAR)
+        stored_transcript = self.create_transcript(other_video, 'en', constants.TRANSCRIPT_DATA['flash'])
+
+        video_transcript, __ = VideoTranscript.create_or_update(video, 'en', metadata={
+            'file_format': self.transcript_data['file_format'],
+            'file_name': stored_transcript.transcript.name,
+        })
+
+        self.assertEqual(video_transcript.content_hash, stored_transcript.content_hash)
+        self.assertEqual(video_transcript.file_size, stored_transcript.file_size)
+
+    def test_content_hash_without_stored_file(self):
+        """
+        Test that the content hash is cleared when the file given by name can not be read.
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_FISH)
+        self.create_transcript(video, 'en', constants.TRANSCRIPT_DATA['flash'])
+
+        video_transcript = self.create_transcript(video, 'en', None, file_name='some/transcript.srt')
+
+        self.assertIsNone(video_transcript.content_hash)
+        self.assertIsNone(video_transcript.file_size)
+
+    @patch.dict(settings.VIDEO_TRANSCRIPTS_SETTINGS, CONTENT_ADDRESSED_STORAGE=True)
+    def test_content_addressed_storage(self):
+        """
+        Test that identical transcripts share a single file named by the content hash.
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_FISH)
+        other_video = Video.objects.create(**constants.VIDEO_DICT_STAR)
+        video_transcript = self.create_transcript(video, 'en', constants.TRANSCRIPT_DATA['flash'])
+
+        with patch('django.core.files.storage.FileSystemStorage.save') as mock_save:
+            duplicate_transcript = self.create_transcript(other_video, 'en', constants.TRANSCRIPT_DATA['flash'])
+            mock_save.assert_not_called()
+
+        self.assertEqual(
+            video_transcript.transcript.name,
+            '{prefix}{hash}.{ext}'.format(
+                prefix=settings.VIDEO_TRANSCRIPTS_SETTINGS['DIRECTORY_PREFIX'],
+                hash=video_transcript.content_hash,
+                ext=self.transcript_data['file_format'],
+            )
+        )
+        self.assertEqual(duplicate_transcript.transcript.name, video_transcript.transcript.name)
+        self.assertTrue(video_transcript.is_transcript_file_shared())
+
+        other_transcript = self.create_transcript(other_video, 'fr', constants.TRANSCRIPT_DATA['overwatch'])
+        self.assertNotEqual(other_transcript.transcript.name, video_transcript.transcript.name)
+        self.assertFalse(other_transcript.is_transcript_file_shared())
+
 
 class VideoImageTest(TestCase):
     """
@@ -73,3 +161,52 @@ class VideoImageTest(TestCase):
         video_image, _ = VideoImage.create_or_update(self.course_video, generated_images=self.generated_images)
         self.assertNotEqual(video_image.image, self.generated_images[0])
         self.assertEqual(video_image.image, manually_uploaded_img)
+
+
+class ProfileRegistryTest(TestCase):
+    """
+    Test the registry of Profile objects
+    """
+
+    def test_get_by_name(self):
+        """
+        Test that profiles are loaded once, and reloaded when an unknown profile is requested.
+        """
+        with self.assertNumQueries(1):
+            profile = Profile.get_by_name(constants.PROFILE_HLS)
+            self.assertEqual(Profile.get_by_name(constants.PROFILE_HLS), profile)
+            self.assertIn(constants.PROFILE_HLS, Profile.get_profiles())
+
+        with self.assertNumQueries(1):
+            with self.assertRaises(Profile.DoesNotExist):
+                Profile.get_by_name('unknown')
+
+    def test_get_by_name_with_concurrent_clear(self):
+        """
+        Test that a profile is found even if the registry is cleared right after being reloaded.
+        """
+        load_registry = Profile._load_registry  # pylint: disable=protected-access
+
+        def load_registry_then_clear():
+            """
+            Reloads the registry, which another thread clears right away.
+            """
+            registry = load_registry()
+            clear_profile_registry()
+            return registry
+
+        with patch.object(Profile, '_load_registry', side_effect=load_registry_then_clear):
+            self.assertEqual(Profile.get_by_name(constants.PROFILE_HLS).profile_name, constants.PROFILE_HLS)
+            self.assertIn(constants.PROFILE_HLS, Profile.get_profiles())
+
+    def test_registry_cleared_on_change(self):
+        """
+        Test that saving or deleting a profile clears the registry.
+        """
+        self.assertNotIn(constants.PROFILE_MOBILE, Profile.get_profiles())
+
+        profile = Profile.objects.create(profile_name=constants.PROFILE_MOBILE)
+        self.assertEqual(Profile.get_profiles()[constants.PROFILE_MOBILE], profile)
+
+        profile.delete()
+        self.assertNotIn(constants.PROFILE_MOBILE, Profile.get_profiles())
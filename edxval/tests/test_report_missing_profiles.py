@@ -0,0 +1,114 @@
+"""
+Tests for the report_missing_profiles management command.
+"""
+import json
+from concurrent.futures import Executor, Future
+from io import StringIO
+from unittest.mock import patch
+
+from ddt import data, ddt
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from edxval.models import CourseVideo, EncodedVideo, Profile, Video
+from edxval.tests import constants
+
+
+class InlineExecutor(Executor):
+    """
+    Executor running the calls in the current process, since worker processes cannot see the test database.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@ddt
+class ReportMissingProfilesTest(TestCase):
+    """
+    Tests for the report_missing_profiles management command.
+    """
+
+    def setUp(self):
+        """
+        Creates videos with some of the encodes of the mobile and desktop profiles.
+        """
+        super().setUp()
+        mobile = Profile.objects.create(profile_name=constants.PROFILE_MOBILE)
+        desktop = Profile.objects.create(profile_name=constants.PROFILE_DESKTOP)
+        for index, profiles in enumerate(([mobile, desktop], [mobile], [], [desktop], [mobile, desktop])):
+            video = Video.objects.create(
+                edx_video_id=f'video-{index}', client_video_id=f'video {index}', duration=1, status='test'
+            )
+            for profile in profiles:
+                EncodedVideo.objects.create(video=video, profile=profile, **constants.ENCODED_VIDEO_DICT_MOBILE)
+            if index == 2:
+                CourseVideo.objects.create(video=video, course_id='course-b')
+                CourseVideo.objects.create(video=video, course_id='course-a')
+
+    def call_command(self, *args):
+        """
+        Calls the command, returning its standard output and error.
+        """
+        stdout, stderr = StringIO(), StringIO()
+        call_command('report_missing_profiles', *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    @data('1', '2', '100')
+    def test_csv_report(self, chunk_size):
+        """
+        Tests reporting the videos missing profiles as CSV, whatever the size of the chunks.
+        """
+        stdout, stderr = self.call_command('--profiles', 'mobile', 'desktop', f'--chunk-size={chunk_size}')
+
+        self.assertEqual(stdout.splitlines(), [
+            'edx_video_id,course_ids,missing_profiles',
+            'video-1,,desktop',
+            'video-2,course-a course-b,mobile desktop',
+            'video-3,,mobile',
+        ])
+        self.assertIn('Scanned 5 videos', stderr)
+        self.assertIn('3 videos are missing profiles', stderr)
+
+    def test_ndjson_report(self):
+        """
+        Tests reporting the videos missing profiles as NDJSON.
+        """
+        stdout, __ = self.call_command('--profiles', 'desktop', '--format=ndjson')
+
+        self.assertEqual([json.loads(line) for line in stdout.splitlines()], [
+            {'edx_video_id': 'video-1', 'course_ids': [], 'missing_profiles': ['desktop']},
+            {'edx_video_id': 'video-2', 'course_ids': ['course-a', 'course-b'], 'missing_profiles': ['desktop']},
+        ])
+
+    def test_report_with_workers(self):
+        """
+        Tests that the chunks scanned by several workers are reported in order.
+
+        This covers the code path of several workers: the database connections are closed before forking and
+        the chunks are mapped over the executor. The chunks are scanned serially in this process though, since
+        forked workers cannot see the test database, so the forking itself is not covered.
+        """
+        with patch(
+            'edxval.management.commands.report_missing_profiles.ProcessPoolExecutor', InlineExecutor
+        ), patch('edxval.management.commands.report_missing_profiles.connections') as mock_connections:
+            stdout, __ = self.call_command('--profiles', 'mobile', '--workers=3', '--chunk-size=1')
+
+        mock_connections.close_all.assert_called_once_with()
+
+        self.assertEqual(stdout.splitlines(), [
+            'edx_video_id,course_ids,missing_profiles',
+            'video-2,course-a course-b,mobile',
+            'video-3,,mobile',
+        ])
+
+    def test_invalid_arguments(self):
+        """
+        Tests that the number of workers and the chunk size must be positive.
+        """
+        with self.assertRaises(CommandError):
+            self.call_command('--profiles', 'mobile', '--workers=0')
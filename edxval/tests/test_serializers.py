@@ -1,11 +1,13 @@
 """
 Tests the serializers for the Video Abstraction Layer
 """
+import timeit
+
 from django.test import TestCase
 
-from edxval.models import EncodedVideo, Profile, Video
-from edxval.serializers import EncodedVideoSerializer, VideoSerializer
-from edxval.tests import constants
+from edxval.models import CourseVideo, EncodedVideo, Profile, Video, VideoImage
+from edxval.serializers import EncodedVideoSerializer, VideoSerializer, serialize_videos
+from edxval.tests import benchmark, constants
 
 
 class SerializerTests(TestCase):
@@ -156,3 +158,51 @@ class SerializerTests(TestCase):
             serializer.errors.get("non_field_errors")[0],
             "Invalid data. Expected a dictionary, but got str."
         )
+
+
+class SerializeVideosTests(TestCase):
+    """
+    Tests the read-only serialize_videos fast path against VideoSerializer
+    """
+
+    def setUp(self):
+        """
+        Creates videos with encodings, course videos and images
+        """
+        super().setUp()
+        Profile.objects.create(profile_name=constants.PROFILE_MOBILE)
+        Profile.objects.create(profile_name=constants.PROFILE_DESKTOP)
+        for video_data in (constants.COMPLETE_SET_FISH, constants.COMPLETE_SET_STAR):
+            serializer = VideoSerializer(data=video_data)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        video = Video.objects.get(edx_video_id=constants.VIDEO_DICT_FISH['edx_video_id'])
+        video.error_description = 'Some error'
+        video.save()
+        VideoImage.create_or_update(CourseVideo.objects.create(video=video, course_id='course-1'), 'image.jpg')
+        CourseVideo.objects.create(video=video, course_id='course-2', is_hidden=True)
+
+    def test_serialize_videos_output(self):
+        """
+        Tests that serialize_videos gives the same output as VideoSerializer
+        """
+        videos = Video.objects.all().order_by('edx_video_id')
+        self.assertEqual(
+            list(serialize_videos(videos)),
+            [VideoSerializer(video).data for video in videos]
+        )
+
+    @benchmark
+    def test_serialize_videos_speedup(self):
+        """
+        Micro-benchmark of serialize_videos against VideoSerializer on the same prefetched videos
+        """
+        videos = list(
+            Video.objects.prefetch_related('encoded_videos__profile', 'courses__video_image').order_by('edx_video_id')
+        )
+
+        drf_time = min(timeit.repeat(lambda: [VideoSerializer(video).data for video in videos], number=50, repeat=5))
+        fast_time = min(timeit.repeat(lambda: list(serialize_videos(videos)), number=50, repeat=5))
+
+        self.assertLess(fast_time, drf_time)
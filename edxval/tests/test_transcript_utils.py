@@ -3,14 +3,78 @@ Tests for transcript utils.
 """
 
 
+import io
 import json
 import textwrap
+import timeit
+from unittest.mock import patch
 
 from ddt import data, ddt, unpack
 from django.test import TestCase
+from pysrt import SubRipFile, SubRipItem, SubRipTime
+from pysrt.srtexc import Error
 
 from edxval.exceptions import TranscriptsGenerationException
-from edxval.transcript_utils import Transcript
+from edxval.tests import benchmark
+from edxval.transcript_utils import (
+    TRANSCRIPT_CODECS,
+    Transcript,
+    TranscriptCodec,
+    get_transcript_codec,
+    register_transcript_codec,
+)
+
+
+def generate_srt_with_pysrt(sjson_subs):
+    """
+    Generates SRT from sjson subs with pysrt items, like `Transcript.generate_srt_from_sjson` used to.
+    """
+    output = ''
+    if not len(sjson_subs['start']) == len(sjson_subs['end']) == len(sjson_subs['text']):
+        return output
+
+    for index, (start, end, text) in enumerate(zip(sjson_subs['start'], sjson_subs['end'], sjson_subs['text'])):
+        output += str(SubRipItem(
+            index=index,
+            start=SubRipTime(milliseconds=start),
+            end=SubRipTime(milliseconds=end),
+            text=text
+        ))
+        output += '\n'
+    return output
+
+
+def parse_srt_with_pysrt(srt_content):
+    """
+    Parses srt content with pysrt, like `Transcript.convert` used to.
+    """
+    return Transcript.generate_sjson_from_srt(
+        SubRipFile.from_string(srt_content, error_handling=SubRipFile.ERROR_RAISE)
+    )
+
+
+def generate_large_srt():
+    """
+    Returns the content of a large srt transcript.
+    """
+    return ''.join(
+        '{index}\n00:{minutes:02d}:{seconds:02d},{milliseconds:03d} --> 00:{minutes:02d}:{seconds:02d},999\n'
+        'Caption number {index}\nof the lecture\n\n'.format(
+            index=index, minutes=index // 600 % 60, seconds=index // 10 % 60, milliseconds=index % 10 * 100
+        )
+        for index in range(5000)
+    )
+
+
+def generate_large_sjson():
+    """
+    Returns the subs of a large sjson transcript.
+    """
+    return {
+        'start': list(range(0, 10000 * 1000, 1000)),
+        'end': list(range(500, 10000 * 1000, 1000)),
+        'text': [f'Caption number {index}' for index in range(10000)],
+    }
 
 
 @ddt
@@ -49,6 +113,17 @@ class TestTranscriptUtils(TestCase):
             }
         """).encode('utf8')
 
+        self.vtt_transcript = textwrap.dedent("""\
+            WEBVTT
+
+            00:00:10.500 --> 00:00:13.000
+            Elephant&#39;s Dream 大象的梦想
+
+            00:00:15.000 --> 00:00:18.000
+            At the left we can see...
+
+        """).encode('utf8')
+
     @data(
         ('invalid_input_format', 'sjson'),
         ('sjson', 'invalid_output_format'),
@@ -95,6 +170,120 @@ class TestTranscriptUtils(TestCase):
         with self.assertRaises(TranscriptsGenerationException):
             Transcript.convert(invalid_srt_transcript, 'srt', 'sjson')
 
+    @data(
+        ('srt', 'vtt'),
+        ('sjson', 'vtt'),
+        ('vtt', 'srt'),
+        ('vtt', 'sjson'),
+    )
+    @unpack
+    def test_convert_vtt(self, input_format, output_format):
+        """
+        Tests that WebVTT transcripts are converted from and to the other formats.
+        """
+        transcripts = {'srt': self.srt_transcript, 'sjson': self.sjson_transcript, 'vtt': self.vtt_transcript}
+        actual = Transcript.convert(transcripts[input_format], input_format, output_format)
+        expected = transcripts[output_format].decode('utf-8')
+        if output_format == 'sjson':
+            self.assertDictEqual(json.loads(actual), json.loads(expected))
+        else:
+            self.assertEqual(actual, expected)
+
+    def test_parse_vtt(self):
+        """
+        Tests that WebVTT headers, comments, styles, cue identifiers and settings are skipped.
+        """
+        vtt_content = textwrap.dedent("""\
+            WEBVTT - Elephants Dream
+            Kind: captions
+
+            STYLE
+            ::cue { color: white }
+
+            NOTE This is a comment
+            spanning two lines
+
+            intro
+            00:10.500 --> 00:13.000 align:start line:0
+            Elephant's Dream
+            on two lines
+
+            01:00:15.000 --> 01:00:18.000
+            At the left we can see...""")
+        self.assertEqual(get_transcript_codec('vtt').parse(vtt_content), {
+            'start': [10500, 3615000],
+            'end': [13000, 3618000],
+            'text': ["Elephant's Dream on two lines", 'At the left we can see...'],
+        })
+
+    @data(
+        'invalid WebVTT file content',
+        'WEBVTTX\n\n00:00:01.000 --> 00:00:02.000\ntext\n',
+        'WEBVTT\n\n00:00:01,000 --> 00:00:02,000\ntext\n',
+        'WEBVTT\n\nidentifier without timing\n',
+    )
+    def test_parse_invalid_vtt(self, vtt_content):
+        """
+        Tests that parsing invalid WebVTT content raises `TranscriptsGenerationException`.
+        """
+        with self.assertRaises(TranscriptsGenerationException):
+            get_transcript_codec('vtt').parse(vtt_content)
+
+    def test_serialize_vtt(self):
+        """
+        Tests that negative times and cue text ending markers are made valid in WebVTT, and parsed back.
+        """
+        vtt_content = get_transcript_codec('vtt').serialize([(-100, 1000, 'a --> b')])
+        self.assertEqual(vtt_content, 'WEBVTT\n\n00:00:00.000 --> 00:00:01.000\na --&gt; b\n\n')
+        # The text is unescaped back, while its other markup is kept as is.
+        vtt_content = get_transcript_codec('vtt').serialize([(0, 1000, '<i>a</i> --> b &amp; c')])
+        self.assertEqual(get_transcript_codec('vtt').parse(vtt_content)['text'], ['<i>a</i> --> b &amp; c'])
+
+    @data(('srt', 1), ('vtt', 2))
+    @unpack
+    def test_codecs_convert_one_cue_at_a_time(self, output_format, first_cue_chunks):
+        """
+        Tests that cues are serialized as they are parsed, without reading the whole transcript first.
+        """
+        lines = iter(self.srt_transcript.decode('utf-8').splitlines(True))
+        cues = get_transcript_codec('srt').iter_cues(lines)
+        content_chunks = get_transcript_codec(output_format).iter_serialize(cues)
+
+        first_cue = ''.join(next(content_chunks) for __ in range(first_cue_chunks))
+        self.assertIn('Elephant&#39;s Dream', first_cue)
+        self.assertNotIn('At the left', first_cue)
+        self.assertIn('At the left we can see...\n', list(lines))
+
+    def test_register_transcript_codec(self):
+        """
+        Tests that a registered codec converts transcripts from and to the other formats.
+        """
+        @register_transcript_codec
+        class TextCodec(TranscriptCodec):
+            """
+            Codec of plain text transcripts, one cue per line.
+            """
+            file_format = 'txt'
+
+            def iter_cues(self, lines):
+                for index, line in enumerate(lines):
+                    yield index, index + 1, line.rstrip('\n')
+
+            def iter_serialize(self, cues):
+                for __, __, text in cues:
+                    yield text + '\n'
+
+        self.addCleanup(TRANSCRIPT_CODECS.pop, 'txt')
+        self.assertIsInstance(get_transcript_codec('txt'), TextCodec)
+        self.assertEqual(
+            Transcript.convert(self.srt_transcript, 'srt', 'txt'),
+            "Elephant&#39;s Dream 大象的梦想\nAt the left we can see...\n"
+        )
+        self.assertEqual(
+            Transcript.convert(b'first\nsecond\n', 'txt', 'vtt'),
+            'WEBVTT\n\n00:00:00.000 --> 00:00:00.001\nfirst\n\n00:00:00.001 --> 00:00:00.002\nsecond\n\n'
+        )
+
     def test_convert_latin1(self):
         """
         Test that we fall back to Latin-1 if the content is not proper Unicode.
@@ -110,3 +299,134 @@ class TestTranscriptUtils(TestCase):
 
         """).encode('latin-1')
         Transcript.convert(latin1_srt_transcript, 'srt', 'sjson')
+
+    @data(
+        '',
+        '1\n00:00:10,500 --> 00:00:13,000\nfirst line\nsecond line\n\n2\n00:00:15,000 --> 00:00:18,000\nlast\n',
+        '00:00:10.500 --> 00:00:13.000 X1:40 X2:600\r\nno index\r\n\r\n\r\n',
+        '1\n 00:00:1x,5 -->   1:2:3:4\n  leading spaces\n\n\n',
+        '1\n --> 00:00:13,000\nempty start\n',
+    )
+    def test_parse_srt(self, srt_content):
+        """
+        Tests that srt parsing matches the one of pysrt.
+        """
+        srt_subs = SubRipFile.from_string(srt_content, error_handling=SubRipFile.ERROR_RAISE)
+        self.assertEqual(Transcript.parse_srt(srt_content), Transcript.generate_sjson_from_srt(srt_subs))
+
+    @data(
+        'invalid SubRip file content',
+        '1\n00:00:10,500 --> 00:00:13,000\ntext\n\n2\n00:00:15 --> 00:00:18,000\ntext\n',
+        '1\n00:00:10,500 --> 00:00:13,000 --> 00:00:14,000\ntext\n',
+    )
+    def test_parse_invalid_srt(self, srt_content):
+        """
+        Tests that srt parsing raises `TranscriptsGenerationException` with the message of the pysrt error.
+        """
+        with self.assertRaises(Error) as pysrt_error:
+            SubRipFile.from_string(srt_content, error_handling=SubRipFile.ERROR_RAISE)
+
+        with self.assertRaises(TranscriptsGenerationException) as error:
+            Transcript.parse_srt(srt_content)
+
+        self.assertEqual(str(error.exception), str(pysrt_error.exception))
+
+    def test_parse_large_srt(self):
+        """
+        Tests that srt parsing matches pysrt on a large transcript.
+        """
+        srt_content = generate_large_srt()
+
+        self.assertEqual(Transcript.parse_srt(srt_content), parse_srt_with_pysrt(srt_content))
+
+    @benchmark
+    def test_parse_large_srt_speedup(self):
+        """
+        Benchmarks srt parsing against pysrt on a large transcript.
+        """
+        srt_content = generate_large_srt()
+
+        pysrt_time = min(timeit.repeat(lambda: parse_srt_with_pysrt(srt_content), number=1, repeat=3))
+        parse_time = min(timeit.repeat(lambda: Transcript.parse_srt(srt_content), number=1, repeat=3))
+
+        self.assertLess(parse_time, pysrt_time)
+
+    @data(
+        {'start': [], 'end': [], 'text': []},
+        {'start': [0, 59999, 3600000], 'end': [999, 60000, 3600000 * 150 + 1], 'text': ['a', '大象\nb', '']},
+        {'start': [-5, 1500.7], 'end': [0.4, 10 ** 12], 'text': [' x ', 5]},
+        {'start': [0, 1000], 'end': [500], 'text': ['a', 'b']},
+    )
+    def test_generate_srt_from_sjson(self, sjson_subs):
+        """
+        Tests that srt generation matches the one of pysrt.
+        """
+        self.assertEqual(Transcript.generate_srt_from_sjson(sjson_subs), generate_srt_with_pysrt(sjson_subs))
+
+    def test_generate_large_srt_from_sjson(self):
+        """
+        Tests that srt generation matches pysrt on a large transcript.
+        """
+        sjson_subs = generate_large_sjson()
+
+        self.assertEqual(Transcript.generate_srt_from_sjson(sjson_subs), generate_srt_with_pysrt(sjson_subs))
+
+    @benchmark
+    def test_generate_large_srt_from_sjson_speedup(self):
+        """
+        Benchmarks srt generation against pysrt on a large transcript.
+        """
+        sjson_subs = generate_large_sjson()
+
+        pysrt_time = min(timeit.repeat(lambda: generate_srt_with_pysrt(sjson_subs), number=1, repeat=3))
+        generate_time = min(timeit.repeat(lambda: Transcript.generate_srt_from_sjson(sjson_subs), number=1, repeat=3))
+
+        self.assertLess(generate_time, pysrt_time)
+
+    def convert_stream(self, content, input_format, output_format):
+        """
+        Converts transcript content through `Transcript.convert_stream`.
+        """
+        dst_fileobj = io.StringIO()
+        Transcript.convert_stream(io.BytesIO(content), dst_fileobj, input_format, output_format)
+        return dst_fileobj.getvalue()
+
+    @data(
+        ('srt', 'srt'),
+        ('srt', 'sjson'),
+        ('sjson', 'srt'),
+        ('sjson', 'sjson'),
+        ('vtt', 'srt'),
+        ('srt', 'vtt'),
+    )
+    @unpack
+    def test_convert_stream(self, input_format, output_format):
+        """
+        Tests that streamed conversion matches `Transcript.convert`, whatever the chunks size.
+        """
+        content = {'srt': self.srt_transcript, 'sjson': self.sjson_transcript, 'vtt': self.vtt_transcript}[input_format]
+        for chunk_size in (1, 3, 1024):
+            with patch('edxval.transcript_utils.TRANSCRIPT_CHUNK_SIZE', chunk_size):
+                self.assertEqual(
+                    self.convert_stream(content, input_format, output_format),
+                    Transcript.convert(content, input_format, output_format)
+                )
+
+    @data(
+        b'\xef\xbb\xbf0\r\n00:00:10,500 --> 00:00:13,000\r\nBOM and CRLF\r\n',
+        '0\n00:00:10,500 --> 00:00:13,000\n\u00e9l\u00e9phant\n'.encode('latin-1'),
+    )
+    def test_convert_stream_encodings(self, content):
+        """
+        Tests that streamed conversion decodes the content like `Transcript.convert`.
+        """
+        with patch('edxval.transcript_utils.TRANSCRIPT_CHUNK_SIZE', 2):
+            self.assertEqual(self.convert_stream(content, 'srt', 'sjson'), Transcript.convert(content, 'srt', 'sjson'))
+            self.assertEqual(self.convert_stream(content, 'srt', 'srt'), Transcript.convert(content, 'srt', 'srt'))
+
+    def test_convert_stream_invalid_srt(self):
+        """
+        Tests that streamed conversion of an invalid srt transcript raises `TranscriptsGenerationException`.
+        """
+        with self.assertRaises(TranscriptsGenerationException):
+            self.convert_stream(b'invalid SubRip file content', 'srt', 'sjson')
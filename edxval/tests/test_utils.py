@@ -2,12 +2,26 @@
 """
 Tests the utilities for the Video Abstraction Layer
 """
+from unittest.mock import patch
+
+from ddt import data, ddt, unpack
+from django.conf import settings
 from django.core.files.base import ContentFile
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from pysrt.srtexc import Error
 
-from edxval.utils import generate_file_content_hash, is_duplicate_file
+from edxval.tests import constants
+from edxval.utils import (
+    TranscriptFormat,
+    generate_file_content_hash,
+    get_transcript_format,
+    get_video_image_storage,
+    get_video_transcript_storage,
+    is_duplicate_file,
+)
 
 
+@ddt
 class UtilityTests(TestCase):
     """
     Tests utility methods
@@ -49,3 +63,82 @@ class UtilityTests(TestCase):
         other_file_data = ContentFile(other_file_content)
 
         self.assertFalse(is_duplicate_file(file_data, other_file_data))
+
+    @data(
+        (constants.TRANSCRIPT_DATA['flash'], TranscriptFormat.SRT),
+        (constants.TRANSCRIPT_DATA['wow'], TranscriptFormat.SJSON),
+        ('\n\n1\n00:00:01,000 --> 00:00:02,000\nLeading blank lines\n', TranscriptFormat.SRT),
+        ('00:00:01.000 --> 00:00:02.000\nNo index\n', TranscriptFormat.SRT),
+        ('WEBVTT\n\n00:01.000 --> 00:02.000\nWebVTT\n', TranscriptFormat.VTT),
+        # Content without any cue is not SRT.
+        ('', TranscriptFormat.SJSON),
+    )
+    @unpack
+    def test_get_transcript_format(self, transcript_content, expected_format):
+        """
+        Tests that `get_transcript_format` tells SRT, SJSON and WebVTT transcripts apart.
+        """
+        self.assertEqual(get_transcript_format(transcript_content), expected_format)
+
+    @data(
+        (constants.TRANSCRIPT_DATA['flash'], TranscriptFormat.SRT, 'edxval.utils.json.loads'),
+        (constants.TRANSCRIPT_DATA['wow'], TranscriptFormat.SJSON, 'edxval.utils.Transcript.parse_srt'),
+        ('WEBVTT\n\n00:01.000 --> 00:02.000\nWebVTT\n', TranscriptFormat.VTT, 'edxval.utils.Transcript.parse_srt'),
+    )
+    @unpack
+    def test_get_transcript_format_parses_once(self, transcript_content, expected_format, other_parser):
+        """
+        Tests that transcripts are only parsed by the parser of the format told from their prefix.
+        """
+        with patch(other_parser) as parse:
+            self.assertEqual(get_transcript_format(transcript_content), expected_format)
+        parse.assert_not_called()
+
+    @data(
+        'invalid transcript',
+        '1\ninvalid SRT cue\n',
+        '1\n00:00:00,000 --> 00:00:01,000\nhi\n\n2\ngarbage line\nmore\n',
+        '{"start": [1',
+        '{"start": [1, 2], "end": ',
+        'WEBVTT\n\ninvalid cue\n',
+    )
+    def test_get_transcript_format_invalid(self, transcript_content):
+        """
+        Tests that `get_transcript_format` raises a pysrt error on invalid transcripts, whatever their prefix.
+        """
+        with self.assertRaises(Error):
+            get_transcript_format(transcript_content)
+
+
+class StorageTests(TestCase):
+    """
+    Tests the memoized storage backends
+    """
+    def test_storage_is_reused(self):
+        """
+        Tests that the same storage instance is returned while the settings are unchanged.
+        """
+        self.assertIs(get_video_image_storage(), get_video_image_storage())
+        self.assertIs(get_video_transcript_storage(), get_video_transcript_storage())
+        self.assertIsNot(get_video_image_storage(), get_video_transcript_storage())
+
+    def test_storage_is_rebuilt_on_settings_update(self):
+        """
+        Tests that a new storage instance is built with the updated settings.
+        """
+        storage = get_video_image_storage()
+        image_settings = dict(settings.VIDEO_IMAGE_SETTINGS, STORAGE_KWARGS={'base_url': '/other/'})
+        with override_settings(VIDEO_IMAGE_SETTINGS=image_settings):
+            other_storage = get_video_image_storage()
+            self.assertIsNot(other_storage, storage)
+            self.assertEqual(other_storage.url('image.jpg'), '/other/image.jpg')
+
+        self.assertIsNot(get_video_image_storage(), other_storage)
+
+    def test_storage_is_reset_on_setting_changed(self):
+        """
+        Tests that the memoized storage instances are dropped when a setting is changed.
+        """
+        storage = get_video_transcript_storage()
+        with override_settings(VIDEO_TRANSCRIPTS_SETTINGS=settings.VIDEO_TRANSCRIPTS_SETTINGS):
+            self.assertIsNot(get_video_transcript_storage(), storage)
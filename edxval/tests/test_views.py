@@ -7,13 +7,16 @@ import json
 from unittest.mock import patch
 
 from ddt import data, ddt, unpack
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
 from edxval.models import CourseVideo, EncodedVideo, Profile, TranscriptProviderType, Video, VideoTranscript
 from edxval.serializers import TranscriptSerializer
 from edxval.tests import APIAuthTestCase, constants
-from edxval.utils import TranscriptFormat
+from edxval.utils import TranscriptFormat, encode_cursor
 
 
 class VideoDetail(APIAuthTestCase):
@@ -649,7 +652,7 @@ class VideoListTest(APIAuthTestCase):
         Tests number of queries for a Video/EncodedVideo(2) pair
         """
         url = reverse('video-list')
-        with self.assertNumQueries(13):
+        with self.assertNumQueries(12):
             self.client.post(url, constants.COMPLETE_SET_FISH, format='json')
 
     def test_queries_for_single_encoded_videos(self):
@@ -661,6 +664,61 @@ class VideoListTest(APIAuthTestCase):
             self.client.post(url, constants.COMPLETE_SET_STAR, format='json')
 
 
+class VideoBulkCreateTest(APIAuthTestCase):
+    """
+    Tests the creation of many Videos via POST
+    """
+    def setUp(self):
+        """
+        Used for manually creating profile objects which EncodedVideos require.
+        """
+        Profile.objects.create(profile_name=constants.PROFILE_MOBILE)
+        Profile.objects.create(profile_name=constants.PROFILE_DESKTOP)
+        super().setUp()
+        self.url = reverse('video-bulk-create')
+
+    def test_create_videos(self):
+        """
+        Tests POSTing many valid videos
+        """
+        response = self.client.post(
+            self.url, [constants.COMPLETE_SET_FISH, constants.COMPLETE_SET_STAR], format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, [
+            {'edx_video_id': constants.COMPLETE_SET_FISH['edx_video_id'], 'errors': None},
+            {'edx_video_id': constants.COMPLETE_SET_STAR['edx_video_id'], 'errors': None},
+        ])
+        self.assertEqual(Video.objects.count(), 2)
+        self.assertEqual(EncodedVideo.objects.count(), 3)
+
+    def test_create_some_videos(self):
+        """
+        Tests POSTing valid and invalid videos
+        """
+        response = self.client.post(
+            self.url, [constants.COMPLETE_SET_FISH, constants.VIDEO_DICT_INVALID_ID], format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertIsNone(response.data[0]['errors'])
+        self.assertIn('edx_video_id', response.data[1]['errors'])
+        self.assertEqual(Video.objects.count(), 1)
+
+    def test_create_no_videos(self):
+        """
+        Tests POSTing only invalid videos
+        """
+        response = self.client.post(self.url, [constants.VIDEO_DICT_INVALID_ID], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('edx_video_id', response.data[0]['errors'])
+
+        response = self.client.post(self.url, constants.COMPLETE_SET_FISH, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['message'], 'A list of videos must be specified.')
+        self.assertEqual(Video.objects.count(), 0)
+
+
+@ddt
 class VideoDetailTest(APIAuthTestCase):
     """
     Tests for GET
@@ -698,13 +756,71 @@ class VideoDetailTest(APIAuthTestCase):
             self.client.get("/edxval/videos/")
         response = self.client.post(url, constants.COMPLETE_SET_FISH, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        with self.assertNumQueries(9):
+        with self.assertNumQueries(7):
             self.client.get("/edxval/videos/")
         response = self.client.post(url, constants.COMPLETE_SET_STAR, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        with self.assertNumQueries(10):
+        with self.assertNumQueries(7):
             self.client.get("/edxval/videos/")
 
+    def test_get_videos_by_cursor(self):
+        """
+        Tests GETting all Video objects page by page
+        """
+        url = reverse('video-list')
+        for index in range(5):
+            response = self.client.post(
+                url, dict(constants.VIDEO_DICT_ZEBRA, edx_video_id=f'video-{index}'), format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        edx_video_ids = []
+        next_url = url + '?page_size=2'
+        while next_url:
+            response = self.client.get(next_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 2)
+            edx_video_ids.extend(video['edx_video_id'] for video in response.data['results'])
+            next_url = response.data['next']
+
+        self.assertEqual(edx_video_ids, [f'video-{index}' for index in range(5)])
+
+    @data(
+        ({'page_size': 'a'}, status.HTTP_400_BAD_REQUEST),
+        ({'page_size': 0}, status.HTTP_400_BAD_REQUEST),
+        ({'page_size': 1, 'cursor': 'invalid'}, status.HTTP_404_NOT_FOUND),
+        # A well-formed cursor with values of the wrong type for the ordering fields.
+        ({'page_size': 1, 'cursor': encode_cursor(['foo', 'bar'])}, status.HTTP_404_NOT_FOUND),
+        ({'page_size': 1, 'cursor': encode_cursor([[], {}])}, status.HTTP_404_NOT_FOUND),
+    )
+    @unpack
+    def test_get_videos_by_invalid_cursor(self, params, status_code):
+        """
+        Tests GETting a page of Video objects with invalid parameters
+        """
+        response = self.client.get(reverse('video-list'), params)
+        self.assertEqual(response.status_code, status_code)
+
+    def test_queries_for_get_course_videos(self):
+        """
+        Tests that the number of queries when GETting the videos of a course does not depend on the video count
+        """
+        url = reverse('video-list')
+        for index in range(3):
+            video_data = dict(
+                constants.COMPLETE_SET_FISH,
+                edx_video_id=f'video-{index}',
+                courses=[{'test-course': f'image-{index}.jpg'}]
+            )
+            response = self.client.post(url, video_data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+            # session, user, permissions (2), videos, encoded videos, course videos, video images
+            with self.assertNumQueries(8):
+                videos = self.client.get(url, {'course': 'test-course'}).data
+
+            self.assertEqual(len(videos), index + 1)
+
 
 @ddt
 class VideoImagesViewTest(APIAuthTestCase):
@@ -990,6 +1106,93 @@ class VideoStatusViewTest(APIAuthTestCase):
         self.assertIsNone(self.video.error_description)
 
 
+@ddt
+class VideoBulkStatusViewTest(APIAuthTestCase):
+    """
+    VideoBulkStatusView Tests.
+    """
+    def setUp(self):
+        """
+        Tests setup.
+        """
+        self.url = reverse('video-bulk-status-update')
+        Video.objects.create(**constants.VIDEO_DICT_FISH)
+        Video.objects.create(**constants.VIDEO_DICT_STAR)
+        super().setUp()
+
+    def test_update_videos_status(self):
+        """
+        Tests updating the status of many videos
+        """
+        response = self.client.patch(
+            self.url,
+            [
+                {'edx_video_id': constants.VIDEO_DICT_FISH['edx_video_id'], 'status': 'transcript_ready'},
+                {
+                    'edx_video_id': constants.VIDEO_DICT_STAR['edx_video_id'],
+                    'status': 'transcript_failed',
+                    'error_description': 'Transcription failed',
+                },
+            ],
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [
+            {'edx_video_id': constants.VIDEO_DICT_FISH['edx_video_id'], 'errors': None},
+            {'edx_video_id': constants.VIDEO_DICT_STAR['edx_video_id'], 'errors': None},
+        ])
+        star_video = Video.objects.get(edx_video_id=constants.VIDEO_DICT_STAR['edx_video_id'])
+        self.assertEqual(star_video.status, 'transcript_failed')
+        self.assertEqual(star_video.error_description, 'Transcription failed')
+        self.assertEqual(
+            Video.objects.get(edx_video_id=constants.VIDEO_DICT_FISH['edx_video_id']).status,
+            'transcript_ready'
+        )
+
+    @data(
+        ({}, '"edx_video_id and status" params must be specified.'),
+        ({'edx_video_id': 'super-soaker', 'status': 'fake'}, '"fake" is not a valid Video status.'),
+        ({'edx_video_id': 'fake', 'status': 'transcript_ready'}, 'Video is not found for specified edx_video_id: fake'),
+        ({'edx_video_id': ['fake'], 'status': 'transcript_ready'}, '"edx_video_id" params must be strings.'),
+        (
+            {'edx_video_id': 'fake', 'status': {}, 'error_description': 1},
+            '"status and error_description" params must be strings.'
+        ),
+    )
+    @unpack
+    def test_update_some_videos_status(self, status_update, error):
+        """
+        Tests that invalid status updates are reported while the valid ones are applied
+        """
+        response = self.client.patch(
+            self.url,
+            [status_update, {'edx_video_id': constants.VIDEO_DICT_STAR['edx_video_id'], 'status': 'file_complete'}],
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.data[0]['errors'], error)
+        self.assertIsNone(response.data[1]['errors'])
+        self.assertEqual(
+            Video.objects.get(edx_video_id=constants.VIDEO_DICT_STAR['edx_video_id']).status,
+            'file_complete'
+        )
+
+    @data(
+        {'edx_video_id': 'super-soaker', 'status': 'transcript_ready'},
+        ['not a status update'],
+    )
+    def test_update_no_videos_status(self, patch_data):
+        """
+        Tests that nothing is updated for invalid data
+        """
+        response = self.client.patch(self.url, patch_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            Video.objects.get(edx_video_id=constants.VIDEO_DICT_FISH['edx_video_id']).status,
+            constants.VIDEO_DICT_FISH['status']
+        )
+
+
 @ddt
 class HLSMissingVideoViewTest(APIAuthTestCase):
     """
@@ -1063,6 +1266,59 @@ class HLSMissingVideoViewTest(APIAuthTestCase):
         response = json.loads(response.content.decode('utf-8'))
         self.assertEqual(response['videos'], expected_video_ids[offset: offset + batch_size])
 
+    @data(1, 2, 3)
+    def test_videos_list_missing_hls_encodes_by_cursor(self, batch_size):
+        """
+        Test that videos that are missing HLS encodes are returned correctly batch by batch, without counting them.
+        """
+        video_ids = []
+        cursor = None
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, {'batch_size': batch_size, 'cursor': cursor}, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertFalse([query for query in queries.captured_queries if 'COUNT(' in query['sql']])
+            self.assertNotIn('total', response.data)
+            self.assertLessEqual(len(response.data['videos']), batch_size)
+            video_ids.extend(response.data['videos'])
+            cursor = response.data['cursor']
+            if cursor is None:
+                break
+
+        self.assertEqual(video_ids, ['video-wo-hls1', 'video-wo-hls2'])
+
+    def test_videos_list_missing_hls_encodes_by_cursor_with_total(self):
+        """
+        Test that videos that are missing HLS encodes are counted when requested.
+        """
+        response = self.client.post(
+            self.url, {'batch_size': 1, 'cursor': None, 'include_total': True}, format='json'
+        )
+        self.assertEqual(response.data['videos'], ['video-wo-hls1'])
+        self.assertEqual(response.data['total'], 2)
+
+    def test_videos_list_missing_hls_encodes_by_invalid_cursor(self):
+        """
+        Test that an invalid cursor is rejected.
+        """
+        response = self.client.post(self.url, {'batch_size': 1, 'cursor': 'invalid'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_videos_list_missing_other_profile_encodes(self):
+        """
+        Test that videos that are missing encodes of another profile are returned correctly.
+        """
+        response = self.client.post(
+            self.url, {'batch_size': 10, 'cursor': None, 'profile': constants.PROFILE_DESKTOP}, format='json'
+        )
+        self.assertEqual(response.data['videos'], ['video-w-hls1', 'video-w-hls2'])
+
+        response = self.client.post(
+            self.url, {'courses': ['test-course-1'], 'profile': constants.PROFILE_DESKTOP}, format='json'
+        )
+        self.assertEqual(response.data['videos'], [])
+
     def test_videos_list_missing_hls_encodes_for_courses(self):
         """
         Test that videos that are missing HLS encodes are returned correctly for the specified courses.
@@ -1128,6 +1384,66 @@ class CourseTranscriptsDetailViewTest(APIAuthTestCase):
 
             self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_ndjson_response(self):
+        """
+        Test that the ndjson format streams one line per course video
+        """
+        transcript_details = [
+            ('video-1', {'en': {'provider': 'Custom', 'content': b'transcript'}}),
+            ('video-2', {}),
+        ]
+        with patch(
+            'edxval.views.iter_transcript_details_for_course', return_value=iter(transcript_details)
+        ) as mock_transcript_details, patch(
+            'edxval.views.get_transcript_details_for_course'
+        ) as mock_bundled_transcript_details:
+            course_id = 'course-v1:edx+1+2023_05'
+            url = reverse(self.base_url, args=[course_id])
+            response = self.client.get(url, {'format': 'ndjson'})
+
+            mock_transcript_details.assert_called_once_with(course_id)
+            mock_bundled_transcript_details.assert_not_called()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [
+                {'video-1': {'en': {'provider': 'Custom', 'content': 'transcript'}}},
+                {'video-2': {}},
+            ]
+        )
+
+    def test_ndjson_response_with_transcripts(self):
+        """
+        Test that the streamed ndjson lines match the bundled response
+        """
+        video = Video.objects.create(**constants.VIDEO_DICT_FISH)
+        CourseVideo.objects.create(video=video, course_id='test-course')
+        transcript = VideoTranscript.create(
+            video=video,
+            language_code='en',
+            file_format=TranscriptFormat.SRT,
+            content=ContentFile(constants.TRANSCRIPT_DATA['overwatch']),
+            provider=TranscriptProviderType.CUSTOM,
+        )
+        self.addCleanup(transcript.transcript.delete)
+        url = reverse(self.base_url, args=['test-course'])
+
+        bundled_response = self.client.get(url)
+        streamed_response = self.client.get(url, HTTP_ACCEPT='application/x-ndjson')
+
+        streamed_data = {}
+        for line in b''.join(streamed_response.streaming_content).splitlines():
+            streamed_data.update(json.loads(line))
+        self.assertEqual(streamed_data, bundled_response.json())
+        self.assertEqual(
+            streamed_data[video.edx_video_id]['en']['content'],
+            constants.TRANSCRIPT_DATA['overwatch']
+        )
+
 
 class CourseVideoIDsViewTest(APIAuthTestCase):
     """
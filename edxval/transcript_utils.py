@@ -1,15 +1,47 @@
 """
 A module containing transcripts utils.
 """
-# pylint: disable=inconsistent-return-statements
 
+import codecs
 import json
-
-from pysrt import SubRipFile, SubRipItem, SubRipTime
-from pysrt.srtexc import Error
+import re
+from abc import ABC, abstractmethod
+from itertools import chain
 
 from edxval.exceptions import TranscriptsGenerationException
 
+SRT_TIMESTAMP_SEPARATOR = '-->'
+SRT_TIME_FORMAT = '%02d:%02d:%02d,%03d'
+SRT_CUE_FORMAT = '%s\n%s --> %s\n%s\n\n'
+# The common "HH:MM:SS,mmm --> HH:MM:SS,mmm" timing line and timestamp, other ones are parsed like pysrt does.
+SRT_TIMING_REGEX = re.compile(
+    r'[ \t]*([0-9]+)[:.,]([0-9]+)[:.,]([0-9]+)[:.,]([0-9]+)[ \t]*-->[ \t]*'
+    r'([0-9]+)[:.,]([0-9]+)[:.,]([0-9]+)[:.,]([0-9]+)(?: (?!.*-->).*)?'
+)
+SRT_TIME_REGEX = re.compile(r'([0-9]+)[:.,]([0-9]+)[:.,]([0-9]+)[:.,]([0-9]+)')
+SRT_TIME_SEPARATOR_REGEX = re.compile(r'[:.,]')
+SRT_INTEGER_REGEX = re.compile(r'\d+')
+VTT_SIGNATURE = 'WEBVTT'
+VTT_TIME_FORMAT = '%02d:%02d:%02d.%03d'
+VTT_CUE_FORMAT = '%s --> %s\n%s\n\n'
+# Timing line of a WebVTT cue, "[HH:]MM:SS.mmm --> [HH:]MM:SS.mmm", optionally followed by cue settings.
+VTT_TIMING_REGEX = re.compile(
+    r'[ \t]*(?:([0-9]+):)?([0-9]{2}):([0-9]{2})\.([0-9]{3})[ \t]+-->[ \t]+'
+    r'(?:([0-9]+):)?([0-9]{2}):([0-9]{2})\.([0-9]{3})(?:[ \t].*)?'
+)
+# Blocks of a WebVTT file which are not cues.
+VTT_NON_CUE_BLOCKS = ('NOTE', 'STYLE', 'REGION')
+# "-->" can not appear in WebVTT cue texts, where it is escaped as "--&gt;".
+VTT_TIMESTAMP_SEPARATOR_ESCAPE = '--&gt;'
+# Size of the chunks read from transcript files by `Transcript.convert_stream`.
+TRANSCRIPT_CHUNK_SIZE = 64 * 1024
+
+
+class InvalidSrtCue(ValueError):
+    """
+    Raised when an SRT cue can not be parsed.
+    """
+
 
 class Transcript:
     """
@@ -17,6 +49,7 @@ class Transcript:
     """
     SRT = 'srt'
     SJSON = 'sjson'
+    VTT = 'vtt'
 
     @staticmethod
     def generate_sjson_from_srt(srt_subs):
@@ -44,8 +77,8 @@ class Transcript:
         }
         return sjson_subs
 
-    @staticmethod
-    def generate_srt_from_sjson(sjson_subs):
+    @classmethod
+    def generate_srt_from_sjson(cls, sjson_subs):
         """
         Generate transcripts from sjson to SubRip (*.srt)
 
@@ -55,22 +88,152 @@ class Transcript:
         Returns:
             Subtitles in SRT format.
         """
-        output = ''
+        return ''.join(cls.iter_srt_from_sjson(sjson_subs))
+
+    @classmethod
+    def iter_srt_from_sjson(cls, sjson_subs):
+        """
+        Yields the SubRip (*.srt) cues of sjson subs, formatted like pysrt does.
+
+        Arguments:
+            sjson_subs (dict): `sjson` subs.
+        """
+        return cls.iter_srt_from_cues(iter_sjson_cues(sjson_subs))
+
+    @classmethod
+    def iter_srt_from_cues(cls, cues):
+        """
+        Yields the SubRip (*.srt) cues of (start time, end time, text) cues, formatted like pysrt does.
+        """
+        for index, (start, end, text) in enumerate(cues):
+            yield SRT_CUE_FORMAT % (index, cls._format_srt_time(start), cls._format_srt_time(end), text)
+
+    @staticmethod
+    def _format_srt_time(milliseconds):
+        """
+        Returns the SRT timestamp of a time in milliseconds.
+        """
+        # Negative times are represented as zero.
+        milliseconds = max(milliseconds, 0)
+
+        # %d also truncates float times, as pysrt does.
+        return SRT_TIME_FORMAT % (
+            milliseconds // 3600000,
+            milliseconds % 3600000 // 60000,
+            milliseconds % 60000 // 1000,
+            milliseconds % 1000,
+        )
+
+    @classmethod
+    def parse_srt(cls, srt_content):
+        """
+        Parses SubRip (*.srt) transcript content into "SJSON" subs in a single pass.
+
+        The cues are parsed like `pysrt.SubRipFile.from_string` does with `ERROR_RAISE`
+        error handling, without building pysrt objects for each cue.
+
+        Arguments:
+            srt_content (str): "SRT" transcript content.
+
+        Returns:
+            "SJSON" subs dict of start and end times in milliseconds and texts.
+
+        Raises:
+            TranscriptsGenerationException: if a cue can not be parsed.
+        """
+        return generate_sjson_from_cues(cls.iter_srt_cues(srt_content.splitlines(True)))
+
+    @classmethod
+    def iter_srt_cues(cls, lines):
+        """
+        Yields the start time, end time and single line text of each SubRip (*.srt) cue.
+
+        Arguments:
+            lines (iterable): "SRT" transcript lines, with their line endings.
+
+        Raises:
+            TranscriptsGenerationException: if a cue can not be parsed.
+        """
+        cue_lines = []
+        # A trailing blank line ends the last cue.
+        for line_index, line in enumerate(chain(lines, ('\n',))):
+            if line.strip():
+                cue_lines.append(line)
+                continue
+            if not cue_lines:
+                continue
 
-        equal_len = len(sjson_subs['start']) == len(sjson_subs['end']) == len(sjson_subs['text'])
-        if not equal_len:
-            return output
+            try:
+                yield cls._parse_srt_cue(cue_lines)
+            except InvalidSrtCue as error:
+                # Same message as the pysrt errors.
+                raise TranscriptsGenerationException(str((line_index, ''.join(cue_lines)))) from error
 
-        for i in range(len(sjson_subs['start'])):
-            item = SubRipItem(
-                index=i,
-                start=SubRipTime(milliseconds=sjson_subs['start'][i]),
-                end=SubRipTime(milliseconds=sjson_subs['end'][i]),
-                text=sjson_subs['text'][i]
+            cue_lines = []
+
+    @classmethod
+    def _parse_srt_cue(cls, cue_lines):
+        """
+        Returns the start time, end time and single line text of an SRT cue.
+        """
+        if len(cue_lines) < 2:
+            raise InvalidSrtCue()
+
+        cue_lines = [line.rstrip() for line in cue_lines]
+        # The index line is optional.
+        if SRT_TIMESTAMP_SEPARATOR not in cue_lines[0]:
+            del cue_lines[0]
+
+        text = ' '.join(cue_lines[1:])
+        match = SRT_TIMING_REGEX.fullmatch(cue_lines[0])
+        if match:
+            (
+                start_hours, start_minutes, start_seconds, start_milliseconds,
+                end_hours, end_minutes, end_seconds, end_milliseconds
+            ) = map(int, match.groups())
+            return (
+                ((start_hours * 60 + start_minutes) * 60 + start_seconds) * 1000 + start_milliseconds,
+                ((end_hours * 60 + end_minutes) * 60 + end_seconds) * 1000 + end_milliseconds,
+                text,
             )
-            output += (str(item))
-            output += '\n'
-        return output
+
+        timestamps = cue_lines[0].split(SRT_TIMESTAMP_SEPARATOR)
+        if len(timestamps) != 2:
+            raise InvalidSrtCue()
+
+        start, end_and_position = timestamps
+        end = end_and_position.lstrip().split(' ', 1)[0]
+        return cls._parse_srt_time(start.strip()), cls._parse_srt_time(end.strip()), text
+
+    @staticmethod
+    def _parse_srt_time(time_string):
+        """
+        Returns an SRT timestamp in milliseconds.
+        """
+        if not time_string:
+            return 0
+
+        match = SRT_TIME_REGEX.fullmatch(time_string)
+        if match:
+            hours, minutes, seconds, milliseconds = map(int, match.groups())
+        else:
+            time_parts = SRT_TIME_SEPARATOR_REGEX.split(time_string)
+            if len(time_parts) != 4:
+                raise InvalidSrtCue()
+            hours, minutes, seconds, milliseconds = map(Transcript._parse_srt_integer, time_parts)
+
+        return ((hours * 60 + minutes) * 60 + seconds) * 1000 + milliseconds
+
+    @staticmethod
+    def _parse_srt_integer(digits):
+        """
+        Returns the integer value of a timestamp part, using its leading digits when it is not an integer.
+        """
+        try:
+            return int(digits)
+        except ValueError:
+            match = SRT_INTEGER_REGEX.match(digits)
+            return int(match.group()) if match else 0
 
     @classmethod
     def convert(cls, content, input_format, output_format):
@@ -82,15 +245,15 @@ class Transcript:
             input_format: Input transcript format.
             output_format: Output transcript format.
 
-        Accepted input formats: sjson, srt.
-        Accepted output format: srt, sjson.
+        Accepted input and output formats are the ones of the registered
+        transcript codecs: sjson, srt and vtt by default.
 
         Raises:
-            TranscriptsGenerationException: On parsing the invalid srt
-            content during conversion from srt to sjson.
+            TranscriptsGenerationException: On parsing the invalid
+            content during conversion from its input format.
         """
-        assert input_format in ('srt', 'sjson')
-        assert output_format in ('srt', 'sjson')
+        assert input_format in TRANSCRIPT_CODECS
+        assert output_format in TRANSCRIPT_CODECS
 
         # Decode the content with utf-8-sig which will also
         # skip byte order mark(BOM) character if found.
@@ -104,19 +267,300 @@ class Transcript:
         if input_format == output_format:
             return content
 
-        if input_format == 'srt':
+        # Every conversion goes through the (start time, end time, text) cues of the transcript.
+        cues = get_transcript_codec(input_format).iter_content_cues(content)
+        return get_transcript_codec(output_format).serialize(cues)
+
+    @classmethod
+    def convert_stream(cls, src_fileobj, dst_fileobj, input_format, output_format):
+        """
+        Convert a transcript from the `src_fileobj` file to the `dst_fileobj` file.
 
-            if output_format == 'sjson':
-                try:
-                    # With error handling (set to 'ERROR_RAISE'), we will be getting
-                    # the exception if something went wrong in parsing the transcript.
-                    srt_subs = SubRipFile.from_string(content, error_handling=SubRipFile.ERROR_RAISE)
-                except Error as ex:  # Base exception from pysrt
-                    raise TranscriptsGenerationException(str(ex)) from ex
+        The content is decoded incrementally, with the same fallback to latin-1 as `convert`, and
+        parsed line by line into cues, which are written one at a time so that whole transcripts
+        are not held in memory. "SJSON" transcripts are a single JSON document, so they are still
+        loaded or built at once.
 
-                return json.dumps(cls.generate_sjson_from_srt(srt_subs))
+        Arguments:
+            src_fileobj: Binary file object of the transcript content, seekable to check its encoding.
+            dst_fileobj: Text file object the converted transcript is written to.
+            input_format: Input transcript format.
+            output_format: Output transcript format.
+
+        Raises:
+            TranscriptsGenerationException: On parsing the invalid
+            content during conversion from its input format.
+        """
+        assert input_format in TRANSCRIPT_CODECS
+        assert output_format in TRANSCRIPT_CODECS
+
+        content_chunks = cls._iter_decoded_chunks(src_fileobj)
+
+        if input_format == output_format:
+            for content_chunk in content_chunks:
+                dst_fileobj.write(content_chunk)
+            return
+
+        cues = get_transcript_codec(input_format).iter_cues(cls._iter_lines(content_chunks))
+        for content_chunk in get_transcript_codec(output_format).iter_serialize(cues):
+            dst_fileobj.write(content_chunk)
+
+    @staticmethod
+    def _iter_decoded_chunks(src_fileobj):
+        """
+        Yields the decoded chunks of a transcript file, which is read twice to find its encoding.
+        """
+        start_position = src_fileobj.tell()
+        decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        encoding = 'utf-8-sig'
+        try:
+            for chunk in iter(lambda: src_fileobj.read(TRANSCRIPT_CHUNK_SIZE), b''):
+                decoder.decode(chunk)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            # Same fallback as `convert` for Latin-1 encoded transcripts.
+            encoding = 'latin-1'
+
+        src_fileobj.seek(start_position)
+        yield from codecs.iterdecode(iter(lambda: src_fileobj.read(TRANSCRIPT_CHUNK_SIZE), b''), encoding)
+
+    @staticmethod
+    def _iter_lines(content_chunks):
+        """
+        Yields the lines of content chunks, with their line endings, like `str.splitlines(True)` does.
+        """
+        pending = ''
+        for content_chunk in content_chunks:
+            lines = (pending + content_chunk).splitlines(True)
+            # The last line may go on in the next chunk, even a "\r" line ending followed by "\n".
+            pending = lines.pop() if lines else ''
+            yield from lines
 
-        if input_format == 'sjson':
+        if pending:
+            yield pending
 
-            if output_format == 'srt':
-                return cls.generate_srt_from_sjson(json.loads(content))
+
+def generate_sjson_from_cues(cues):
+    """
+    Returns the "SJSON" subs of (start time, end time, text) cues.
+    """
+    sub_starts = []
+    sub_ends = []
+    sub_texts = []
+    for start, end, text in cues:
+        sub_starts.append(start)
+        sub_ends.append(end)
+        sub_texts.append(text)
+
+    return {
+        'start': sub_starts,
+        'end': sub_ends,
+        'text': sub_texts
+    }
+
+
+def iter_sjson_cues(sjson_subs):
+    """
+    Yields the (start time, end time, text) cues of "SJSON" subs, none if their lists have different lengths.
+    """
+    starts, ends, texts = sjson_subs['start'], sjson_subs['end'], sjson_subs['text']
+    if len(starts) == len(ends) == len(texts):
+        yield from zip(starts, ends, texts)
+
+
+# Registered transcript codecs, by transcript format.
+TRANSCRIPT_CODECS = {}
+
+
+def register_transcript_codec(codec_class):
+    """
+    Class decorator registering a transcript codec for its `file_format`.
+    """
+    TRANSCRIPT_CODECS[codec_class.file_format] = codec_class()
+    return codec_class
+
+
+def get_transcript_codec(file_format):
+    """
+    Returns the registered transcript codec of a transcript format.
+
+    Raises:
+        KeyError: if no codec is registered for the format.
+    """
+    return TRANSCRIPT_CODECS[file_format]
+
+
+class TranscriptCodec(ABC):
+    """
+    Base class of the codecs parsing a transcript format into cues and serializing cues back.
+
+    Cues are the intermediate representation of every conversion, (start time, end time, text)
+    tuples with times in milliseconds and single line texts, so that a new format only needs its
+    own codec to be converted from and to all the others. They are iterated over one at a time,
+    so that formats made of separate cues are converted without holding whole transcripts.
+    """
+    file_format = None
+
+    @abstractmethod
+    def iter_cues(self, lines):
+        """
+        Yields the cues of an iterable of transcript lines, with their line endings.
+        """
+
+    def iter_content_cues(self, content):
+        """
+        Yields the cues of decoded transcript content.
+        """
+        return self.iter_cues(content.splitlines(True))
+
+    def parse(self, content):
+        """
+        Returns the "SJSON" subs of decoded transcript content.
+        """
+        return generate_sjson_from_cues(self.iter_content_cues(content))
+
+    @abstractmethod
+    def iter_serialize(self, cues):
+        """
+        Yields the chunks of the transcript content of an iterable of cues.
+        """
+
+    def serialize(self, cues):
+        """
+        Returns the transcript content of an iterable of cues.
+        """
+        return ''.join(self.iter_serialize(cues))
+
+
+@register_transcript_codec
+class SjsonCodec(TranscriptCodec):
+    """
+    Codec of "SJSON" transcripts, a single JSON document of all the cues.
+    """
+    file_format = Transcript.SJSON
+
+    def iter_cues(self, lines):
+        return self.iter_content_cues(''.join(lines))
+
+    def iter_content_cues(self, content):
+        return iter_sjson_cues(json.loads(content))
+
+    def iter_serialize(self, cues):
+        yield json.dumps(generate_sjson_from_cues(cues))
+
+
+@register_transcript_codec
+class SrtCodec(TranscriptCodec):
+    """
+    Codec of SubRip (*.srt) transcripts.
+    """
+    file_format = Transcript.SRT
+
+    def iter_cues(self, lines):
+        return Transcript.iter_srt_cues(lines)
+
+    def iter_serialize(self, cues):
+        return Transcript.iter_srt_from_cues(cues)
+
+
+@register_transcript_codec
+class VttCodec(TranscriptCodec):
+    """
+    Codec of WebVTT (*.vtt) transcripts.
+
+    Cue identifiers, settings and the NOTE, STYLE and REGION blocks are not kept in cues. Cue texts
+    are kept as markup, like SRT texts, except for the escaped "-->" which is unescaped.
+    """
+    file_format = Transcript.VTT
+
+    def iter_cues(self, lines):
+        """
+        Yields the start time, end time and single line text of each WebVTT cue.
+
+        Raises:
+            TranscriptsGenerationException: if the content is not WebVTT or a cue can not be parsed.
+        """
+        lines = iter(lines)
+        if not self.is_signature(next(lines, '')):
+            raise TranscriptsGenerationException('WebVTT transcripts must start with a WEBVTT line.')
+
+        # The block of the signature line is the header of the file.
+        in_header = True
+        block_lines = []
+        # A trailing blank line ends the last block.
+        for line_index, line in enumerate(chain(lines, ('\n',)), start=1):
+            line = line.rstrip()
+            if line:
+                if not in_header:
+                    block_lines.append(line)
+                continue
+
+            in_header = False
+            if block_lines and not self._is_non_cue_block(block_lines[0]):
+                cue = self._parse_cue(block_lines)
+                if cue is None:
+                    raise TranscriptsGenerationException(str((line_index, '\n'.join(block_lines))))
+                yield cue
+
+            block_lines = []
+
+    @staticmethod
+    def is_signature(line):
+        """
+        Returns whether a line is the WEBVTT signature line starting WebVTT content.
+        """
+        return line.startswith(VTT_SIGNATURE) and line[len(VTT_SIGNATURE):][:1] in ('', ' ', '\t', '\r', '\n')
+
+    @staticmethod
+    def _is_non_cue_block(first_line):
+        """
+        Returns whether a block is a NOTE, STYLE or REGION block.
+        """
+        keyword = first_line.split(None, 1)[0]
+        return keyword in VTT_NON_CUE_BLOCKS and first_line[len(keyword):][:1] in ('', ' ', '\t')
+
+    @classmethod
+    def _parse_cue(cls, block_lines):
+        """
+        Returns the start time, end time and single line text of a cue block, or None if it can not be parsed.
+        """
+        # The cue identifier line is optional.
+        timing_index = 0 if '-->' in block_lines[0] else 1
+        if timing_index >= len(block_lines):
+            return None
+
+        match = VTT_TIMING_REGEX.fullmatch(block_lines[timing_index])
+        if not match:
+            return None
+
+        (
+            start_hours, start_minutes, start_seconds, start_milliseconds,
+            end_hours, end_minutes, end_seconds, end_milliseconds
+        ) = (int(time_part or 0) for time_part in match.groups())
+        return (
+            ((start_hours * 60 + start_minutes) * 60 + start_seconds) * 1000 + start_milliseconds,
+            ((end_hours * 60 + end_minutes) * 60 + end_seconds) * 1000 + end_milliseconds,
+            ' '.join(block_lines[timing_index + 1:]).replace(VTT_TIMESTAMP_SEPARATOR_ESCAPE, SRT_TIMESTAMP_SEPARATOR),
+        )
+
+    def iter_serialize(self, cues):
+        yield VTT_SIGNATURE + '\n\n'
+
+        for start, end, text in cues:
+            # "-->" would make the cue invalid, while the other markup of the text is kept as is.
+            text = str(text).replace(SRT_TIMESTAMP_SEPARATOR, VTT_TIMESTAMP_SEPARATOR_ESCAPE)
+            yield VTT_CUE_FORMAT % (self._format_time(start), self._format_time(end), text)
+
+    @staticmethod
+    def _format_time(milliseconds):
+        """
+        Returns the WebVTT timestamp of a time in milliseconds.
+        """
+        # Negative times are represented as zero.
+        milliseconds = max(milliseconds, 0)
+        return VTT_TIME_FORMAT % (
+            milliseconds // 3600000,
+            milliseconds % 3600000 // 60000,
+            milliseconds % 60000 // 1000,
+            milliseconds % 1000,
+        )
@@ -13,9 +13,15 @@ urlpatterns = [
         views.VideoDetail.as_view(),
         name='video-detail'
     ),
+    path('videos/bulk/', views.VideoBulkCreateView.as_view(),
+         name='video-bulk-create'
+         ),
     path('videos/status/', views.VideoStatusView.as_view(),
          name='video-status-update'
          ),
+    path('videos/status/bulk/', views.VideoBulkStatusView.as_view(),
+         name='video-bulk-status-update'
+         ),
     path('videos/missing-hls/', views.HLSMissingVideoView.as_view(),
          name='hls-missing-video'
          ),
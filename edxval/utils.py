@@ -1,25 +1,39 @@
 """
 Util methods to be used in api and models.
 """
+import base64
+import binascii
 import hashlib
 import json
+import re
 from contextlib import closing
+from functools import partial
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
 from django.core.files.storage import get_storage_class
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models import Q
+from django.dispatch import receiver
 from fs.path import combine
-from pysrt import SubRipFile
+from pysrt.srtexc import Error
+
+from edxval.exceptions import TranscriptsGenerationException
+from edxval.transcript_utils import Transcript, VttCodec, get_transcript_codec
 
 
 class TranscriptFormat:
     """Tuple representing transcriptformat choices."""
     SRT = 'srt'
     SJSON = 'sjson'
+    VTT = 'vtt'
 
     CHOICES = (
         (SRT, 'SubRip'),
-        (SJSON, 'SRT JSON')
+        (SJSON, 'SRT JSON'),
+        (VTT, 'WebVTT'),
     )
 
 
@@ -138,6 +152,22 @@ THIRD_PARTY_TRANSCRIPTION_PLANS = {
     }
 }
 
+# Bump this whenever the cached video representation changes, so that stale entries are ignored.
+VIDEO_CACHE_VERSION = 1
+
+# Storage instances keyed by the name of their settings, see `_get_storage`.
+_STORAGE_CACHE = {}
+
+# Characters a JSON document can start with, after the JSON whitespace.
+JSON_FIRST_CHARS = frozenset('{["-0123456789tfnNI')
+JSON_WHITESPACE_REGEX = re.compile(r'[ \t\n\r]*')
+# Length of the transcript prefix looked at to pick the parser of its format.
+TRANSCRIPT_SNIFF_SIZE = 1024
+# Start of SRT content, an optional cue index line followed by a timing line.
+SRT_PREFIX_REGEX = re.compile(
+    r'[ \t\r\n]*(?:[0-9]+[ \t]*\r?\n)?[ \t]*[0-9]+[:.,][0-9]+[:.,][0-9]+[:.,][0-9]+[ \t]*-->'
+)
+
 
 def video_image_path(video_image_instance, filename):  # pylint:disable=unused-argument
     """
@@ -154,14 +184,7 @@ def get_video_image_storage():
     """
     Return the configured django storage backend.
     """
-    if hasattr(settings, 'VIDEO_IMAGE_SETTINGS'):
-        return get_storage_class(
-            settings.VIDEO_IMAGE_SETTINGS.get('STORAGE_CLASS'),
-        )(**settings.VIDEO_IMAGE_SETTINGS.get('STORAGE_KWARGS', {}))
-
-    # during edx-platform loading this method gets called but settings are not ready yet
-    # so in that case we will return default(FileSystemStorage) storage class instance
-    return get_storage_class()()
+    return _get_storage('VIDEO_IMAGE_SETTINGS')
 
 
 def video_transcript_path(video_transcript_instance, filename):  # pylint:disable=unused-argument
@@ -179,14 +202,157 @@ def get_video_transcript_storage():
     """
     Return the configured django storage backend for video transcripts.
     """
-    if hasattr(settings, 'VIDEO_TRANSCRIPTS_SETTINGS'):
-        return get_storage_class(
-            settings.VIDEO_TRANSCRIPTS_SETTINGS.get('STORAGE_CLASS'),
-        )(**settings.VIDEO_TRANSCRIPTS_SETTINGS.get('STORAGE_KWARGS', {}))
+    return _get_storage('VIDEO_TRANSCRIPTS_SETTINGS')
+
+
+def _get_storage(settings_name):
+    """
+    Return the storage backend configured by the given settings, reusing the instance until a setting is changed.
+
+    Storage backends may be expensive to build (e.g. an S3 client resolving its credentials),
+    and they are requested for every image and transcript url.
+    """
+    if not hasattr(settings, settings_name):
+        # during edx-platform loading this method gets called but settings are not ready yet
+        # so in that case we will return default(FileSystemStorage) storage class instance
+        return get_storage_class()()
+
+    storage = _STORAGE_CACHE.get(settings_name)
+    if storage is None:
+        storage_settings = getattr(settings, settings_name)
+        storage = get_storage_class(
+            storage_settings.get('STORAGE_CLASS'),
+        )(**storage_settings.get('STORAGE_KWARGS', {}))
+        _STORAGE_CACHE[settings_name] = storage
+
+    return storage
+
+
+@receiver(setting_changed)
+def reset_storage_cache(**kwargs):
+    """
+    Drops the memoized storage instances whenever a setting is changed.
+    """
+    _STORAGE_CACHE.clear()
+
+
+def is_content_addressed_transcript_storage():
+    """
+    Returns whether transcripts are stored under names derived from their content hash.
+    """
+    transcript_settings = getattr(settings, 'VIDEO_TRANSCRIPTS_SETTINGS', {})
+    return transcript_settings.get('CONTENT_ADDRESSED_STORAGE', False)
+
+
+def get_transcript_storage_concurrency():
+    """
+    Returns the maximum number of transcript storage requests to run concurrently.
+    """
+    transcript_settings = getattr(settings, 'VIDEO_TRANSCRIPTS_SETTINGS', {})
+    return max(1, transcript_settings.get('STORAGE_CONCURRENCY', 8))
+
+
+def get_video_cache():
+    """
+    Returns the cache used for video info along with its timeout in seconds, a timeout of 0 disables caching.
+    """
+    video_cache_settings = getattr(settings, 'VIDEO_CACHE_SETTINGS', {})
+    return caches[video_cache_settings.get('CACHE_NAME', 'default')], video_cache_settings.get('TIMEOUT', 300)
+
+
+def get_video_cache_key(edx_video_id):
+    """
+    Returns the cache key of the video info for an edx_video_id.
+    """
+    # edx_video_id can be any external id as well, so hash it to always get a valid cache key.
+    return 'edxval.video_info.v{version}.{video_id_hash}'.format(
+        version=VIDEO_CACHE_VERSION,
+        video_id_hash=hashlib.sha256(str(edx_video_id).encode('utf-8')).hexdigest()
+    )
+
+
+def invalidate_video_cache(edx_video_id):
+    """
+    Removes the cached video info for an edx_video_id once the current transaction is committed.
+
+    Removing it before the commit would let a concurrent read cache the old video info again.
+    """
+    video_cache, __ = get_video_cache()
+    transaction.on_commit(partial(video_cache.delete, get_video_cache_key(edx_video_id)))
+
+
+def encode_cursor(values):
+    """
+    Returns an opaque pagination cursor for the values of the last item of a page.
+    """
+    # isoformat keeps the microseconds of datetimes, unlike DjangoJSONEncoder, which a keyset needs to be exact.
+    cursor_data = json.dumps(values, default=lambda value: value.isoformat())
+    return base64.urlsafe_b64encode(cursor_data.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """
+    Returns the values encoded in a pagination cursor.
+
+    Raises:
+        ValueError if the cursor is not valid.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (binascii.Error, UnicodeError, TypeError, AttributeError) as error:
+        raise ValueError(f'Invalid cursor: {cursor}') from error
 
-    # during edx-platform loading this method gets called but settings are not ready yet
-    # so in that case we will return default(FileSystemStorage) storage class instance
-    return get_storage_class()()
+    if not isinstance(values, list):
+        raise ValueError(f'Invalid cursor: {cursor}')
+
+    return values
+
+
+def get_cursor_page(queryset, ordering, cursor, page_size):
+    """
+    Returns a page of a queryset using keyset pagination instead of counting and offsetting.
+
+    Arguments:
+        queryset (QuerySet): Queryset to paginate
+        ordering (list): Field names giving a total order, all prefixed by '-' for a descending order
+        cursor (str): Cursor of the previous page, or None for the first page
+        page_size (int): Maximum number of items of the page
+
+    Returns:
+        A tuple of (list of items, cursor of the next page or None if it is the last page).
+
+    Raises:
+        ValueError if the cursor is not valid.
+    """
+    field_names = [field.lstrip('-') for field in ordering]
+    queryset = queryset.order_by(*ordering)
+    # Fetch one more item to know if there is a next page without a count query.
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(field_names):
+            raise ValueError(f'Invalid cursor: {cursor}')
+
+        lookup = 'lt' if ordering[0].startswith('-') else 'gt'
+        # Items strictly after the cursor: (a > x) or (a = x and b > y) or ...
+        after_cursor = Q()
+        for index, field_name in enumerate(field_names):
+            after_cursor |= Q(
+                **dict(zip(field_names[:index], values[:index])),
+                **{f'{field_name}__{lookup}': values[index]}
+            )
+        try:
+            # Values of the wrong type for their field may only fail when the query is compiled.
+            items = list(queryset.filter(after_cursor)[:page_size + 1])
+        except (ValidationError, TypeError, ValueError) as error:
+            raise ValueError(f'Invalid cursor: {cursor}') from error
+    else:
+        items = list(queryset[:page_size + 1])
+
+    if len(items) <= page_size:
+        return items, None
+
+    items = items[:page_size]
+    return items, encode_cursor([getattr(items[-1], field_name) for field_name in field_names])
 
 
 def create_file_in_fs(file_data, file_name, file_system, static_dir):
@@ -207,18 +373,39 @@ def get_transcript_format(transcript_content):
     """
     Returns transcript format.
 
+    A bounded prefix of the content picks the parser of its format: the WEBVTT signature, an SRT
+    cue index and timing line, or else JSON. The whole content is then validated by that single
+    parse, and only falls back to SRT when it is not JSON.
+
     Arguments:
         transcript_content (str): Transcript file content.
+
+    Raises:
+        pysrt.srtexc.Error: if the content is not a valid transcript.
     """
+    prefix = transcript_content[:TRANSCRIPT_SNIFF_SIZE]
     try:
-        json.loads(transcript_content)
-    except ValueError:
-        # With error handling (set to 'ERROR_RAISE'), we will be getting
-        # the exception if something went wrong in parsing the transcript.
-
-        srt_subs = SubRipFile.from_string(transcript_content, error_handling=SubRipFile.ERROR_RAISE)
-        if srt_subs:
-            return TranscriptFormat.SRT
+        if VttCodec.is_signature(prefix):
+            get_transcript_codec(TranscriptFormat.VTT).parse(transcript_content)
+            return TranscriptFormat.VTT
+
+        if not SRT_PREFIX_REGEX.match(prefix):
+            first_char_index = JSON_WHITESPACE_REGEX.match(prefix).end()
+            if prefix[first_char_index:first_char_index + 1] in JSON_FIRST_CHARS:
+                try:
+                    json.loads(transcript_content)
+                    return TranscriptFormat.SJSON
+                except ValueError:
+                    # Invalid JSON is reported as invalid SRT, like any other invalid transcript.
+                    pass
+
+        srt_subs = Transcript.parse_srt(transcript_content)
+    except TranscriptsGenerationException as error:
+        # Same error as when the content was parsed with pysrt.
+        raise Error(*error.args) from error
+
+    if srt_subs['start']:
+        return TranscriptFormat.SRT
     return TranscriptFormat.SJSON
 
 
@@ -258,13 +445,30 @@ def generate_file_content_hash(uploaded_file):
         str sha256 hash
     """
     with closing(uploaded_file.open()) as file_data:
-        file_content = file_data.read()
-        if isinstance(file_content, str):
-            file_content = file_content.encode('utf-8')
+        content_hash, __ = get_file_content_hash_and_size(file_data)
+
+    return content_hash
+
+
+def get_file_content_hash_and_size(file_data):
+    """
+    Generates SHA256 Content Hash and byte size for an open File in a single read, leaving it open.
 
-    content_hash = hashlib.sha256(file_content)
+    Arguments:
+        file_data (File): File which will be used for hash generation
 
-    return content_hash.hexdigest()
+    Returns:
+        tuple of (str sha256 hash, int size in bytes)
+    """
+    content_hash = hashlib.sha256()
+    size = 0
+    for chunk in file_data.chunks():
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        content_hash.update(chunk)
+        size += len(chunk)
+
+    return content_hash.hexdigest(), size
 
 
 def is_duplicate_file(uploaded_file_1, uploaded_file_2):
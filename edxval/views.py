@@ -3,18 +3,34 @@ Views file for django app edxval.
 """
 
 
+import json
 import logging
 
 from django.core.exceptions import ValidationError
+from django.db.models import Exists, OuterRef
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from edx_rest_framework_extensions.auth.jwt.authentication import JwtAuthentication
 from rest_framework import generics, status
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.pagination import BasePagination
 from rest_framework.permissions import DjangoModelPermissions
+from rest_framework.renderers import BaseRenderer
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 
-from edxval.api import create_or_update_video_transcript, get_transcript_details_for_course, get_video_ids_for_course
+from edxval.api import (
+    create_or_update_video_transcript,
+    create_videos,
+    get_transcript_details_for_course,
+    get_video_ids_for_course,
+    iter_transcript_details_for_course,
+    update_videos_status,
+)
 from edxval.models import (
     LIST_MAX_ITEMS,
     CourseVideo,
@@ -25,8 +41,8 @@ from edxval.models import (
     VideoImage,
     VideoTranscript,
 )
-from edxval.serializers import VideoSerializer
-from edxval.utils import TranscriptFormat, validate_generated_images
+from edxval.serializers import VideoSerializer, prefetch_video_relations
+from edxval.utils import TranscriptFormat, get_cursor_page, invalidate_video_cache, validate_generated_images
 
 LOGGER = logging.getLogger(__name__)
 
@@ -60,6 +76,86 @@ class ReadRestrictedDjangoModelPermissions(DjangoModelPermissions):
     }
 
 
+class VideoCursorPagination(BasePagination):  # pylint: disable=abstract-method
+    """
+    Keyset pagination of videos ordered by creation time.
+
+    Videos are only paginated when a page size is requested, so that existing
+    clients keep getting all the videos at once.
+    """
+    ordering = ('created', 'edx_video_id')
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    max_page_size = 1000
+
+    def __init__(self):
+        self.request = None
+        self.next_cursor = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns the requested page of videos, or None when no page size is requested.
+        """
+        page_size = request.query_params.get(self.page_size_query_param)
+        if page_size is None:
+            return None
+
+        try:
+            page_size = int(page_size)
+            if page_size <= 0:
+                raise ValueError
+        except ValueError as error:
+            raise ParseError(f'Invalid page size: {page_size}') from error
+
+        self.request = request
+        try:
+            page, self.next_cursor = get_cursor_page(
+                queryset,
+                self.ordering,
+                request.query_params.get(self.cursor_query_param),
+                min(page_size, self.max_page_size),
+            )
+        except ValueError as error:
+            raise NotFound('Invalid cursor') from error
+
+        return page
+
+    def get_paginated_response(self, data):
+        """
+        Returns the page of videos along with the url of the next page.
+        """
+        next_url = None
+        if self.next_cursor:
+            next_url = replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+        return Response({'next': next_url, 'results': data})
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Renderer for newline delimited JSON, one JSON document per line.
+
+    Views stream their items themselves when this renderer is selected, so it is
+    only used to render regular (e.g. error) responses as a single line.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+
+    @staticmethod
+    def render_line(data):
+        """
+        Renders `data` as a single NDJSON line.
+        """
+        return json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return self.render_line(data)
+
+
 class MultipleFieldLookupMixin:
     """
     Apply this mixin to any view or viewset to get multiple field filtering
@@ -83,12 +179,13 @@ class VideoList(generics.ListCreateAPIView):
     """
     authentication_classes = (JwtAuthentication, SessionAuthentication)
     permission_classes = (ReadRestrictedDjangoModelPermissions,)
-    queryset = Video.objects.all().prefetch_related("encoded_videos", "courses")
+    queryset = prefetch_video_relations(Video.objects.all())
     lookup_field = "edx_video_id"
     serializer_class = VideoSerializer
+    pagination_class = VideoCursorPagination
 
     def get_queryset(self):
-        qset = Video.objects.all().prefetch_related("encoded_videos", "courses")
+        qset = prefetch_video_relations(Video.objects.all())
 
         args = self.request.GET
         course_id = args.get('course')
@@ -102,6 +199,36 @@ class VideoList(generics.ListCreateAPIView):
         return qset
 
 
+class VideoBulkCreateView(APIView):
+    """
+    A View to create many video objects at once.
+    """
+    authentication_classes = (JwtAuthentication, SessionAuthentication)
+    permission_classes = (ReadRestrictedDjangoModelPermissions,)
+    queryset = Video.objects.all()
+
+    def post(self, request):
+        """
+        Create the videos of a list of video data, reporting the errors of each video which could not be created.
+        """
+        if not isinstance(request.data, list):
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={'message': 'A list of videos must be specified.'}
+            )
+
+        results = create_videos(request.data)
+        created_count = sum(1 for result in results if result['errors'] is None)
+        if created_count == len(results):
+            response_status = status.HTTP_201_CREATED
+        elif created_count:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        return Response(status=response_status, data=results)
+
+
 class VideoDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     Gets a video instance given its edx_video_id
@@ -178,16 +305,29 @@ class VideoTranscriptView(APIView):
 class CourseTranscriptsDetailView(APIView):
     """
     A view to get the details for all the course transcripts related to a course_id.
+
+    With `?format=ndjson` (or an `application/x-ndjson` Accept header) the response is
+    streamed as one `{edx_video_id: transcript_data}` JSON line per video instead.
     """
     authentication_classes = (JwtAuthentication, SessionAuthentication)
+    renderer_classes = (*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer)
 
-    def get(self, _request, course_id):
+    def get(self, request, course_id):
         """
         Returns all transcript data for a course when given a course_id.
         """
         if not course_id:
             return Response(status=status.HTTP_400_BAD_REQUEST, data={'message': 'course_id param required'})
 
+        if request.accepted_renderer.format == NDJSONRenderer.format:
+            return StreamingHttpResponse(
+                (
+                    NDJSONRenderer.render_line({edx_video_id: transcript_data})
+                    for edx_video_id, transcript_data in iter_transcript_details_for_course(course_id)
+                ),
+                content_type=NDJSONRenderer.media_type,
+            )
+
         course_data = get_transcript_details_for_course(course_id)
         return Response(status=status.HTTP_200_OK, data=course_data)
 
@@ -255,6 +395,66 @@ class VideoStatusView(APIView):
         return Response(status=response_status, data=response_payload)
 
 
+class VideoBulkStatusView(APIView):
+    """
+    A Video View to update the status of many videos at once.
+
+    Note:
+        The valid statuses are the same as for `VideoStatusView`.
+    """
+    authentication_classes = (JwtAuthentication, SessionAuthentication)
+
+    def patch(self, request):
+        """
+        Update the status of a list of videos, reporting the errors of each video which could not be updated.
+        """
+        if not isinstance(request.data, list):
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={'message': 'A list of video statuses must be specified.'}
+            )
+
+        results = []
+        status_updates = []
+        for status_update in request.data:
+            if not isinstance(status_update, dict):
+                status_update = {}
+
+            missing = [attr for attr in ('edx_video_id', 'status') if attr not in status_update]
+            invalid = [
+                attr for attr in ('edx_video_id', 'status', 'error_description')
+                if status_update.get(attr) is not None and not isinstance(status_update[attr], str)
+            ]
+            if missing:
+                error = '"{missing}" params must be specified.'.format(missing=' and '.join(missing))
+            elif invalid:
+                error = '"{invalid}" params must be strings.'.format(invalid=' and '.join(invalid))
+            elif status_update['status'] not in VALID_VIDEO_STATUSES:
+                error = '"{video_status}" is not a valid Video status.'.format(video_status=status_update['status'])
+            else:
+                error = None
+                status_updates.append(status_update)
+
+            results.append({'edx_video_id': status_update.get('edx_video_id'), 'errors': error})
+
+        not_found_edx_video_ids = set(update_videos_status(status_updates))
+        for result in results:
+            if result['errors'] is None and result['edx_video_id'] in not_found_edx_video_ids:
+                result['errors'] = 'Video is not found for specified edx_video_id: {edx_video_id}'.format(
+                    edx_video_id=result['edx_video_id']
+                )
+
+        updated_count = sum(1 for result in results if result['errors'] is None)
+        if updated_count == len(results):
+            response_status = status.HTTP_200_OK
+        elif updated_count:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        return Response(status=response_status, data=results)
+
+
 class VideoImagesView(APIView):
     """
     View to update course video images.
@@ -312,16 +512,32 @@ class VideoImagesView(APIView):
 
 class HLSMissingVideoView(APIView):
     """
-    A View to list video ids which are missing HLS encodes and update an encode profile for a video.
+    A View to list video ids which are missing HLS (or other profile) encodes and update an encode profile for a video.
     """
     authentication_classes = (JwtAuthentication, SessionAuthentication)
 
     def post(self, request):
         """
-        Retrieve video IDs that are missing HLS profiles. This endpoint supports 2 types of input data:
+        Retrieve video IDs that are missing HLS profiles, or the profile given as `profile` in the request data.
+        This endpoint supports 3 types of input data:
 
         1. If we want a batch of video ids which are missing HLS profile irrespective of their courses, the request
-           data should be in following format:
+           data should be in following format, with a `cursor` of None for the first batch:
+                {
+                    'batch_size': 50,
+                    'cursor': 'WzEyM10=',
+                    'include_total': false
+                }
+           And response will be in following format, where `cursor` is None for the last batch, and `total`
+           is only counted if `include_total` is true:
+                {
+                    'videos': ['video_id1', 'video_id2', 'video_id3', ... , video_id50],
+                    'cursor': 'WzE3M10=',
+                    'batch_size': 50
+                }
+
+        2. The same batches can also be requested with an offset instead of a cursor, in which case each request
+           has to skip the previous batches and count the total:
                 {
                     'batch_size': 50,
                     'offset': 0
@@ -334,7 +550,7 @@ class HLSMissingVideoView(APIView):
                     'batch_size': 50
                 }
 
-        2. If we want all the videos which are missing HLS profiles in a set of specific courses, the request data
+        3. If we want all the videos which are missing HLS profiles in a set of specific courses, the request data
            should be in following format:
                 {
                     'courses': [
@@ -351,26 +567,41 @@ class HLSMissingVideoView(APIView):
         courses = request.data.get('courses')
         batch_size = request.data.get('batch_size', 50)
         offset = request.data.get('offset', 0)
+        videos = (Video.missing_profile(request.data.get('profile', 'hls'))
+                  .filter(status='file_complete')
+                  .order_by('id'))
         if courses:
-            videos = (CourseVideo.objects.select_related('video')
-                      .prefetch_related('video__encoded_videos', 'video__encoded_videos__profile')
-                      .filter(course_id__in=courses, video__status='file_complete')
-                      .exclude(video__encoded_videos__profile__profile_name='hls')
-                      .values_list('video__edx_video_id', flat=True)
-                      .distinct())
-
-            response = Response({'videos': videos}, status=status.HTTP_200_OK)
-        else:
-            videos = (Video.objects.prefetch_related('encoded_videos', 'encoded_videos__profile')
-                      .filter(status='file_complete')
-                      .exclude(encoded_videos__profile__profile_name='hls')
-                      .order_by('id')
-                      .values_list('edx_video_id', flat=True)
-                      .distinct())
+            videos = videos.filter(
+                Exists(CourseVideo.objects.filter(video=OuterRef('pk'), course_id__in=courses))
+            )
+            response = Response(
+                {'videos': list(videos.values_list('edx_video_id', flat=True))},
+                status=status.HTTP_200_OK
+            )
+        elif 'cursor' in request.data:
+            try:
+                page, next_cursor = get_cursor_page(
+                    videos.only('id', 'edx_video_id'), ['id'], request.data['cursor'], batch_size
+                )
+            except ValueError:
+                return Response(
+                    status=status.HTTP_400_BAD_REQUEST,
+                    data={'message': 'Invalid cursor: {cursor}'.format(cursor=request.data['cursor'])}
+                )
 
+            response_payload = {
+                'videos': [video.edx_video_id for video in page],
+                'cursor': next_cursor,
+                'batch_size': batch_size,
+            }
+            if request.data.get('include_total'):
+                response_payload['total'] = videos.count()
+
+            response = Response(response_payload, status=status.HTTP_200_OK)
+        else:
             response = Response(
                 {
-                    'videos': videos[offset: offset + batch_size],
+                    'videos': list(videos.values_list('edx_video_id', flat=True)[offset: offset + batch_size]),
                     'total': videos.count(),
                     'offset': offset,
                     'batch_size': batch_size,
@@ -402,11 +633,12 @@ class HLSMissingVideoView(APIView):
         encode_data = request.data['encode_data']
 
         video = Video.objects.get(edx_video_id=edx_video_id)
-        profile = Profile.objects.get(profile_name=profile)
+        profile = Profile.get_by_name(profile)
 
         # Delete existing similar profile if its present and
         # create new one with updated data.
         EncodedVideo.objects.filter(video=video, profile=profile).delete()
         EncodedVideo.objects.create(video=video, profile=profile, **encode_data)
+        invalidate_video_cache(video.edx_video_id)
 
         return Response(status=status.HTTP_200_OK)
@@ -10,6 +10,8 @@ from setuptools import setup
 PACKAGES = [
     'edxval',
     'edxval.config',
+    'edxval.management',
+    'edxval.management.commands',
     'edxval.migrations',
     'edxval.tests',
 ]